@@ -0,0 +1,241 @@
+# benchmarks/amostras.py
+"""
+Geração determinística de amostras para os benchmarks.
+
+As páginas HTML reproduzem a marcação da busca pública do LinkedIn
+(seletores confirmados em scrapers/linkedin_scraper.py) com o mesmo peso
+típico de uma página real: <head> com CSS/JSON embutidos + 25 cards.
+As amostras salvas em benchmarks/dados/linkedin/ foram geradas por
+`python -m benchmarks.amostras` e ficam versionadas para que "antes" e
+"depois" sejam medidos sobre exatamente os mesmos bytes.
+"""
+import json
+import random
+from pathlib import Path
+
+from scrapers.base_scraper import ESTADOS_SIGLAS
+
+DIRETORIO_LINKEDIN = Path(__file__).parent / 'dados' / 'linkedin'
+RAIZ_REPO = Path(__file__).parent.parent
+
+_TITULOS = [
+    'Desenvolvedor Python Sênior', 'Pessoa Desenvolvedora Front-end Pleno', 'Engenheiro(a) de Dados',
+    'Analista de Sistemas Júnior', 'Estágio em Desenvolvimento de Software', 'Tech Lead .NET',
+    'Desenvolvedor Full Stack (React + Node.js)', 'Arquiteto de Soluções Cloud', 'QA Automação — Cypress',
+    'Advogado Trabalhista Pleno', 'Advogado(a) Júnior — Contencioso Cível', 'Assistente Jurídico',
+]
+_EMPRESAS = [
+    'Itaú Unibanco', 'Nubank', 'Stone', 'iFood', 'Mercado Livre', 'CI&T', 'Zup Innovation',
+    'Gestão & Tecnologia Ltda', 'Sanofi', 'Pinheiro Neto Advogados', 'Mattos Filho', 'TOTVS',
+]
+_LOCAIS = [
+    'São Paulo, São Paulo, Brasil', 'Rio de Janeiro, Rio de Janeiro, Brasil', 'Curitiba, Paraná, Brasil',
+    'Belo Horizonte, Minas Gerais, Brasil', 'Florianópolis, SC', 'Brasil', 'Recife, Brasil',
+    'Porto Alegre, Rio Grande do Sul, Brasil', 'Goiânia, Goiás, Brasil',
+]
+
+_CABECALHO = '''<!DOCTYPE html>
+<html lang="pt">
+<head>
+<meta charset="utf-8">
+<title>{total} vagas de {palavra} em Brasil | LinkedIn</title>
+<style>{css}</style>
+<code id="i18n_jobs_search" style="display: none"><!--{json}--></code>
+</head>
+<body class="overflow-hidden">
+<main class="main" id="main-content" role="main">
+<section class="two-pane-serp-page__results-list">
+<ul class="jobs-search__results-list">
+'''
+
+_CARD = '''<li>
+  <div class="base-card relative w-full hover:no-underline focus:no-underline base-card--link base-search-card base-search-card--link job-search-card{extra_card}" data-entity-urn="urn:li:jobPosting:{job_id}" data-impression-id="jobs-search-result-{indice}" data-reference-id="{ref}" data-tracking-id="{track}" data-column="1" data-row="{linha}">
+    <a class="base-card__full-link absolute top-0 right-0 bottom-0 left-0 p-0 z-[2]" href="https://br.linkedin.com/jobs/view/{slug}-{job_id}?position={posicao}&amp;pageNum=0&amp;refId={ref}&amp;trackingId={track}" data-tracking-control-name="public_jobs_jserp-result_search-card" data-tracking-client-ingraph data-tracking-will-navigate>
+      <span class="sr-only">
+          {titulo}
+      </span>
+    </a>
+    <div class="search-entity-media">
+      <img class="artdeco-entity-image artdeco-entity-image--square-4" data-delayed-url="https://media.licdn.com/dms/image/v2/{track}/company-logo_100_100/0/{job_id}?e=2147483647&amp;v=beta&amp;t={ref}" data-ghost-classes="artdeco-entity-image--ghost" data-ghost-url="https://static.licdn.com/aero-v1/sc/h/6puxblwmhnodu6fjircz4dn4h" alt="{empresa}">
+    </div>
+    <div class="base-search-card__info">
+      <h3 class="base-search-card__title">
+            {titulo}
+      </h3>
+      <h4 class="base-search-card__subtitle">
+        {empresa_html}
+      </h4>
+      <div class="base-search-card__metadata">
+        <span class="job-search-card__location">
+            {local}
+        </span>
+        <div class="job-posting-benefits text-sm">
+          <icon class="job-posting-benefits__icon" data-delayed-url="https://static.licdn.com/aero-v1/sc/h/8zmuwb93gxhpogv9ye5ez9rax" data-svg-class-name="job-posting-benefits__icon-svg"></icon>
+          <span class="job-posting-benefits__text">
+            Candidatura simplificada
+          </span>
+        </div>
+        <time class="job-search-card__listdate{extra_data}" datetime="{data}">
+            há {dias} dias
+        </time>
+      </div>
+    </div>
+  </div>
+</li>
+'''
+
+_RODAPE = '''</ul>
+</section>
+</main>
+<script type="application/ld+json">{json}</script>
+</body>
+</html>
+'''
+
+
+def _hex(rng: random.Random, n: int) -> str:
+    return ''.join(rng.choice('0123456789abcdef') for _ in range(n))
+
+
+def gerar_pagina_linkedin(semente: int, palavra: str = 'Desenvolvedor', cards: int = 25) -> bytes:
+    """Página de busca sintética (UTF-8) com `cards` vagas."""
+    rng = random.Random(semente)
+    css = ' '.join(
+        f'.c{_hex(rng, 6)}{{margin:{rng.randint(0, 24)}px;color:#{_hex(rng, 6)}}}' for _ in range(900)
+    )
+    blob_json = '{' + ','.join(f'"k{i}":"{_hex(rng, 40)}"' for i in range(700)) + '}'
+
+    partes = [_CABECALHO.format(total=rng.randint(500, 9000), palavra=palavra, css=css, json=blob_json)]
+    for indice in range(cards):
+        titulo = rng.choice(_TITULOS)
+        empresa = rng.choice(_EMPRESAS)
+        empresa_html = (
+            f'<a class="hidden-nested-link" data-tracking-control-name="public_jobs_jserp-result_job-search-card-subtitle" '
+            f'data-tracking-will-navigate href="https://br.linkedin.com/company/{_hex(rng, 8)}?trk=public_jobs_jserp-result_job-search-card-subtitle">\n'
+            f'          {empresa.replace("&", "&amp;")}\n        </a>'
+            if rng.random() > 0.05 else empresa.replace('&', '&amp;')  # ~5% sem link de empresa
+        )
+        partes.append(_CARD.format(
+            extra_card=' job-search-card--active' if rng.random() < 0.1 else '',
+            job_id=rng.randint(3_800_000_000, 3_999_999_999),
+            indice=indice, linha=indice + 1, posicao=indice + 1,
+            ref=_hex(rng, 22), track=_hex(rng, 22),
+            slug=titulo.lower().replace(' ', '-'),
+            titulo=titulo, empresa=empresa.replace('&', '&amp;'), empresa_html=empresa_html,
+            local=rng.choice(_LOCAIS),
+            extra_data=' job-search-card__listdate--new' if rng.random() < 0.2 else '',
+            data=f'2026-04-{rng.randint(1, 28):02d}', dias=rng.randint(1, 30),
+        ))
+    partes.append(_RODAPE.format(json=blob_json))
+    return ''.join(partes).encode('utf-8')
+
+
+def _vocabulario_dumps() -> tuple[list, list]:
+    """Títulos e empresas reais dos dumps db_dev.json / db_adv.json."""
+    titulos, empresas = list(_TITULOS), list(_EMPRESAS)
+    for nome in ('db_dev.json', 'db_adv.json'):
+        caminho = RAIZ_REPO / nome
+        if caminho.exists():
+            for vaga in json.loads(caminho.read_text(encoding='utf-8')).get('vagas', []):
+                titulos.append(vaga['titulo'])
+                empresas.append(vaga['empresa'])
+    return titulos, empresas
+
+
+def corromper(texto: str) -> str:
+    """Double-encoding clássico: bytes UTF-8 lidos como Latin-1."""
+    return texto.encode('utf-8').decode('latin-1')
+
+
+def gerar_registros_brutos(quantidade: int, semente: int = 42, taxa_mojibake: float = 0.03) -> list[dict]:
+    """
+    Registros no formato dos argumentos de padronizar_vaga, com vocabulário
+    dos dumps reais e ~`taxa_mojibake` dos textos acentuados corrompidos.
+    """
+    rng = random.Random(semente)
+    titulos, empresas = _vocabulario_dumps()
+    estados = list(ESTADOS_SIGLAS)
+    niveis = ['', ' Júnior', ' Pleno', ' Sênior', ' — Híbrido', ' (Estágio)']
+
+    def talvez_corromper(texto: str) -> str:
+        return corromper(texto) if not texto.isascii() and rng.random() < taxa_mojibake else texto
+
+    registros = []
+    for indice in range(quantidade):
+        link = f"https://empresa{indice % 997}.gupy.io/job/{rng.getrandbits(64):016x}?jobBoardSource=gupy_portal"
+        local = rng.choice(_LOCAIS).split(', ')
+        registros.append({
+            'titulo': talvez_corromper(rng.choice(titulos) + rng.choice(niveis)),
+            'empresa': talvez_corromper(rng.choice(empresas)),
+            'modalidade': rng.choice(['Remoto', 'Híbrido', 'Presencial']),
+            'link': link,
+            'data_pub': f"2026-0{rng.randint(1, 9)}-{rng.randint(1, 28):02d}T12:00:00.000Z",
+            'city': talvez_corromper(local[0]),
+            'state': talvez_corromper(rng.choice(estados)),
+            'country': rng.choice(['Brasil', 'Brasil', None]),
+            'workplace_type': rng.choice(['remote', 'hybrid', 'on-site']),
+            'is_remote': rng.random() < 0.4,
+            'tipo_contrato': rng.choice(['CLT', 'PJ', 'Estágio', 'Temporário', 'Não informado']),
+            'prazo_inscricao': rng.choice([None, '2026-12-31']),
+            'pcd': rng.random() < 0.1,
+        })
+    return registros
+
+
+_TIPOS_GUPY = {
+    'CLT': 'vacancy_type_effective', 'PJ': 'vacancy_legal_entity', 'Estágio': 'vacancy_type_internship',
+    'Temporário': 'vacancy_type_temporary', 'Não informado': None,
+}
+
+
+def gerar_itens_gupy(quantidade: int, semente: int = 42, taxa_mojibake: float = 0.03) -> list[dict]:
+    """Itens no formato do campo `data` da API da Gupy (mesmo vocabulário de gerar_registros_brutos)."""
+    itens = []
+    for registro in gerar_registros_brutos(quantidade, semente, taxa_mojibake):
+        itens.append({
+            'jobUrl': registro['link'],
+            'name': registro['titulo'],
+            'careerPageName': registro['empresa'],
+            'workplaceType': registro['workplace_type'],
+            'publishedDate': registro['data_pub'],
+            'city': registro['city'],
+            'state': registro['state'],
+            'country': registro['country'],
+            'isRemoteWork': registro['is_remote'],
+            'type': _TIPOS_GUPY[registro['tipo_contrato']],
+            'applicationDeadline': registro['prazo_inscricao'],
+            'disabilities': registro['pcd'],
+        })
+    return itens
+
+
+def carregar_fixtures(diretorio: str) -> tuple[list[dict], list[bytes]]:
+    """
+    Itens da API Gupy e páginas de busca do LinkedIn de um diretório gravado
+    com SCRAPER_GRAVAR_DIR (scrapers/replay.py). Só respostas 200.
+    """
+    from scrapers.replay import AcervoFixtures
+
+    itens_gupy, paginas_linkedin = [], []
+    for entrada in AcervoFixtures(diretorio).entradas():
+        if entrada.status != 200:
+            continue
+        if 'gupy.io' in entrada.url:
+            dados = json.loads(entrada.corpo)
+            itens_gupy.extend(dados.get('data', []) if isinstance(dados, dict) else dados)
+        elif 'linkedin.com/jobs/search' in entrada.url:
+            paginas_linkedin.append(entrada.corpo)
+    return itens_gupy, paginas_linkedin
+
+
+def carregar_paginas_linkedin() -> list[tuple[str, bytes]]:
+    """(nome, bytes) das amostras versionadas."""
+    return [(caminho.name, caminho.read_bytes()) for caminho in sorted(DIRETORIO_LINKEDIN.glob('*.html'))]
+
+
+if __name__ == '__main__':
+    DIRETORIO_LINKEDIN.mkdir(parents=True, exist_ok=True)
+    for semente, palavra in [(1, 'Desenvolvedor'), (2, 'Advogado'), (3, 'Python')]:
+        caminho = DIRETORIO_LINKEDIN / f'busca_{palavra.lower()}.html'
+        caminho.write_bytes(gerar_pagina_linkedin(semente, palavra))
+        print(f'{caminho} ({caminho.stat().st_size / 1024:.0f} KB)')
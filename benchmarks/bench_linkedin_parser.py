@@ -0,0 +1,148 @@
+# benchmarks/bench_linkedin_parser.py
+"""
+Micro-benchmark do parsing de páginas de busca do LinkedIn — antes × depois.
+
+"Antes" é a implementação anterior, reproduzida aqui literalmente:
+_detectar_bloqueio decodificava a página inteira + cópia lowercased,
+_extrair_cards decodificava de novo e _parse_card fazia 6 consultas
+XPath por card. "Depois" é o caminho atual do LinkedinScraper (bytes +
+regex na detecção, um decode, XPath pré-compilado, uma travessia por card).
+
+Para cada amostra em benchmarks/dados/linkedin/ mede detecção + extração
+dos dados brutos (tempo mediano por página e pico de memória via
+tracemalloc) e confere que os dois caminhos produzem exatamente os mesmos
+dicts.
+
+Uso:
+    python -m benchmarks.bench_linkedin_parser [--repeticoes 50]
+"""
+import argparse
+import statistics
+import time
+import tracemalloc
+
+from lxml import html as lxml_html
+
+from benchmarks.amostras import carregar_paginas_linkedin
+from scrapers.linkedin_scraper import (
+    LinkedinScraper, _BLOQUEIO_SIGNALS, _TAMANHO_MINIMO_RESPONSE,
+)
+
+
+class _Resposta:
+    def __init__(self, content: bytes):
+        self.content = content
+
+
+# ---------------------------------------------------------------------------
+# Implementação anterior (referência)
+# ---------------------------------------------------------------------------
+
+def _detectar_bloqueio_anterior(content: bytes) -> str | None:
+    content_text = content.decode('utf-8', errors='ignore').lower()
+    content_size = len(content)
+    for sinal in _BLOQUEIO_SIGNALS:
+        if sinal in content_text:
+            if 'job-search-card' in content_text:
+                continue
+            return f"authwall/captcha detectado (sinal: '{sinal}')"
+    if content_size < _TAMANHO_MINIMO_RESPONSE:
+        if 'no-results' in content_text or 'jobs-search' in content_text:
+            return None
+        return f"response muito pequeno ({content_size} bytes, mínimo: {_TAMANHO_MINIMO_RESPONSE})"
+    if content_size > 50_000 and 'job-search-card' not in content_text:
+        return "response grande mas sem cards de vaga (possível redirect para login)"
+    return None
+
+
+def _parse_card_anterior(card) -> dict | None:
+    links = card.xpath('.//a[contains(@class, "base-card__full-link")]/@href')
+    if not links:
+        return None
+    link = links[0].split('?')[0].strip()
+    if not link:
+        return None
+    titulos = card.xpath('.//h3[contains(@class, "base-search-card__title")]/text()')
+    empresas = card.xpath('.//h4[contains(@class, "base-search-card__subtitle")]//a/text()')
+    locais = card.xpath('.//span[contains(@class, "job-search-card__location")]/text()')
+    datas = card.xpath('.//time[contains(@class, "job-search-card__listdate")]/@datetime')
+    if not datas:
+        datas = card.xpath('.//time[contains(@class, "job-search-card__listdate--new")]/@datetime')
+    return {
+        'link': link,
+        'titulo': titulos[0].strip() if titulos else None,
+        'empresa': empresas[0].strip() if empresas else None,
+        'localizacao': locais[0].strip() if locais else None,
+        'data_publicacao': datas[0].strip() if datas else None,
+    }
+
+
+def processar_anterior(content: bytes) -> list:
+    _detectar_bloqueio_anterior(content)
+    tree = lxml_html.fromstring(content.decode('utf-8'))
+    cards = tree.xpath('//div[contains(@class, "base-card") and contains(@class, "job-search-card")]')
+    return [vaga for vaga in (_parse_card_anterior(card) for card in cards) if vaga]
+
+
+def processar_atual(scraper: LinkedinScraper, content: bytes) -> list:
+    scraper._detectar_bloqueio(_Resposta(content))
+    return scraper._extrair_vagas_brutas(content)
+
+
+# ---------------------------------------------------------------------------
+# Medição
+# ---------------------------------------------------------------------------
+
+def medir(funcao, content: bytes, repeticoes: int) -> dict:
+    """Tempo mediano (ms) e pico de memória (KB) de uma página."""
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao(content)
+        tempos.append(time.perf_counter() - inicio)
+
+    tracemalloc.start()
+    funcao(content)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {'ms': statistics.median(tempos) * 1000, 'pico_kb': pico / 1024}
+
+
+def executar(repeticoes: int) -> list[dict]:
+    scraper = LinkedinScraper()
+    resultados = []
+
+    for nome, content in carregar_paginas_linkedin():
+        anterior = processar_anterior(content)
+        atual = processar_atual(scraper, content)
+        if anterior != atual:
+            raise AssertionError(f"{nome}: saída do parser atual difere da implementação anterior")
+
+        antes = medir(processar_anterior, content, repeticoes)
+        depois = medir(lambda c: processar_atual(scraper, c), content, repeticoes)
+        resultados.append({
+            'pagina': nome, 'kb': len(content) / 1024, 'cards': len(atual),
+            'antes': antes, 'depois': depois,
+        })
+
+    scraper.fechar()
+    return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeticoes', type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'página':<26}{'KB':>6}{'cards':>7} | {'antes ms':>9}{'depois ms':>10}{'ganho':>7} | {'antes KB':>9}{'depois KB':>10}")
+    for r in executar(args.repeticoes):
+        print(
+            f"{r['pagina']:<26}{r['kb']:>6.0f}{r['cards']:>7} | "
+            f"{r['antes']['ms']:>9.2f}{r['depois']['ms']:>10.2f}{r['antes']['ms'] / r['depois']['ms']:>6.1f}x | "
+            f"{r['antes']['pico_kb']:>9.0f}{r['depois']['pico_kb']:>10.0f}"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+# benchmarks/bench_mojibake.py
+"""
+Benchmark + verificação de equivalência do conserto de mojibake.
+
+Compara a implementação anterior (19 buscas de substring por chamada,
+repetidas após o conserto) com a atual (fast path ASCII + uma alternação
+compilada) sobre um corpus realista gerado a partir de db_dev.json /
+db_adv.json (benchmarks.amostras.gerar_registros_brutos).
+
+Antes de medir, verifica que consertar_mojibake produz EXATAMENTE a mesma
+saída que a versão anterior:
+- em todos os textos do corpus;
+- em strings aleatórias montadas com um alfabeto enviesado para os bytes
+  que formam os padrões (Ã, â, €, ¡, ©, ™...), para exercitar as bordas.
+As mesmas propriedades rodam no pytest (tests/unit/test_mojibake.py).
+
+Uso:
+    python -m benchmarks.bench_mojibake [--registros 20000] [--aleatorias 200000]
+"""
+import argparse
+import copy
+import random
+import time
+
+from benchmarks.amostras import corromper, gerar_registros_brutos
+from scrapers.base_scraper import _PADROES_MOJIBAKE, consertar_mojibake
+
+
+# ---------------------------------------------------------------------------
+# Implementação anterior (referência)
+# ---------------------------------------------------------------------------
+
+def _parece_mojibake_anterior(texto: str) -> bool:
+    if not texto or len(texto) < 2:
+        return False
+    return any(padrao in texto for padrao in _PADROES_MOJIBAKE)
+
+
+def consertar_mojibake_anterior(texto):
+    if not isinstance(texto, str):
+        return texto
+    if not _parece_mojibake_anterior(texto):
+        return texto
+    try:
+        consertado = texto.encode('latin-1').decode('utf-8')
+        if not _parece_mojibake_anterior(consertado):
+            return consertado
+        return texto
+    except (UnicodeEncodeError, UnicodeDecodeError):
+        return texto
+
+
+# ---------------------------------------------------------------------------
+# Verificação de equivalência (propriedades)
+# ---------------------------------------------------------------------------
+
+_ALFABETO = list('abcdeçãéíóú ASCII-09') + list('Ã¡©­³º ª´¢§£µ‰“‚â€"™œ') + ['Ã', 'â€', '\x00', '🧡']
+
+
+def _strings_aleatorias(quantidade: int, semente: int) -> list:
+    rng = random.Random(semente)
+    textos = []
+    for _ in range(quantidade):
+        texto = ''.join(rng.choice(_ALFABETO) for _ in range(rng.randint(0, 12)))
+        if rng.random() < 0.3:
+            texto = corromper(texto)
+        textos.append(texto)
+    return textos
+
+
+def verificar(registros: list, aleatorias: int):
+    textos = [v for r in registros for v in r.values()] + _strings_aleatorias(aleatorias, semente=7)
+    for texto in textos:
+        esperado, obtido = consertar_mojibake_anterior(texto), consertar_mojibake(texto)
+        if esperado != obtido:
+            raise AssertionError(f"divergência em {texto!r}: anterior={esperado!r} atual={obtido!r}")
+
+    print(f"Equivalência OK: {len(textos)} textos idênticos à versão anterior")
+
+
+# ---------------------------------------------------------------------------
+# Medição
+# ---------------------------------------------------------------------------
+
+def _cronometrar(funcao, preparar, repeticoes: int = 5) -> float:
+    """Melhor tempo de `funcao(preparar())`, sem contar a preparação."""
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        dados = preparar()
+        inicio = time.perf_counter()
+        funcao(dados)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def _campo_a_campo(funcao):
+    """Aplica `funcao` em cada campo string de cada página, in-place."""
+    def aplicar(paginas):
+        for pagina in paginas:
+            for registro in pagina:
+                for campo, valor in registro.items():
+                    if isinstance(valor, str):
+                        registro[campo] = funcao(valor)
+    return aplicar
+
+
+def medir(registros: list) -> dict:
+    """ns por campo string, sempre sobre páginas de 25 registros (cópias novas a cada rodada)."""
+    paginas = [registros[i:i + 25] for i in range(0, len(registros), 25)]
+    campos = sum(isinstance(v, str) for r in registros for v in r.values())
+
+    def por_campo(aplicar) -> float:
+        return _cronometrar(aplicar, lambda: copy.deepcopy(paginas)) / campos * 1e9
+
+    return {
+        'campos': campos,
+        'anterior_ns_por_campo': por_campo(_campo_a_campo(consertar_mojibake_anterior)),
+        'atual_ns_por_campo': por_campo(_campo_a_campo(consertar_mojibake)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--registros', type=int, default=20_000)
+    parser.add_argument('--aleatorias', type=int, default=200_000)
+    args = parser.parse_args()
+
+    registros = gerar_registros_brutos(args.registros)
+    verificar(registros, args.aleatorias)
+
+    r = medir(registros)
+    print(f"{r['campos']} campos")
+    print(f"  anterior (por campo):  {r['anterior_ns_por_campo']:8.0f} ns")
+    print(f"  atual (por campo):     {r['atual_ns_por_campo']:8.0f} ns  "
+          f"({r['anterior_ns_por_campo'] / r['atual_ns_por_campo']:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
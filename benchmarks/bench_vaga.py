@@ -0,0 +1,164 @@
+# benchmarks/bench_vaga.py
+"""
+Micro-benchmark do registro de vaga — dict de 15 chaves × Vaga (__slots__).
+
+"Antes" é o padronizar_vaga anterior, reproduzido aqui literalmente (um
+dict por vaga). "Depois" é o BaseScraper.padronizar_vaga atual, que
+devolve scrapers.vaga.Vaga com campos de baixa cardinalidade internados.
+
+Os registros brutos passam por um round-trip JSON antes de cada medição
+para que cada vaga tenha strings próprias — como acontece com o
+response.json() da Gupy e o parsing do LinkedIn — em vez de compartilhar
+os literais do gerador de amostras.
+
+Mede:
+- memória retida por 10k vagas (tracemalloc, lista completa em memória);
+- serialização: linha JSON por vaga (diário) e payload {id: vaga}
+  (publicação Firebase), em vagas/s;
+e confere que os dois caminhos produzem exatamente o mesmo JSON.
+
+O payload "depois" inclui montar o dict de cada Vaga (o SDK exige dict),
+que "antes" já vinha pronto: espere ~0,8x nessa linha (ver scrapers/vaga.py).
+
+Uso:
+    python -m benchmarks.bench_vaga [--quantidade 10000] [--repeticoes 5]
+"""
+import argparse
+import json
+import statistics
+import time
+import tracemalloc
+
+from benchmarks.amostras import gerar_registros_brutos
+from scrapers.base_scraper import BaseScraper, consertar_mojibake
+from scrapers.vaga import vaga_para_json
+
+
+class _Scraper(BaseScraper):
+    def buscar_vagas(self, palavra_chave, modalidade, limite):
+        return []
+
+
+# ---------------------------------------------------------------------------
+# Implementação anterior (referência)
+# ---------------------------------------------------------------------------
+
+def _padronizar_anterior(scraper: BaseScraper, id_vaga, titulo, empresa, modalidade, link, data_pub,
+                         city=None, state=None, country=None, workplace_type=None, is_remote=None,
+                         tipo_contrato=None, prazo_inscricao=None, pcd=None) -> dict:
+    return {
+        "id": id_vaga,
+        "titulo": consertar_mojibake(titulo),
+        "empresa": consertar_mojibake(empresa),
+        "modalidade": consertar_mojibake(modalidade),
+        "link": link,
+        "data_publicacao": data_pub,
+        "origem": scraper.nome_plataforma,
+        "city": scraper._normalizar_campo(city),
+        "state": scraper._normalizar_estado(state),
+        "country": scraper._normalizar_campo(country, default='Brasil'),
+        "workplace_type": scraper._normalizar_campo(workplace_type),
+        "is_remote": scraper._normalizar_campo(is_remote, default=False),
+        "tipo_contrato": scraper._normalizar_campo(tipo_contrato),
+        "prazo_inscricao": scraper._normalizar_campo(prazo_inscricao),
+        "pcd": scraper._normalizar_campo(pcd, default=False),
+    }
+
+
+def _dumps(objeto) -> str:
+    return json.dumps(objeto, ensure_ascii=False, separators=(',', ':'))
+
+
+# ---------------------------------------------------------------------------
+# Medição
+# ---------------------------------------------------------------------------
+
+def _registros_frescos(brutos: list[dict]) -> list[dict]:
+    """Cópia com strings próprias por registro (simula o JSON da API)."""
+    return json.loads(json.dumps(brutos))
+
+
+def _construir(scraper: BaseScraper, brutos: list[dict], anterior: bool) -> list:
+    padronizar = (lambda **kw: _padronizar_anterior(scraper, **kw)) if anterior else scraper.padronizar_vaga
+    return [
+        padronizar(id_vaga=scraper.gerar_id_deterministico(bruto['link']), **bruto)
+        for bruto in brutos
+    ]
+
+
+def memoria_retida(scraper: BaseScraper, brutos: list[dict], anterior: bool) -> int:
+    """Bytes alocados que continuam vivos depois de montar a lista de vagas."""
+    registros = _registros_frescos(brutos)
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    vagas = _construir(scraper, registros, anterior)
+    del registros
+    atual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del vagas
+    return atual - base
+
+
+def _cronometrar(funcao, repeticoes: int) -> float:
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return statistics.median(tempos)
+
+
+def executar(quantidade: int, repeticoes: int) -> dict:
+    scraper = _Scraper('bench')
+    brutos = gerar_registros_brutos(quantidade)
+
+    antes = _construir(scraper, _registros_frescos(brutos), anterior=True)
+    depois = _construir(scraper, _registros_frescos(brutos), anterior=False)
+    for vaga_antes, vaga_depois in zip(antes, depois):
+        if _dumps(vaga_antes) != vaga_para_json(vaga_depois) or vaga_depois != vaga_antes:
+            raise AssertionError(f"Vaga {vaga_antes['id']}: serialização difere da implementação anterior")
+
+    linhas_antes = lambda: [_dumps({'v': v}) for v in antes]
+    linhas_depois = lambda: ['{"v":' + v.para_json() + '}' for v in depois]
+    payload_antes = lambda: _dumps({v['id']: v for v in antes})
+    payload_depois = lambda: _dumps({v.id: v.para_dict() for v in depois})
+
+    scraper.fechar()
+    return {
+        'quantidade': quantidade,
+        'memoria_por_10k_kb': {
+            'antes': memoria_retida(scraper, brutos, anterior=True) * 10_000 / quantidade / 1024,
+            'depois': memoria_retida(scraper, brutos, anterior=False) * 10_000 / quantidade / 1024,
+        },
+        'linha_diario_vagas_s': {
+            'antes': quantidade / _cronometrar(linhas_antes, repeticoes),
+            'depois': quantidade / _cronometrar(linhas_depois, repeticoes),
+        },
+        'payload_firebase_vagas_s': {
+            'antes': quantidade / _cronometrar(payload_antes, repeticoes),
+            'depois': quantidade / _cronometrar(payload_depois, repeticoes),
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--quantidade', type=int, default=10_000)
+    parser.add_argument('--repeticoes', type=int, default=5)
+    args = parser.parse_args()
+
+    r = executar(args.quantidade, args.repeticoes)
+    print(f"{r['quantidade']} vagas")
+    print(f"{'métrica':<28}{'antes':>14}{'depois':>14}{'ganho':>8}")
+    for chave, rotulo, menor_melhor in (
+        ('memoria_por_10k_kb', 'memória / 10k vagas (KB)', True),
+        ('linha_diario_vagas_s', 'linha do diário (vagas/s)', False),
+        ('payload_firebase_vagas_s', 'payload Firebase (vagas/s)', False),
+    ):
+        antes, depois = r[chave]['antes'], r[chave]['depois']
+        ganho = antes / depois if menor_melhor else depois / antes
+        print(f"{rotulo:<28}{antes:>14,.0f}{depois:>14,.0f}{ganho:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+# benchmarks/replay_offline.py
+"""
+Run completo do runner sobre um dia gravado — offline, sem pausas.
+
+1. Gravar (run real, com rede e Firebase):
+       SCRAPER_GRAVAR_DIR=fixtures/2026-10-17 python main_gupy.py
+2. Reproduzir aqui, sem rede nem Firebase:
+       python -m benchmarks.replay_offline --fixtures fixtures/2026-10-17 --plataforma gupy
+
+O scraper é instrumentado com scrapers.replay.reproduzir (sessões servidas
+pelas fixtures, _pausar no-op) e executar_buscas + finalizar_scraping rodam
+exatamente como em produção, com duas diferenças: ids existentes vêm vazios
+e o PublicadorFirebase publica num pipeline.sinks.SinkArquivoJSON só em
+memória (o payload é montado, medido e aplicado com a semântica do RTDB).
+
+Etapas cronometradas (tempo somado, só a chamada mais externa conta):
+- fixtures:     fazer_requisicao_segura / _fazer_request (leitura do acervo)
+- parse:        Gupy _decodificar_json_utf8 · LinkedIn _extrair_vagas_brutas
+- normalizacao: Gupy _extrair_vagas_da_pagina · LinkedIn _normalizar_vaga
+- dedup:        filtrar_duplicadas
+- publicacao:   PublicadorFirebase.publicar / finalizar
+"""
+import argparse
+import importlib
+import logging
+import time
+from collections import defaultdict
+from functools import wraps
+
+import scraper_runner
+from pipeline.sinks import SinkArquivoJSON
+from scraper_runner import (
+    PublicadorFirebase, carregar_configuracoes, executar_buscas, extrair_parametros, finalizar_scraping,
+)
+from scrapers.replay import reproduzir
+
+_MAINS = {
+    'gupy': 'main_gupy',
+    'linkedin-dev': 'main_linkedin_dev',
+    'linkedin-adv': 'main_linkedin_adv',
+}
+
+_ETAPAS_SCRAPER = {
+    'gupy': {
+        'fixtures': 'fazer_requisicao_segura',
+        'parse': '_decodificar_json_utf8',
+        'normalizacao': '_extrair_vagas_da_pagina',
+    },
+    'linkedin': {
+        'fixtures': '_fazer_request',
+        'parse': '_extrair_vagas_brutas',
+        'normalizacao': '_normalizar_vaga',
+    },
+}
+
+
+class Cronometro:
+    """Tempo acumulado por etapa; chamadas aninhadas da mesma etapa não somam de novo."""
+
+    def __init__(self):
+        self.segundos = defaultdict(float)
+        self.chamadas = defaultdict(int)
+        self._profundidade = defaultdict(int)
+
+    def envolver(self, etapa: str, funcao):
+        @wraps(funcao)
+        def cronometrada(*args, **kwargs):
+            self._profundidade[etapa] += 1
+            inicio = time.perf_counter()
+            try:
+                return funcao(*args, **kwargs)
+            finally:
+                self._profundidade[etapa] -= 1
+                if self._profundidade[etapa] == 0:
+                    self.segundos[etapa] += time.perf_counter() - inicio
+                    self.chamadas[etapa] += 1
+        return cronometrada
+
+
+def _instrumentar(scraper, cronometro: Cronometro, familia: str):
+    for etapa, metodo in _ETAPAS_SCRAPER[familia].items():
+        setattr(scraper, metodo, cronometro.envolver(etapa, getattr(scraper, metodo)))
+
+
+def executar(fixtures: str, plataforma: str, concorrencia: int = 1) -> dict:
+    modulo_main = importlib.import_module(_MAINS[plataforma])
+    familia = plataforma.split('-')[0]
+    if familia == 'gupy':
+        scraper = modulo_main.GupyScraper(requisicoes_por_segundo=1.0 if concorrencia > 1 else None)
+    else:
+        scraper = modulo_main.LinkedinScraper()
+
+    acervo = reproduzir(scraper, fixtures)
+    cronometro = Cronometro()
+    _instrumentar(scraper, cronometro, familia)
+
+    filtrar_original = scraper_runner.filtrar_duplicadas
+    scraper_runner.filtrar_duplicadas = cronometro.envolver('dedup', filtrar_original)
+    inicio = time.perf_counter()
+    categorias = {}
+    try:
+        for nome, categoria in modulo_main.CATEGORIAS.items():
+            parametros = extrair_parametros(carregar_configuracoes(categoria['queries']))
+            sink = SinkArquivoJSON()
+            publicador = PublicadorFirebase(categoria['rota'], set(), modo='delta', sink=sink)
+            publicador.publicar = cronometro.envolver('publicacao', publicador.publicar)
+            publicador.finalizar = cronometro.envolver('publicacao', publicador.finalizar)
+
+            resultados = executar_buscas(scraper, parametros, set(), publicador, concorrencia)
+            finalizar_scraping(resultados, publicador)
+            categorias[nome] = {
+                'vagas': len(resultados['vagas']),
+                'publicadas': len(sink.ids(categoria['rota'])),
+                'kb_enviados': round(publicador.total_bytes / 1024, 1),
+            }
+    finally:
+        scraper_runner.filtrar_duplicadas = filtrar_original
+        scraper.fechar()
+
+    return {
+        'plataforma': plataforma,
+        'total_segundos': time.perf_counter() - inicio,
+        'etapas': {
+            etapa: {'segundos': cronometro.segundos[etapa], 'chamadas': cronometro.chamadas[etapa]}
+            for etapa in ('fixtures', 'parse', 'normalizacao', 'dedup', 'publicacao')
+        },
+        'categorias': categorias,
+        'fixtures': acervo.estatisticas(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--fixtures', required=True, help='diretório gravado com SCRAPER_GRAVAR_DIR')
+    parser.add_argument('--plataforma', choices=sorted(_MAINS), default='gupy')
+    parser.add_argument('--concorrencia', type=int, default=1)
+    parser.add_argument('--verbose', action='store_true', help='mantém os logs do runner')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, format='%(message)s')
+
+    r = executar(args.fixtures, args.plataforma, args.concorrencia)
+    print(f"{r['plataforma']}: {r['total_segundos']:.2f}s no total — fixtures {r['fixtures']}")
+    print(f"{'etapa':<14}{'segundos':>10}{'chamadas':>10}{'%':>7}")
+    for etapa, medida in r['etapas'].items():
+        percentual = medida['segundos'] / r['total_segundos'] * 100 if r['total_segundos'] else 0
+        print(f"{etapa:<14}{medida['segundos']:>10.3f}{medida['chamadas']:>10}{percentual:>6.1f}%")
+    for nome, categoria in r['categorias'].items():
+        print(f"  {nome}: {categoria['vagas']} vagas, {categoria['publicadas']} publicadas, "
+              f"{categoria['kb_enviados']} KB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,324 @@
+# benchmarks/run.py
+"""
+Suíte de benchmarks do pipeline do runner — de 1k a 1M vagas.
+
+Casos (cada um processa `tamanho` vagas/textos por medição):
+- consertar_mojibake       título + empresa + cidade de cada registro
+- padronizar_vaga          BaseScraper.padronizar_vaga sobre registros brutos
+- linkedin_extrair_pagina  LinkedinScraper._extrair_vagas_da_pagina (25 cards/página)
+- gupy_extrair_pagina      GupyScraper._extrair_vagas_da_pagina (50 itens/página)
+- filtrar_duplicadas       10% de links repetidos, 30% dos ids já no Firebase
+- serializacao_firebase    payload {id: vaga} no formato do SDK + json.dumps
+
+Datasets:
+- sintetico  benchmarks.amostras (vocabulário dos dumps db_*.json + ~3% de mojibake)
+- gravado    fixtures de um run real (--fixtures, ver scrapers/replay.py); sem
+             fixtures, só as páginas versionadas em benchmarks/dados/linkedin.
+             O material gravado é repetido (com links distintos) até o tamanho.
+
+Resultados vão para JSON (padrão: benchmarks/resultados/<commit>.json) e
+`comparar` aponta os casos que ficaram mais lentos que o limite.
+
+Uso:
+    python -m benchmarks.run executar [--tamanhos 1000,10000,100000] [--datasets sintetico,gravado]
+                                      [--casos ...] [--repeticoes 3] [--fixtures DIR] [--saida ARQ]
+    python -m benchmarks.run comparar BASE NOVO [--limite 10]
+        BASE/NOVO: arquivo JSON ou commit (procura benchmarks/resultados/<commit>.json)
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmarks.amostras import (
+    RAIZ_REPO, carregar_fixtures, carregar_paginas_linkedin, gerar_itens_gupy, gerar_pagina_linkedin,
+    gerar_registros_brutos,
+)
+from scraper_runner import filtrar_duplicadas
+from scrapers.base_scraper import consertar_mojibake
+from scrapers.gupy_scraper import GupyScraper
+from scrapers.linkedin_scraper import LinkedinScraper
+from scrapers.vaga import vaga_para_dict
+
+DIRETORIO_RESULTADOS = Path(__file__).parent / 'resultados'
+TAMANHOS_PADRAO = (1_000, 10_000, 100_000)
+
+_CARDS_POR_PAGINA = 25
+_ITENS_POR_PAGINA_GUPY = 50
+_PAGINAS_LINKEDIN_SINTETICAS = 8
+
+
+# ---------------------------------------------------------------------------
+# Datasets
+# ---------------------------------------------------------------------------
+
+def _repetir(itens: list, tamanho: int, chave_link: str) -> list:
+    """Repete `itens` até `tamanho`, com link distinto a cada volta (ids únicos)."""
+    if not itens:
+        return []
+    resultado = []
+    volta = 0
+    while len(resultado) < tamanho:
+        for item in itens[:tamanho - len(resultado)]:
+            resultado.append(item if volta == 0 else {**item, chave_link: f"{item[chave_link]}#r{volta}"})
+        volta += 1
+    return resultado
+
+
+def _registros_de_vagas(vagas: list) -> list[dict]:
+    """Vagas padronizadas → argumentos de padronizar_vaga."""
+    registros = []
+    for vaga in vagas:
+        registro = vaga_para_dict(vaga).copy()
+        registro['data_pub'] = registro.pop('data_publicacao')
+        del registro['id'], registro['origem']
+        registros.append(registro)
+    return registros
+
+
+class Dataset:
+    """Material de entrada de um dataset; cada caso pede `tamanho` unidades."""
+
+    def __init__(self, nome: str, registros: list[dict], itens_gupy: list[dict], paginas_linkedin: list[bytes]):
+        self.nome = nome
+        self._registros = registros
+        self._itens_gupy = itens_gupy
+        self.paginas_linkedin = paginas_linkedin
+
+    def registros(self, tamanho: int) -> list[dict]:
+        return _repetir(self._registros, tamanho, 'link')
+
+    def itens_gupy(self, tamanho: int) -> list[dict]:
+        return _repetir(self._itens_gupy, tamanho, 'jobUrl')
+
+
+def dataset_sintetico(tamanho_maximo: int) -> Dataset:
+    paginas = [gerar_pagina_linkedin(100 + semente) for semente in range(_PAGINAS_LINKEDIN_SINTETICAS)]
+    return Dataset('sintetico', gerar_registros_brutos(tamanho_maximo), gerar_itens_gupy(tamanho_maximo), paginas)
+
+
+def dataset_gravado(fixtures: str | None, gupy: GupyScraper, linkedin: LinkedinScraper) -> Dataset:
+    itens_gupy, paginas = carregar_fixtures(fixtures) if fixtures else ([], [])
+    if not paginas:
+        paginas = [conteudo for _, conteudo in carregar_paginas_linkedin()]
+
+    vagas = gupy._extrair_vagas_da_pagina(itens_gupy)
+    for pagina in paginas:
+        vagas.extend(linkedin._extrair_vagas_da_pagina(pagina))
+    return Dataset('gravado', _registros_de_vagas(vagas), itens_gupy, paginas)
+
+
+# ---------------------------------------------------------------------------
+# Casos — cada um devolve (funcao, itens processados por chamada)
+# ---------------------------------------------------------------------------
+
+def caso_consertar_mojibake(dataset: Dataset, tamanho: int, gupy, linkedin):
+    textos = [r[campo] for r in dataset.registros(tamanho) for campo in ('titulo', 'empresa', 'city')]
+    return (lambda: [consertar_mojibake(texto) for texto in textos]), len(textos)
+
+
+def caso_padronizar_vaga(dataset: Dataset, tamanho: int, gupy, linkedin):
+    registros = dataset.registros(tamanho)
+    ids = [gupy.gerar_id_deterministico(r['link']) for r in registros]
+
+    def funcao():
+        return [gupy.padronizar_vaga(id_vaga=id_vaga, **r) for id_vaga, r in zip(ids, registros)]
+    return funcao, len(registros)
+
+
+def caso_linkedin_extrair_pagina(dataset: Dataset, tamanho: int, gupy, linkedin):
+    paginas = dataset.paginas_linkedin
+    total_paginas = max(1, tamanho // _CARDS_POR_PAGINA)
+    sequencia = [paginas[indice % len(paginas)] for indice in range(total_paginas)]
+
+    def funcao():
+        return [linkedin._extrair_vagas_da_pagina(pagina) for pagina in sequencia]
+    return funcao, total_paginas * _CARDS_POR_PAGINA
+
+
+def caso_gupy_extrair_pagina(dataset: Dataset, tamanho: int, gupy, linkedin):
+    itens = dataset.itens_gupy(tamanho)
+    if not itens:
+        return None, 0
+    paginas = [itens[i:i + _ITENS_POR_PAGINA_GUPY] for i in range(0, len(itens), _ITENS_POR_PAGINA_GUPY)]
+    return (lambda: [gupy._extrair_vagas_da_pagina(pagina) for pagina in paginas]), len(itens)
+
+
+def caso_filtrar_duplicadas(dataset: Dataset, tamanho: int, gupy, linkedin):
+    registros = dataset.registros(tamanho - tamanho // 10)
+    vagas = [gupy.padronizar_vaga(id_vaga=gupy.gerar_id_deterministico(r['link']), **r) for r in registros]
+    vagas.extend(vagas[:tamanho - len(vagas)])
+    ids_firebase = {vaga.id for vaga in vagas[::3]}
+    return (lambda: filtrar_duplicadas(vagas, set(), ids_firebase)), len(vagas)
+
+
+def caso_serializacao_firebase(dataset: Dataset, tamanho: int, gupy, linkedin):
+    registros = dataset.registros(tamanho)
+    vagas = [gupy.padronizar_vaga(id_vaga=gupy.gerar_id_deterministico(r['link']), **r) for r in registros]
+
+    def funcao():
+        payload = {vaga['id']: vaga_para_dict(vaga) for vaga in vagas}
+        return json.dumps(payload, ensure_ascii=False, separators=(',', ':'))
+    return funcao, len(vagas)
+
+
+CASOS = {
+    'consertar_mojibake': caso_consertar_mojibake,
+    'padronizar_vaga': caso_padronizar_vaga,
+    'linkedin_extrair_pagina': caso_linkedin_extrair_pagina,
+    'gupy_extrair_pagina': caso_gupy_extrair_pagina,
+    'filtrar_duplicadas': caso_filtrar_duplicadas,
+    'serializacao_firebase': caso_serializacao_firebase,
+}
+
+
+# ---------------------------------------------------------------------------
+# Execução
+# ---------------------------------------------------------------------------
+
+def _commit_atual() -> str:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=RAIZ_REPO, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'desconhecido'
+
+
+def _medir(funcao, repeticoes: int) -> list[float]:
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return tempos
+
+
+def executar(tamanhos, datasets, casos, repeticoes: int, fixtures: str | None = None) -> dict:
+    gupy, linkedin = GupyScraper(), LinkedinScraper()
+    resultados = []
+    try:
+        disponiveis = {
+            'sintetico': lambda: dataset_sintetico(max(tamanhos)),
+            'gravado': lambda: dataset_gravado(fixtures, gupy, linkedin),
+        }
+        for nome_dataset in datasets:
+            dataset = disponiveis[nome_dataset]()
+            for tamanho in tamanhos:
+                for nome_caso in casos:
+                    funcao, itens = CASOS[nome_caso](dataset, tamanho, gupy, linkedin)
+                    if funcao is None:
+                        print(f"  {nome_dataset:<10}{nome_caso:<26}{tamanho:>9}  (sem dados — ignorado)")
+                        continue
+                    tempos = _medir(funcao, repeticoes)
+                    mediana = statistics.median(tempos)
+                    resultados.append({
+                        'caso': nome_caso, 'dataset': nome_dataset, 'tamanho': tamanho, 'itens': itens,
+                        'segundos': mediana, 'minimo': min(tempos), 'repeticoes': repeticoes,
+                        'itens_por_segundo': itens / mediana if mediana else None,
+                    })
+                    print(f"  {nome_dataset:<10}{nome_caso:<26}{tamanho:>9}{mediana * 1000:>12.1f} ms"
+                          f"{itens / mediana if mediana else 0:>14,.0f} itens/s")
+    finally:
+        gupy.fechar()
+        linkedin.fechar()
+
+    return {
+        'commit': _commit_atual(),
+        'data': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'resultados': resultados,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Comparação
+# ---------------------------------------------------------------------------
+
+def _carregar_relatorio(referencia: str) -> dict:
+    caminho = Path(referencia)
+    if not caminho.exists():
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', referencia], cwd=RAIZ_REPO, capture_output=True, text=True,
+        ).stdout.strip() or referencia
+        caminho = DIRETORIO_RESULTADOS / f"{commit}.json"
+    return json.loads(caminho.read_text(encoding='utf-8'))
+
+
+def comparar(base: dict, novo: dict, limite_percentual: float) -> list[dict]:
+    """Casos presentes nos dois relatórios, com a variação de tempo (novo / base)."""
+    indice_base = {(r['caso'], r['dataset'], r['tamanho']): r for r in base['resultados']}
+    comparacoes = []
+    for resultado in novo['resultados']:
+        anterior = indice_base.get((resultado['caso'], resultado['dataset'], resultado['tamanho']))
+        if not anterior or not anterior['segundos']:
+            continue
+        razao = resultado['segundos'] / anterior['segundos']
+        comparacoes.append({
+            'caso': resultado['caso'], 'dataset': resultado['dataset'], 'tamanho': resultado['tamanho'],
+            'base': anterior['segundos'], 'novo': resultado['segundos'], 'razao': razao,
+            'regressao': razao > 1 + limite_percentual / 100,
+        })
+    return comparacoes
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def _lista(valor: str) -> list[str]:
+    return [parte.strip() for parte in valor.split(',') if parte.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest='comando', required=True)
+
+    p_exec = sub.add_parser('executar', help='roda a suíte e grava o JSON')
+    p_exec.add_argument('--tamanhos', type=lambda v: [int(float(x)) for x in _lista(v)], default=list(TAMANHOS_PADRAO))
+    p_exec.add_argument('--datasets', type=_lista, default=['sintetico', 'gravado'])
+    p_exec.add_argument('--casos', type=_lista, default=list(CASOS))
+    p_exec.add_argument('--repeticoes', type=int, default=3)
+    p_exec.add_argument('--fixtures', help='diretório gravado com SCRAPER_GRAVAR_DIR (dataset "gravado")')
+    p_exec.add_argument('--saida', help='arquivo JSON (padrão: benchmarks/resultados/<commit>.json)')
+
+    p_comp = sub.add_parser('comparar', help='compara dois relatórios e aponta regressões')
+    p_comp.add_argument('base')
+    p_comp.add_argument('novo')
+    p_comp.add_argument('--limite', type=float, default=10.0, help='regressão = mais lento que isso (%%)')
+
+    args = parser.parse_args()
+
+    if args.comando == 'executar':
+        desconhecidos = [c for c in args.casos if c not in CASOS] + \
+                        [d for d in args.datasets if d not in ('sintetico', 'gravado')]
+        if desconhecidos:
+            parser.error(f"casos/datasets desconhecidos: {', '.join(desconhecidos)}")
+
+        relatorio = executar(args.tamanhos, args.datasets, args.casos, args.repeticoes, args.fixtures)
+        saida = Path(args.saida) if args.saida else DIRETORIO_RESULTADOS / f"{relatorio['commit']}.json"
+        saida.parent.mkdir(parents=True, exist_ok=True)
+        saida.write_text(json.dumps(relatorio, ensure_ascii=False, indent=2), encoding='utf-8')
+        print(f"Resultados em {saida}")
+        return
+
+    base, novo = _carregar_relatorio(args.base), _carregar_relatorio(args.novo)
+    comparacoes = comparar(base, novo, args.limite)
+    print(f"{base['commit']} → {novo['commit']} (limite +{args.limite:.0f}%)")
+    for c in comparacoes:
+        marca = '  ⚠️ REGRESSÃO' if c['regressao'] else ''
+        print(f"  {c['dataset']:<10}{c['caso']:<26}{c['tamanho']:>9}{c['base'] * 1000:>11.1f} ms"
+              f"{c['novo'] * 1000:>11.1f} ms{(c['razao'] - 1) * 100:>+8.1f}%{marca}")
+    regressoes = sum(c['regressao'] for c in comparacoes)
+    print(f"{regressoes} regressão(ões) em {len(comparacoes)} casos comparados")
+    sys.exit(1 if regressoes else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -8,6 +8,8 @@ Publica em: /vagas/dev/gupy + /vagas/adv/gupy (Firebase Realtime DB)
 A orquestração propriamente dita vive em scraper_runner.py
 (DRY — mesmo código compartilhado com main_linkedin.py).
 """
+import os
+
 from scrapers.gupy_scraper import GupyScraper
 from scraper_runner import executar
 
@@ -22,10 +24,36 @@ CATEGORIAS = {
     },
 }
 
+# Modo concorrente (opt-in): N combinações em voo, todas sob o mesmo token
+# bucket por host (a taxa global é a mesma com 1 ou N workers).
+CONCORRENCIA = int(os.getenv("GUPY_CONCORRENCIA", "1"))
+
+# Modo multiprocesso: cada categoria em um processo com seu próprio
+# GupyScraper; a taxa global é dividida entre os processos.
+PROCESSOS = int(os.getenv("GUPY_PROCESSOS", "1"))
+
+# Padrão = baseline: uma requisição por vez com delay aleatório de 1,5–3,5 s
+# (~0,4 req/s). Com concorrência ou processos, o bucket assume essa mesma
+# taxa; GUPY_REQUISICOES_POR_SEGUNDO maior deixa o run mais rápido à custa
+# de mais carga na API da Gupy (e mais risco de 429).
+TAXA_BASELINE = 0.4
+REQUISICOES_POR_SEGUNDO = float(os.getenv("GUPY_REQUISICOES_POR_SEGUNDO", "0")) or (
+    TAXA_BASELINE if CONCORRENCIA > 1 or PROCESSOS > 1 else None
+)
+
+
+def criar_scraper(fracao_taxa: float = 1.0) -> GupyScraper:
+    """Fábrica usada pelos workers (precisa ser função de módulo: picklable)."""
+    taxa = REQUISICOES_POR_SEGUNDO * fracao_taxa if REQUISICOES_POR_SEGUNDO else None
+    return GupyScraper(requisicoes_por_segundo=taxa)
+
 
 if __name__ == "__main__":
     executar(
-        scraper=GupyScraper(),
+        scraper=criar_scraper(),
         plataforma="gupy",
         categorias=CATEGORIAS,
+        concorrencia=CONCORRENCIA,
+        processos=PROCESSOS,
+        fabrica_scraper=criar_scraper,
     )
\ No newline at end of file
@@ -10,4 +10,10 @@ export const ROUTES = {
     FIREBASE_VAGAS_DEV_LINKEDIN: "/vagas/dev/linkedin",
     FIREBASE_VAGAS_ADV_GUPY: "/vagas/adv/gupy",
     FIREBASE_VAGAS_ADV_LINKEDIN: "/vagas/adv/linkedin",
+
+    // Modelo de leitura pré-computado pelo scraper (shards, facetas, lista resumida)
+    FIREBASE_LEITURA_DEV_GUPY: "/leitura/dev/gupy",
+    FIREBASE_LEITURA_DEV_LINKEDIN: "/leitura/dev/linkedin",
+    FIREBASE_LEITURA_ADV_GUPY: "/leitura/adv/gupy",
+    FIREBASE_LEITURA_ADV_LINKEDIN: "/leitura/adv/linkedin",
 } as const;
\ No newline at end of file
@@ -1,6 +1,6 @@
 import { ref, get } from "firebase/database";
 import { database } from "./firebase";
-import type { IVaga } from "../types/IVaga";
+import type { IFacetasVagas, IVaga, IVagaResumo } from "../types/IVaga";
 
 /**
  * Busca vagas de uma única rota do Firebase Realtime Database.
@@ -34,4 +34,57 @@ export const getVagas = async (rotas: string[]): Promise<IVaga[]> => {
         console.warn(`[api] Falha ao buscar rota '${rotas[indice]}':`, resultado.reason);
         return [];
     });
-};
\ No newline at end of file
+};
+
+/** Dimensões com shard no modelo de leitura. */
+export type DimensaoShard = "estado" | "modalidade" | "contrato";
+
+/** Chave do shard com as vagas de campo ausente — entram em qualquer filtro (permissividade). */
+export const SHARD_AUSENTE = "_ausente";
+
+/**
+ * Lê um nó {id: vaga resumida} do modelo de leitura como array com id.
+ */
+const buscarResumos = async (caminho: string): Promise<IVagaResumo[]> => {
+    const snapshot = await get(ref(database, caminho));
+    const dados: Record<string, Omit<IVagaResumo, "id">> = snapshot.val() || {};
+    return Object.entries(dados).map(([id, vaga]) => ({ id, ...vaga }));
+};
+
+/**
+ * Contagens por estado/modalidade/contrato/origem de uma rota de leitura —
+ * alguns KB, suficientes para popular os dropdowns antes de baixar vagas.
+ */
+export const getFacetas = async (rotaLeitura: string): Promise<IFacetasVagas> => {
+    const snapshot = await get(ref(database, `${rotaLeitura}/facetas`));
+    return snapshot.val() || {};
+};
+
+/**
+ * Lista resumida (sem link/país) de uma rota de leitura. Toda vaga está em
+ * exatamente um shard de estado, então a lista é shards/estado inteiro.
+ */
+export const getVagasResumidas = async (rotaLeitura: string): Promise<IVagaResumo[]> => {
+    const snapshot = await get(ref(database, `${rotaLeitura}/shards/estado`));
+    const porEstado: Record<string, Record<string, Omit<IVagaResumo, "id">>> = snapshot.val() || {};
+    return Object.values(porEstado).flatMap((vagas) =>
+        Object.entries(vagas).map(([id, vaga]) => ({ id, ...vaga })),
+    );
+};
+
+/**
+ * Vagas de um único shard, já somadas às de campo ausente da mesma dimensão
+ * (mesma permissividade do useFiltrosVagas). Cada shard traz os resumos:
+ * no máximo duas leituras, em paralelo.
+ */
+export const getVagasShard = async (
+    rotaLeitura: string,
+    dimensao: DimensaoShard,
+    chave: string,
+): Promise<IVagaResumo[]> => {
+    const [doShard, ausentes] = await Promise.all([
+        buscarResumos(`${rotaLeitura}/shards/${dimensao}/${chave}`),
+        chave === SHARD_AUSENTE ? Promise.resolve([]) : buscarResumos(`${rotaLeitura}/shards/${dimensao}/${SHARD_AUSENTE}`),
+    ]);
+    return [...doShard, ...ausentes];
+};
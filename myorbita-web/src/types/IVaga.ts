@@ -16,4 +16,33 @@ export interface IVaga {
     tipo_contrato?: string;
     prazo_inscricao?: string;
     pcd?: boolean;
-}
\ No newline at end of file
+}
+
+/** Link da mesma vaga em outra plataforma (índice de duplicatas do scraper). */
+export interface IVagaAlternativa {
+    origem: string;
+    link: string;
+}
+
+/**
+ * Vaga resumida do modelo de leitura (/leitura/...): só o que o card e os
+ * filtros usam. O detalhe completo continua na rota bruta (/vagas/.../<id>).
+ */
+export type IVagaResumo = Pick<IVaga, "id" | "titulo" | "empresa" | "modalidade" | "data_publicacao" | "origem"
+    | "city" | "state" | "tipo_contrato" | "prazo_inscricao" | "pcd"> & {
+    alternativas?: IVagaAlternativa[];
+};
+
+/** Contagem de uma faceta — `valor` é o texto original, a chave do shard pode vir sanitizada. */
+export interface IFaceta {
+    valor: string;
+    total: number;
+}
+
+export interface IFacetasVagas {
+    estado?: Record<string, IFaceta>;
+    modalidade?: Record<string, IFaceta>;
+    contrato?: Record<string, IFaceta>;
+    origem?: Record<string, IFaceta>;
+    pcd?: number;
+}
@@ -0,0 +1,207 @@
+# pipeline/arquivo_colunar.py
+"""
+Arquivo colunar das execuções — histórico para análise.
+
+A rota no Firebase espelha só a última execução; o único histórico eram
+os dumps db_dev.json/db_adv.json salvos à mão. Ao fim de cada rota o runner
+grava aqui todas as vagas coletadas no run, um arquivo imutável por
+execução (append = arquivo novo), particionado no estilo Hive:
+
+    <diretorio>/data=2026-10-17/plataforma=gupy/categoria=dev/20261017T063012Z.parquet
+
+Formato:
+- Parquet (pyarrow instalado): compressão zstd, colunas de baixa
+  cardinalidade (UF, modalidade, contrato, origem...) como dictionary,
+  booleanos nativos. pyarrow.dataset, DuckDB e pandas leem o diretório
+  direto, com as partições como colunas.
+- Sem pyarrow: o mesmo layout em JSON gzip colunar (.colunas.json.gz) —
+  cada coluna de baixa cardinalidade vira {dicionario, codigos}, as demais
+  {valores}. Nenhum dos dois guarda um dict por vaga.
+pyarrow é opcional (fora do requirements.txt); os workflows o instalam.
+
+Cada run arquiva a rota inteira, então uma vaga que fica no ar 30 dias
+aparece em 30 arquivos. contar_por() conta vagas distintas: cada
+(plataforma, categoria, id) entra uma vez, com o valor da execução mais
+recente. Lê só as colunas id e a agregada de cada arquivo e poda as
+partições pelo caminho (datas, plataforma, categoria) — uma contagem anual
+por estado não carrega os demais campos nem monta objetos por vaga.
+
+Uso direto:
+    python -m pipeline.arquivo_colunar --dir .arquivo --contar state --ano 2026
+"""
+import argparse
+import gzip
+import json
+import os
+import time
+from collections import Counter
+from typing import Iterable
+from pathlib import Path
+
+from scrapers.vaga import CAMPOS_VAGA
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # dependência opcional: sem ela, JSON gzip colunar
+    pa = pq = None
+
+# Colunas com poucos valores distintos — dictionary encoding
+COLUNAS_DICIONARIO = frozenset({
+    'modalidade', 'origem', 'city', 'state', 'country', 'workplace_type', 'tipo_contrato', 'empresa',
+    'coletado_em',
+})
+COLUNAS_BOOLEANAS = frozenset({'is_remote', 'pcd'})
+COLUNAS = (*CAMPOS_VAGA, 'coletado_em')
+
+EXTENSAO_PARQUET = '.parquet'
+EXTENSAO_JSON = '.colunas.json.gz'
+
+
+def _colunas_de(vagas: list, coletado_em: str) -> dict[str, list]:
+    colunas = {campo: [vaga.get(campo) for vaga in vagas] for campo in CAMPOS_VAGA}
+    colunas['coletado_em'] = [coletado_em] * len(vagas)
+    return colunas
+
+
+def _booleano(valor):
+    return valor if valor is None or isinstance(valor, bool) else None
+
+
+# ============================================================
+# ESCRITA
+# ============================================================
+def gravar_execucao(vagas: list, diretorio: str, plataforma: str, categoria: str,
+                    inicio: float | None = None) -> Path | None:
+    """Grava as vagas do run na partição do dia. Devolve o arquivo (None se não há vagas)."""
+    if not vagas:
+        return None
+    inicio = time.time() if inicio is None else inicio
+    particao = (Path(diretorio) / f"data={time.strftime('%Y-%m-%d', time.gmtime(inicio))}"
+                / f"plataforma={plataforma}" / f"categoria={categoria}")
+    particao.mkdir(parents=True, exist_ok=True)
+    nome = time.strftime('%Y%m%dT%H%M%SZ', time.gmtime(inicio))
+    colunas = _colunas_de(vagas, time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(inicio)))
+
+    if pa is not None:
+        caminho = particao / f"{nome}{EXTENSAO_PARQUET}"
+        _gravar_parquet(colunas, caminho)
+    else:
+        caminho = particao / f"{nome}{EXTENSAO_JSON}"
+        _gravar_json(colunas, caminho)
+    return caminho
+
+
+def _gravar_parquet(colunas: dict, caminho: Path):
+    arrays = {}
+    for nome, valores in colunas.items():
+        if nome in COLUNAS_BOOLEANAS:
+            arrays[nome] = pa.array([_booleano(valor) for valor in valores], type=pa.bool_())
+        elif nome in COLUNAS_DICIONARIO:
+            arrays[nome] = pa.array(valores, type=pa.string()).dictionary_encode()
+        else:
+            arrays[nome] = pa.array(valores, type=pa.string())
+    temporario = caminho.with_suffix('.tmp')
+    pq.write_table(pa.table(arrays), temporario, compression='zstd')
+    os.replace(temporario, caminho)
+
+
+def _gravar_json(colunas: dict, caminho: Path):
+    documento = {'linhas': len(colunas['id']), 'colunas': {}}
+    for nome, valores in colunas.items():
+        if nome in COLUNAS_DICIONARIO:
+            indices: dict = {}
+            codigos = [indices.setdefault(valor, len(indices)) for valor in valores]
+            documento['colunas'][nome] = {'dicionario': list(indices), 'codigos': codigos}
+        else:
+            documento['colunas'][nome] = {'valores': valores}
+    temporario = caminho.with_suffix('.tmp')
+    with gzip.open(temporario, 'wt', encoding='utf-8') as arquivo:
+        json.dump(documento, arquivo, ensure_ascii=False, separators=(',', ':'))
+    os.replace(temporario, caminho)
+
+
+# ============================================================
+# LEITURA
+# ============================================================
+def arquivos(diretorio: str, desde: str | None = None, ate: str | None = None,
+             plataforma: str | None = None, categoria: str | None = None) -> list[Path]:
+    """Arquivos do intervalo [desde, ate] (YYYY-MM-DD), podando pelas partições do caminho."""
+    encontrados = []
+    for pasta_data in sorted(Path(diretorio).glob('data=*')):
+        data = pasta_data.name.partition('=')[2]
+        if (desde and data < desde) or (ate and data > ate):
+            continue
+        for pasta_plataforma in sorted(pasta_data.glob(f"plataforma={plataforma or '*'}")):
+            for pasta_categoria in sorted(pasta_plataforma.glob(f"categoria={categoria or '*'}")):
+                encontrados.extend(
+                    arquivo for arquivo in sorted(pasta_categoria.iterdir())
+                    if arquivo.name.endswith((EXTENSAO_PARQUET, EXTENSAO_JSON))
+                )
+    return encontrados
+
+
+def _valores_json(dados: dict) -> list:
+    if 'dicionario' in dados:
+        return [dados['dicionario'][codigo] for codigo in dados['codigos']]
+    return dados['valores']
+
+
+def _ler_colunas(arquivo: Path, colunas: list[str]) -> dict[str, list]:
+    """Só as colunas pedidas de um arquivo, como listas de valores."""
+    if arquivo.name.endswith(EXTENSAO_PARQUET):
+        if pq is None:
+            raise RuntimeError(f"'{arquivo}' é Parquet: instale pyarrow para ler")
+        tabela = pq.read_table(arquivo, columns=colunas)
+        return {nome: tabela.column(nome).to_pylist() for nome in colunas}
+
+    with gzip.open(arquivo, 'rt', encoding='utf-8') as entrada:
+        dados = json.load(entrada)['colunas']
+    return {nome: _valores_json(dados[nome]) for nome in colunas}
+
+
+def _valores_por_id(arquivo: Path, coluna: str) -> Iterable[tuple]:
+    """(id, valor da coluna) de cada vaga do arquivo."""
+    lidas = _ler_colunas(arquivo, list(dict.fromkeys(('id', coluna))))
+    return zip(lidas['id'], lidas[coluna])
+
+
+def contar_por(diretorio: str, coluna: str, **filtros) -> Counter:
+    """
+    Vagas distintas por valor da coluna nas execuções do filtro (ver
+    arquivos()). Uma vaga vista em vários runs conta uma vez, pelo valor
+    do run mais recente.
+    """
+    if coluna not in COLUNAS:
+        raise ValueError(f"Coluna desconhecida: '{coluna}' (use uma de {', '.join(COLUNAS)})")
+    ultimo_valor = {}
+    for arquivo in sorted(arquivos(diretorio, **filtros), key=lambda caminho: caminho.name):
+        particao = (arquivo.parent.parent.name, arquivo.parent.name)
+        for id_vaga, valor in _valores_por_id(arquivo, coluna):
+            ultimo_valor[(particao, id_vaga)] = valor
+    return Counter(ultimo_valor.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dir', default='.arquivo', help='diretório do arquivo (SCRAPER_ARQUIVO_DIR)')
+    parser.add_argument('--contar', required=True, help='coluna a agregar (ex: state, modalidade, tipo_contrato)')
+    parser.add_argument('--ano', help='só execuções do ano (YYYY)')
+    parser.add_argument('--plataforma')
+    parser.add_argument('--categoria')
+    args = parser.parse_args()
+
+    filtros = {'plataforma': args.plataforma, 'categoria': args.categoria}
+    if args.ano:
+        filtros.update(desde=f"{args.ano}-01-01", ate=f"{args.ano}-12-31")
+
+    inicio = time.perf_counter()
+    lidos = arquivos(args.dir, **filtros)
+    contagem = contar_por(args.dir, args.contar, **filtros)
+    print(f"{sum(contagem.values())} vagas distintas em {len(lidos)} execuções ({time.perf_counter() - inicio:.2f}s)")
+    for valor, total in contagem.most_common():
+        print(f"  {valor if valor is not None else '(vazio)'}: {total}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,215 @@
+# pipeline/duplicatas.py
+"""
+Índice de duplicatas entre plataformas — a mesma vaga na Gupy e no LinkedIn.
+
+filtrar_duplicadas só compara `link` dentro de um run e de uma rota, então
+a mesma oportunidade publicada nas duas plataformas aparece duas vezes para
+o cliente (/leitura/dev/gupy + /leitura/dev/linkedin).
+
+Impressão digital = blake2b (8 bytes) de título, empresa, cidade e UF
+normalizados:
+- acentos dobrados (NFKD), caixa baixa, pontuação vira espaço;
+- título sem trechos entre parênteses/colchetes, códigos ("Cód. 1818"),
+  modalidade e palavras vazias; flexão de gênero unificada
+  (desenvolvedora → desenvolvedor); senioridade canônica (Sr/Sênior/Senior
+  → senior, Jr/Júnior → junior, Pl → pleno...); tokens ordenados;
+- empresa sem sufixos societários (Ltda, S.A., ME...);
+- valores ausentes (mesmos sentinelas do modelo de leitura) viram ''.
+Sem empresa real (ausente ou genérica: "Confidencial", "Empresa
+Sigilosa"...) ou sem cidade e UF, sobra pouco além do título e vagas
+distintas colidiriam: essas não têm impressão (impressao_digital → None) e
+nunca são tratadas como duplicatas.
+A data de publicação não entra no hash: duas entradas com a mesma impressão
+só são a mesma vaga se as datas estiverem a até `janela_dias` (data
+ausente não descarta).
+
+O índice de uma categoria fica no sink, ao lado das rotas:
+
+    /duplicatas/dev/<impressao>/<plataforma>   {id, link, origem, data}
+
+Cada rota, ao publicar, substitui só as suas entradas (delta com update;
+None remove as impressões que sumiram). Consulta = uma busca em dict por
+vaga. Canônica de um grupo = entrada com a data mais antiga (empate: nome
+da plataforma) — as duas rotas chegam à mesma escolha lendo o mesmo
+índice. O modelo de leitura omite as vagas não canônicas e anexa à
+canônica os links alternativos. Como cada rota é recalculada no seu próprio
+run, os links alternativos de uma rota aparecem no run seguinte dela.
+"""
+import hashlib
+import logging
+import re
+import unicodedata
+from datetime import date
+
+from pipeline.modelo_leitura import VALORES_AUSENTES
+
+logger = logging.getLogger(__name__)
+
+_ENTRE_PARENTESES = re.compile(r'\([^)]*\)|\[[^\]]*\]')
+_CODIGO = re.compile(r'\b(?:cod|codigo|ref|req|id)\b\W*\w*\d\w*')
+_NAO_ALFANUMERICO = re.compile(r'[^a-z0-9+#]+')
+
+SENIORIDADE = {
+    'jr': 'junior', 'junior': 'junior',
+    'pl': 'pleno', 'pleno': 'pleno', 'plena': 'pleno',
+    'sr': 'senior', 'senior': 'senior',
+    'estagio': 'estagio', 'estagiario': 'estagio', 'estagiaria': 'estagio', 'intern': 'estagio',
+    'trainee': 'trainee',
+    'especialista': 'especialista',
+}
+
+_FLEXOES = {
+    'desenvolvedora': 'desenvolvedor', 'engenheira': 'engenheiro', 'advogada': 'advogado',
+    'programadora': 'programador', 'coordenadora': 'coordenador', 'arquiteta': 'arquiteto',
+    'consultora': 'consultor',
+}
+
+_PALAVRAS_VAZIAS = frozenset({
+    'a', 'o', 'as', 'os', 'de', 'da', 'do', 'das', 'dos', 'e', 'em', 'para', 'com', 'l',
+    'vaga', 'pessoa', 'remoto', 'remota', 'hibrido', 'hibrida', 'presencial', 'home', 'office',
+})
+
+_SUFIXOS_EMPRESA = frozenset({'ltda', 'sa', 's', 'a', 'me', 'epp', 'eireli', 'inc', 'llc', 'ltd'})
+
+# Empresas genéricas (já normalizadas): não identificam o empregador
+EMPRESAS_GENERICAS = frozenset({
+    'confidencial', 'empresa confidencial', 'sigilosa', 'empresa sigilosa', 'sigiloso',
+    'nao divulgada', 'empresa nao divulgada', 'nao informada', 'anonima', 'empresa anonima',
+    'confidential', 'confidential company', 'undisclosed',
+})
+
+
+def dobrar(texto) -> str:
+    """Sem acentos, caixa baixa, só [a-z0-9+#] separados por um espaço. Ausente → ''."""
+    if not isinstance(texto, str) or texto.strip() in VALORES_AUSENTES:
+        return ''
+    sem_acento = unicodedata.normalize('NFKD', texto).encode('ascii', 'ignore').decode('ascii')
+    return _NAO_ALFANUMERICO.sub(' ', sem_acento.lower()).strip()
+
+
+def normalizar_titulo(titulo) -> str:
+    if not isinstance(titulo, str):
+        return ''
+    titulo = _CODIGO.sub(' ', dobrar(_ENTRE_PARENTESES.sub(' ', titulo)))
+    tokens = set()
+    for token in titulo.split():
+        token = SENIORIDADE.get(token) or _FLEXOES.get(token, token)
+        if token not in _PALAVRAS_VAZIAS:
+            tokens.add(token)
+    return ' '.join(sorted(tokens))
+
+
+def normalizar_empresa(empresa) -> str:
+    return ' '.join(token for token in dobrar(empresa).split() if token not in _SUFIXOS_EMPRESA)
+
+
+def impressao_digital(vaga) -> str | None:
+    """Hash de título/empresa/cidade/UF; None se a vaga não tem empresa real ou localização."""
+    empresa = normalizar_empresa(vaga.get('empresa'))
+    cidade, uf = dobrar(vaga.get('city')), dobrar(vaga.get('state'))
+    if not empresa or empresa in EMPRESAS_GENERICAS or not (cidade or uf):
+        return None
+    chave = '|'.join((normalizar_titulo(vaga.get('titulo')), empresa, cidade, uf))
+    return hashlib.blake2b(chave.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def _data(valor) -> date | None:
+    """'2026-02-25T21:19:38.845Z' (Gupy) ou '2026-02-25' (LinkedIn) → date."""
+    if not isinstance(valor, str):
+        return None
+    try:
+        return date.fromisoformat(valor[:10])
+    except ValueError:
+        return None
+
+
+class IndiceDuplicatas:
+    """Impressões digitais de uma categoria (todas as plataformas) no sink."""
+
+    def __init__(self, sink, rota_indice: str, plataforma: str, janela_dias: int = 7):
+        self.sink = sink
+        self.rota_indice = rota_indice.rstrip('/')
+        self.plataforma = plataforma
+        self.janela_dias = janela_dias
+        self._grupos: dict[str, dict] = {}
+        self._impressoes: dict[str, str] = {}  # id da vaga (desta plataforma) → impressão
+
+    def carregar(self):
+        """Lê o índice da categoria (antes do scraping). Falha = índice vazio."""
+        try:
+            self._grupos = self.sink.obter(self.rota_indice) or {}
+        except Exception as e:
+            logger.warning(f"Falha ao carregar índice de duplicatas '{self.rota_indice}': {e} — sem dedup entre plataformas")
+            self._grupos = {}
+
+    def registrar(self, vagas: list) -> int:
+        """
+        Substitui as entradas desta plataforma pelas vagas do run e publica o
+        delta. Devolve quantas impressões foram enviadas (incluindo remoções).
+        """
+        entradas = {}
+        self._impressoes = {}
+        for vaga in vagas:
+            impressao = impressao_digital(vaga)
+            if impressao is None:
+                continue
+            self._impressoes[vaga['id']] = impressao
+            entradas.setdefault(impressao, {
+                'id': vaga['id'],
+                'link': vaga['link'],
+                'origem': vaga.get('origem'),
+                'data': (vaga.get('data_publicacao') or '')[:10] or None,
+            })
+
+        anteriores = {
+            impressao: grupo[self.plataforma]
+            for impressao, grupo in self._grupos.items() if self.plataforma in grupo
+        }
+        delta = {
+            f"{impressao}/{self.plataforma}": entrada
+            for impressao, entrada in entradas.items() if anteriores.get(impressao) != entrada
+        }
+        delta.update({
+            f"{impressao}/{self.plataforma}": None for impressao in anteriores.keys() - entradas.keys()
+        })
+
+        for impressao in anteriores.keys() - entradas.keys():
+            grupo = self._grupos[impressao]
+            del grupo[self.plataforma]
+            if not grupo:
+                del self._grupos[impressao]
+        for impressao, entrada in entradas.items():
+            self._grupos.setdefault(impressao, {})[self.plataforma] = entrada
+
+        if delta:
+            self.sink.update(self.rota_indice, delta)
+        return len(delta)
+
+    def classificar(self, vaga) -> tuple[bool, list]:
+        """
+        (canônica?, links alternativos) da vaga — O(1): uma busca no índice.
+        Só vagas passadas a registrar() e com impressão são consultadas; as
+        demais são canônicas sem alternativas.
+        """
+        impressao = self._impressoes.get(vaga['id'])
+        grupo = self._grupos.get(impressao) if impressao else None
+        if not grupo or len(grupo) < 2:
+            return True, []
+
+        propria = grupo[self.plataforma]
+        data_propria = _data(propria.get('data'))
+        mesmas = {
+            plataforma: entrada for plataforma, entrada in grupo.items()
+            if plataforma == self.plataforma or self._na_janela(data_propria, _data(entrada.get('data')))
+        }
+        canonica = min(mesmas, key=lambda plataforma: (mesmas[plataforma].get('data') or '9999', plataforma))
+        if canonica != self.plataforma:
+            return False, []
+        alternativas = [
+            {'origem': entrada.get('origem') or plataforma, 'link': entrada['link']}
+            for plataforma, entrada in sorted(mesmas.items()) if plataforma != self.plataforma
+        ]
+        return True, alternativas
+
+    def _na_janela(self, uma: date | None, outra: date | None) -> bool:
+        return uma is None or outra is None or abs((uma - outra).days) <= self.janela_dias
@@ -0,0 +1,208 @@
+# pipeline/escritor.py
+"""
+Escritor assíncrono — grava no sink numa thread própria, em lotes.
+
+Sem ele, cada checkpoint do PublicadorFirebase é um update bloqueante na
+thread do scraping: a latência do Firebase soma no tempo do run e uma
+escrita lenta segura o crawl. Com ele, publicar() só enfileira e volta:
+
+- Coalescência: o pendente é {rota: {chave: valor}}; a mesma chave escrita
+  de novo antes do envio só troca o valor. O tamanho de cada lote é a soma
+  do informado por quem enfileirou (o publicador já mediu o payload), sem
+  serializar o lote de novo na thread; chaves sobrescritas antes do envio
+  contam as duas vezes.
+- Backpressure: o pendente é limitado a `max_pendente` bytes enfileirados
+  (contados antes da coalescência). Acima disso, update()/set() esperam a
+  thread tirar um lote do buffer — com o sink fora do ar, o scraping para
+  em vez de acumular a rota inteira em memória.
+- Envio por tempo ou tamanho: um lote sai quando `intervalo` segundos
+  passaram desde o último envio ou quando o enfileirado desde então chega
+  a `max_bytes`/`max_linhas` — não mais a cada N palavras-chave.
+- Falha: nova tentativa com backoff exponencial (`backoff_inicial` até
+  `backoff_maximo`). Esgotadas as tentativas, o lote volta para o pendente
+  (por baixo do que chegou depois) e sai no próximo envio.
+- fechar(): envio síncrono de tudo que falta (mesmas tentativas); o que
+  ainda falhar é contado em `chaves_perdidas` e fechar() devolve False.
+
+set() substitui a rota inteira (modo snapshot): updates posteriores entram
+no mesmo valor antes do envio.
+"""
+import json
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def _tamanho(payload: dict) -> int:
+    return len(json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+
+class EscritorAssincrono:
+    """Thread única de escrita no sink com buffer coalescente."""
+
+    def __init__(self, sink, metricas=None, intervalo: float = 30.0, max_bytes: int = 512 * 1024,
+                 max_linhas: int = 1000, tentativas: int = 5, backoff_inicial: float = 1.0,
+                 backoff_maximo: float = 60.0, max_pendente: int = 8 * 1024 * 1024):
+        self.sink = sink
+        self.metricas = metricas
+        self.intervalo = intervalo
+        self.max_bytes = max_bytes
+        self.max_linhas = max_linhas
+        self.tentativas = max(1, tentativas)
+        self.backoff_inicial = backoff_inicial
+        self.backoff_maximo = backoff_maximo
+        self.max_pendente = max(max_pendente, max_bytes)
+
+        self._condicao = threading.Condition()
+        self._pendentes: dict[str, list] = {}  # rota → [substituir, {chave: valor}, bytes]
+        self._bytes = 0
+        self._linhas = 0
+        self._ultimo_envio = time.monotonic()
+        self._fechando = False
+
+        self.lotes = 0
+        self.falhas = 0
+        self.chaves_enviadas = 0
+        self.chaves_perdidas = 0
+        self.segundos_bloqueado = 0.0
+
+        self._thread = threading.Thread(target=self._laco, name='escritor-sink', daemon=True)
+        self._thread.start()
+
+    # ------------------------------------------------------------------
+    # Produtor (thread do scraping)
+    # ------------------------------------------------------------------
+
+    def update(self, rota: str, payload: dict, tamanho: int | None = None):
+        """Enfileira um multi-path update (None remove a chave)."""
+        self._enfileirar(rota, payload, False, tamanho)
+
+    def set(self, rota: str, valor: dict, tamanho: int | None = None):
+        """Enfileira a substituição da rota inteira."""
+        self._enfileirar(rota, valor, True, tamanho)
+
+    def _enfileirar(self, rota: str, dados: dict, substituir: bool, tamanho: int | None):
+        tamanho = _tamanho(dados) if tamanho is None else tamanho
+        with self._condicao:
+            if self._bytes >= self.max_pendente and not self._fechando:
+                self._esperar_espaco()
+            if self._fechando:
+                raise RuntimeError("EscritorAssincrono já foi fechado")
+            vazio = not self._pendentes
+            self._mesclar(rota, substituir, dados, tamanho)
+            self._bytes += tamanho
+            self._linhas += len(dados)
+            # buffer vazio: a thread dorme sem prazo e precisa armar o intervalo
+            if vazio or self._bytes >= self.max_bytes or self._linhas >= self.max_linhas:
+                self._condicao.notify_all()
+
+    def _esperar_espaco(self):
+        """Bloqueia o produtor até a thread esvaziar o buffer (chamado com a condição adquirida)."""
+        inicio = time.monotonic()
+        self._condicao.notify_all()
+        while self._bytes >= self.max_pendente and not self._fechando:
+            self._condicao.wait()
+        espera = time.monotonic() - inicio
+        self.segundos_bloqueado += espera
+        logger.warning(
+            f"[{self.sink.nome}]: Buffer do escritor cheio ({self.max_pendente / 1024:.0f} KB) — "
+            f"scraping esperou {espera:.1f}s pelo envio"
+        )
+
+    def _mesclar(self, rota: str, substituir: bool, dados: dict, tamanho: int):
+        atual = self._pendentes.get(rota)
+        if substituir or atual is None:
+            self._pendentes[rota] = [substituir, dict(dados), tamanho]
+        else:
+            atual[1].update(dados)
+            atual[2] += tamanho
+
+    # ------------------------------------------------------------------
+    # Thread de escrita
+    # ------------------------------------------------------------------
+
+    def _deve_enviar(self) -> bool:
+        return bool(self._pendentes) and (
+            self._fechando
+            or self._bytes >= self.max_bytes
+            or self._linhas >= self.max_linhas
+            or time.monotonic() - self._ultimo_envio >= self.intervalo
+        )
+
+    def _laco(self):
+        while True:
+            with self._condicao:
+                while not self._deve_enviar():
+                    if self._fechando:
+                        return
+                    espera = self.intervalo - (time.monotonic() - self._ultimo_envio) if self._pendentes else None
+                    self._condicao.wait(timeout=max(0.05, espera) if espera is not None else None)
+                lote, self._pendentes = self._pendentes, {}
+                self._bytes = self._linhas = 0
+                fechando = self._fechando
+                self._condicao.notify_all()  # produtor esperando espaço no buffer
+
+            falhas = {rota: item for rota, item in lote.items() if not self._gravar(rota, *item)}
+
+            with self._condicao:
+                self._ultimo_envio = time.monotonic()
+                if not falhas:
+                    continue
+                if fechando:
+                    perdidas = sum(len(dados) for _, dados, _ in falhas.values())
+                    self.chaves_perdidas += perdidas
+                    logger.error(f"[{self.sink.nome} ERRO]: {perdidas} chaves não gravadas no fechamento do escritor")
+                    continue
+                for rota, (substituir, dados, tamanho) in falhas.items():
+                    mais_novo = self._pendentes.get(rota)
+                    if mais_novo is None:
+                        self._pendentes[rota] = [substituir, dados, tamanho]
+                    elif not mais_novo[0]:
+                        self._pendentes[rota] = [substituir, {**dados, **mais_novo[1]}, tamanho + mais_novo[2]]
+                    else:
+                        continue  # um set() posterior já substitui a rota inteira
+                    self._bytes += tamanho
+                    self._linhas += len(dados)
+
+    def _gravar(self, rota: str, substituir: bool, dados: dict, tamanho: int) -> bool:
+        """Um lote de uma rota, com backoff exponencial. False = todas as tentativas falharam."""
+        espera = self.backoff_inicial
+        for tentativa in range(1, self.tentativas + 1):
+            inicio = time.perf_counter()
+            try:
+                if substituir:
+                    self.sink.set(rota, {chave: valor for chave, valor in dados.items() if valor is not None})
+                else:
+                    self.sink.update(rota, dados)
+            except Exception as e:
+                self.falhas += 1
+                logger.warning(
+                    f"[{self.sink.nome} ERRO]: Lote de {len(dados)} chaves em '{rota}' falhou "
+                    f"(tentativa {tentativa}/{self.tentativas}): {e}"
+                )
+                if tentativa < self.tentativas:
+                    time.sleep(espera)
+                    espera = min(espera * 2, self.backoff_maximo)
+                continue
+
+            if self.metricas:
+                self.metricas.registrar_upload(time.perf_counter() - inicio, tamanho)
+            self.lotes += 1
+            self.chaves_enviadas += len(dados)
+            logger.info(f"[{self.sink.nome}]: Lote assíncrono de {len(dados)} chaves ({tamanho / 1024:.1f} KB) gravado em '{rota}'")
+            return True
+        return False
+
+    # ------------------------------------------------------------------
+    # Encerramento
+    # ------------------------------------------------------------------
+
+    def fechar(self, timeout: float | None = None) -> bool:
+        """Envia o pendente e encerra a thread (idempotente). False se algo não foi gravado."""
+        with self._condicao:
+            self._fechando = True
+            self._condicao.notify_all()
+        self._thread.join(timeout)
+        return self.chaves_perdidas == 0 and not self._pendentes
@@ -0,0 +1,229 @@
+# pipeline/historico.py
+"""
+Histórico de vagas em SQLite — quando cada vaga apareceu e quando sumiu.
+
+A rota no Firebase só espelha o run atual: uma vaga removida some sem
+rastro e ninguém sabe desde quando uma vaga está no ar. O runner alimenta
+aqui, a cada checkpoint do PublicadorFirebase, as vagas ainda não
+registradas no run — um único executemany numa transação por checkpoint:
+
+    vagas(rota, id, plataforma, categoria, <campos da vaga>,
+          first_seen, last_seen, ativa)
+
+- first_seen: primeiro run que viu a vaga (não muda no upsert);
+- last_seen: último checkpoint que a viu (atualizado a cada run);
+- ativa: 0 quando o passe final de um run completo não a encontrou mais —
+  last_seen passa a ser a data em que ela sumiu. Uma vaga que volta é
+  reativada e mantém o first_seen original. Vagas de combinações que o
+  planejador pulou (preservadas) não são encerradas.
+
+Datas em ISO UTC ('2026-10-17T06:30:12Z'), que ordenam como texto: "novas
+hoje" é uma faixa no índice de first_seen. WAL + busy timeout: leitores
+(consultas, CLI) não bloqueiam o runner, e um processo por categoria pode
+escrever no mesmo arquivo. Cada transação de escrita termina com
+wal_checkpoint(TRUNCATE): um run morto pelo timeout do job deixa os
+checkpoints já commitados no próprio historico.db, não num -wal que o
+cache do Actions não levaria. Índices em id, plataforma, categoria, state,
+modalidade, first_seen, last_seen e data_publicacao.
+
+Fonte de IDs: a tabela `execucoes` guarda o último run completo de cada
+rota. Com ela, ids_ativos(rota) é exatamente o que o passe final deixou na
+rota, e o runner pode ler os IDs existentes daqui em vez do Firebase
+(SCRAPER_HISTORICO_FONTE_IDS=1).
+
+Uso direto:
+    python -m pipeline.historico --db historico.db --novas-hoje
+    python -m pipeline.historico --db historico.db --vida-mediana
+"""
+import argparse
+import sqlite3
+import threading
+import time
+
+from scrapers.vaga import CAMPOS_VAGA
+
+_COLUNAS_VAGA = ', '.join(CAMPOS_VAGA)
+_MARCADORES_VAGA = ', '.join('?' for _ in CAMPOS_VAGA)
+_ATUALIZAR_VAGA = ', '.join(f"{campo} = excluded.{campo}" for campo in CAMPOS_VAGA if campo != 'id')
+
+_ESQUEMA = f"""
+CREATE TABLE IF NOT EXISTS vagas (
+    rota TEXT NOT NULL,
+    plataforma TEXT NOT NULL,
+    categoria TEXT NOT NULL,
+    {_COLUNAS_VAGA},
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    ativa INTEGER NOT NULL DEFAULT 1,
+    PRIMARY KEY (rota, id)
+);
+CREATE INDEX IF NOT EXISTS vagas_id ON vagas (id);
+CREATE INDEX IF NOT EXISTS vagas_plataforma ON vagas (plataforma);
+CREATE INDEX IF NOT EXISTS vagas_categoria ON vagas (categoria);
+CREATE INDEX IF NOT EXISTS vagas_state ON vagas (state);
+CREATE INDEX IF NOT EXISTS vagas_modalidade ON vagas (modalidade);
+CREATE INDEX IF NOT EXISTS vagas_first_seen ON vagas (first_seen);
+CREATE INDEX IF NOT EXISTS vagas_last_seen ON vagas (last_seen);
+CREATE INDEX IF NOT EXISTS vagas_data_publicacao ON vagas (data_publicacao);
+CREATE TABLE IF NOT EXISTS execucoes (
+    rota TEXT PRIMARY KEY,
+    concluida_em TEXT NOT NULL
+);
+"""
+
+_UPSERT = (
+    f"INSERT INTO vagas (rota, plataforma, categoria, {_COLUNAS_VAGA}, first_seen, last_seen, ativa) "
+    f"VALUES (?, ?, ?, {_MARCADORES_VAGA}, ?, ?, 1) "
+    f"ON CONFLICT (rota, id) DO UPDATE SET {_ATUALIZAR_VAGA}, last_seen = excluded.last_seen, ativa = 1"
+)
+
+# Mediana por categoria via funções de janela (SQLite >= 3.25): só as vagas
+# que já sumiram têm vida fechada.
+_VIDA_MEDIANA = """
+WITH vidas AS (
+    SELECT categoria,
+           julianday(last_seen) - julianday(first_seen) AS dias,
+           ROW_NUMBER() OVER (PARTITION BY categoria ORDER BY julianday(last_seen) - julianday(first_seen)) AS posicao,
+           COUNT(*) OVER (PARTITION BY categoria) AS total
+    FROM vagas
+    WHERE ativa = 0
+)
+SELECT categoria, AVG(dias), MAX(total)
+FROM vidas
+WHERE posicao IN ((total + 1) / 2, (total + 2) / 2)
+GROUP BY categoria
+ORDER BY categoria
+"""
+
+
+def agora_iso(instante: float | None = None) -> str:
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(time.time() if instante is None else instante))
+
+
+def _partes_rota(rota: str) -> tuple[str, str]:
+    """'/vagas/dev/gupy' → ('dev', 'gupy')."""
+    rota_categoria, _, plataforma = rota.rstrip('/').rpartition('/')
+    return rota_categoria.rpartition('/')[2], plataforma
+
+
+class HistoricoVagas:
+    """Arquivo SQLite com first_seen/last_seen de cada vaga de cada rota."""
+
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+        self._lock = threading.Lock()
+        self._conexao = sqlite3.connect(caminho, timeout=30, check_same_thread=False)
+        self._conexao.execute('PRAGMA journal_mode=WAL')
+        self._conexao.execute('PRAGMA synchronous=NORMAL')
+        self._conexao.executescript(_ESQUEMA)
+        self._conexao.commit()
+
+    # ------------------------------------------------------------------
+    # Escrita (runner)
+    # ------------------------------------------------------------------
+
+    def registrar(self, rota: str, vagas: list, visto_em: str | None = None) -> int:
+        """Upsert das vagas de um checkpoint numa única transação. Devolve quantas."""
+        visto_em = visto_em or agora_iso()
+        categoria, plataforma = _partes_rota(rota)
+        linhas = [
+            (rota, plataforma, categoria, *(vaga.get(campo) for campo in CAMPOS_VAGA), visto_em, visto_em)
+            for vaga in vagas
+        ]
+        with self._lock:
+            with self._conexao:
+                self._conexao.executemany(_UPSERT, linhas)
+            self._checkpoint()
+        return len(linhas)
+
+    def encerrar(self, rota: str, desde: str, preservadas: set = frozenset()) -> int:
+        """
+        Fim de um run completo: vagas ativas da rota não vistas desde `desde`
+        (início do run) sumiram, exceto as `preservadas` (IDs que o run não
+        buscou). Devolve quantas foram desativadas.
+        """
+        with self._lock:
+            encerradas = self._desativar(rota, desde, preservadas)
+            self._checkpoint()
+        return encerradas
+
+    def _desativar(self, rota: str, desde: str, preservadas: set) -> int:
+        with self._conexao:
+            self._conexao.execute('CREATE TEMP TABLE IF NOT EXISTS preservadas (id TEXT PRIMARY KEY)')
+            self._conexao.execute('DELETE FROM preservadas')
+            self._conexao.executemany('INSERT OR IGNORE INTO preservadas (id) VALUES (?)',
+                                      ((id_vaga,) for id_vaga in preservadas))
+            cursor = self._conexao.execute(
+                'UPDATE vagas SET ativa = 0 WHERE rota = ? AND ativa = 1 AND last_seen < ? '
+                'AND id NOT IN (SELECT id FROM preservadas)', (rota, desde)
+            )
+            self._conexao.execute(
+                'INSERT INTO execucoes (rota, concluida_em) VALUES (?, ?) '
+                'ON CONFLICT (rota) DO UPDATE SET concluida_em = excluded.concluida_em',
+                (rota, agora_iso()),
+            )
+        return cursor.rowcount
+
+    def _checkpoint(self):
+        """Copia o WAL para o arquivo principal e o zera (leitores ativos só adiam: o próximo tenta de novo)."""
+        self._conexao.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+
+    # ------------------------------------------------------------------
+    # Leitura
+    # ------------------------------------------------------------------
+
+    def sincronizada(self, rota: str) -> bool:
+        """A rota já teve um run completo registrado (ids_ativos espelha a rota)?"""
+        with self._lock:
+            return self._conexao.execute('SELECT 1 FROM execucoes WHERE rota = ?', (rota,)).fetchone() is not None
+
+    def ids_ativos(self, rota: str) -> set:
+        with self._lock:
+            linhas = self._conexao.execute('SELECT id FROM vagas WHERE rota = ? AND ativa = 1', (rota,))
+            return {id_vaga for (id_vaga,) in linhas}
+
+    def novas_desde(self, desde: str) -> list[tuple]:
+        """(plataforma, categoria, quantidade) das vagas com first_seen >= desde."""
+        with self._lock:
+            return self._conexao.execute(
+                'SELECT plataforma, categoria, COUNT(*) FROM vagas WHERE first_seen >= ? '
+                'GROUP BY plataforma, categoria ORDER BY plataforma, categoria', (desde,)
+            ).fetchall()
+
+    def vida_mediana(self) -> list[tuple]:
+        """(categoria, mediana em dias, vagas encerradas) — vida = last_seen - first_seen."""
+        with self._lock:
+            return self._conexao.execute(_VIDA_MEDIANA).fetchall()
+
+    def fechar(self):
+        with self._lock:
+            self._conexao.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--db', default='historico.db', help='arquivo do histórico (SCRAPER_HISTORICO)')
+    consulta = parser.add_mutually_exclusive_group(required=True)
+    consulta.add_argument('--novas-hoje', action='store_true', help='vagas vistas pela primeira vez hoje (UTC)')
+    consulta.add_argument('--vida-mediana', action='store_true', help='vida mediana das vagas encerradas, por categoria')
+    args = parser.parse_args()
+
+    historico = HistoricoVagas(args.db)
+    inicio = time.perf_counter()
+    if args.novas_hoje:
+        linhas = historico.novas_desde(time.strftime('%Y-%m-%d', time.gmtime()))
+        duracao = time.perf_counter() - inicio
+        print(f"{sum(total for *_, total in linhas)} vagas novas hoje ({duracao * 1000:.1f} ms)")
+        for plataforma, categoria, total in linhas:
+            print(f"  {categoria}/{plataforma}: {total}")
+    else:
+        linhas = historico.vida_mediana()
+        duracao = time.perf_counter() - inicio
+        print(f"Vida mediana das vagas encerradas ({duracao * 1000:.1f} ms)")
+        for categoria, dias, total in linhas:
+            print(f"  {categoria}: {dias:.1f} dias ({total} vagas)")
+    historico.fechar()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,279 @@
+# pipeline/journal.py
+"""
+Diário de execução — permite retomar um run interrompido.
+
+O workflow LinkedIn DEV leva ~2h40 e roda perto do limite de 6h do GitHub
+Actions. Sem diário, um timeout/crash recomeça da keyword 1. Com ele, cada
+combinação (palavra, modalidade) concluída fica registrada em disco junto
+com as vagas que produziu; o próximo run (restart manual ou o próximo cron)
+pula as combinações concluídas e recarrega os resultados daqui.
+
+Formato: JSON Lines append-only, um arquivo por execução em
+`<diretorio>/<rota>/<inicio>.jsonl`:
+
+    {"v": {...vaga...}}                          ← cada vaga, uma única vez
+    {"c": ["React", "remoto"], "ids": [...], "s": 41.2}  ← combinação concluída (+ duração)
+    {"fim": 1760000000.0}                        ← execução terminou
+
+As linhas de uma combinação (vagas novas + "c") saem num único write(),
+então um crash só pode deixar a ÚLTIMA linha pela metade. Na abertura, uma
+linha final inválida é descartada e o arquivo é truncado antes do próximo
+append. A cada _COMPACTAR_A_CADA combinações o arquivo é reescrito
+(vagas órfãs de uma combinação interrompida saem, ordem canônica).
+
+Retomada: abrir() reutiliza o diário mais recente da rota que não tem
+"fim" e é mais novo que _IDADE_MAXIMA_RETOMADA; senão cria um novo.
+Diários finalizados ficam até _DIAS_RETENCAO dias (histórico de yield):
+historico() devolve as combinações de cada um, sem carregar as vagas, para
+o planejador de buscas (pipeline.planejador); vagas_salvas() recupera dos
+diários a versão mais recente de vagas pelo ID (as das combinações que o
+plano pulou continuam no modelo de leitura e no índice de duplicatas).
+"""
+import json
+import logging
+import os
+import re
+import threading
+import time
+from pathlib import Path
+
+from scrapers.vaga import Vaga, vaga_para_json
+
+logger = logging.getLogger(__name__)
+
+_IDADE_MAXIMA_RETOMADA = 36 * 3600
+_DIAS_RETENCAO = 30
+_COMPACTAR_A_CADA = 100
+
+# Início de uma linha de vaga: {"v":{"id":"..." — id é o primeiro campo de Vaga.para_json
+_ID_LINHA_VAGA = re.compile(rb'\{"v":\{"id":("(?:[^"\\]|\\.)*")')
+
+
+def _slug_rota(rota: str) -> str:
+    """'/vagas/dev/linkedin' → 'vagas-dev-linkedin'."""
+    return re.sub(r'[^A-Za-z0-9_-]+', '-', rota).strip('-')
+
+
+def _dumps(objeto) -> str:
+    return json.dumps(objeto, ensure_ascii=False, separators=(',', ':'))
+
+
+def _linha_vaga(vaga) -> str:
+    """{"v": {...}} serializado direto do registro, sem dict intermediário."""
+    return '{"v":' + vaga_para_json(vaga) + '}'
+
+
+class DiarioExecucao:
+    """Registro append-only das combinações concluídas de uma rota."""
+
+    def __init__(self, caminho: Path):
+        self.caminho = caminho
+        self._vagas: dict[str, Vaga] = {}
+        self._combinacoes: dict[tuple, list] = {}
+        self._segundos: dict[tuple, float] = {}
+        self.finalizado = False
+        self._desde_compactacao = 0
+        self._lock = threading.Lock()
+
+        if caminho.exists():
+            self._carregar()
+
+    # ------------------------------------------------------------------
+    # Abertura / retomada
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def abrir(cls, diretorio: str, rota: str) -> 'DiarioExecucao':
+        """Retoma o diário inacabado mais recente da rota ou cria um novo."""
+        pasta = Path(diretorio) / _slug_rota(rota)
+        pasta.mkdir(parents=True, exist_ok=True)
+        cls._limpar_antigos(pasta)
+
+        agora = time.time()
+        for caminho in sorted(pasta.glob('*.jsonl'), reverse=True):
+            if agora - caminho.stat().st_mtime > _IDADE_MAXIMA_RETOMADA:
+                break
+            diario = cls(caminho)
+            if not diario.finalizado:
+                logger.info(
+                    f"[DIÁRIO] Retomando '{caminho.name}': {len(diario._combinacoes)} combinações "
+                    f"e {len(diario._vagas)} vagas já concluídas"
+                )
+                return diario
+
+        nome = time.strftime('%Y-%m-%dT%H%M%S', time.gmtime(agora)) + '.jsonl'
+        logger.info(f"[DIÁRIO] Novo diário de execução: {pasta / nome}")
+        return cls(pasta / nome)
+
+    @staticmethod
+    def historico(diretorio: str, rota: str) -> list[dict]:
+        """
+        Combinações de cada execução finalizada da rota, da mais antiga para a
+        mais nova: [{(palavra, modalidade): {'ids': [...], 's': segundos | None}}].
+        Linhas de vaga são puladas sem parse.
+        """
+        pasta = Path(diretorio) / _slug_rota(rota)
+        execucoes = []
+        for caminho in sorted(pasta.glob('*.jsonl')):
+            combinacoes = {}
+            finalizado = False
+            with open(caminho, 'rb') as arquivo:
+                for linha in arquivo:
+                    if linha.startswith(b'{"v":') or not linha.strip():
+                        continue
+                    try:
+                        registro = json.loads(linha)
+                    except ValueError:
+                        continue
+                    if 'c' in registro:
+                        combinacoes[tuple(registro['c'])] = {'ids': registro['ids'], 's': registro.get('s')}
+                    elif 'fim' in registro:
+                        finalizado = True
+            if finalizado and combinacoes:
+                execucoes.append(combinacoes)
+        return execucoes
+
+    @staticmethod
+    def vagas_salvas(diretorio: str, rota: str, ids: set) -> list[Vaga]:
+        """
+        Vagas com os `ids` pedidos, na versão do diário mais recente da rota
+        que as tem. Só as linhas de vaga com ID pedido são decodificadas;
+        IDs que nenhum diário guarda ficam de fora.
+        """
+        pasta = Path(diretorio) / _slug_rota(rota)
+        encontradas: dict[str, Vaga] = {}
+        for caminho in sorted(pasta.glob('*.jsonl'), reverse=True):
+            if len(encontradas) == len(ids):
+                break
+            with open(caminho, 'rb') as arquivo:
+                for linha in arquivo:
+                    inicio = _ID_LINHA_VAGA.match(linha)
+                    if not inicio:
+                        continue
+                    try:
+                        id_vaga = json.loads(inicio.group(1))
+                        if id_vaga in ids and id_vaga not in encontradas:
+                            encontradas[id_vaga] = Vaga.de_dict(json.loads(linha)['v'])
+                    except ValueError:
+                        continue
+        return list(encontradas.values())
+
+    @staticmethod
+    def _limpar_antigos(pasta: Path):
+        limite = time.time() - _DIAS_RETENCAO * 86400
+        for caminho in pasta.glob('*.jsonl'):
+            if caminho.stat().st_mtime < limite:
+                caminho.unlink(missing_ok=True)
+
+    def _carregar(self):
+        """Lê o arquivo tolerando (e truncando) uma última linha parcial."""
+        with open(self.caminho, 'rb') as arquivo:
+            linhas = arquivo.read().split(b'\n')
+
+        bytes_validos = 0
+        for numero, linha in enumerate(linhas):
+            if not linha.strip():
+                bytes_validos += len(linha) + 1
+                continue
+            try:
+                registro = json.loads(linha)
+            except ValueError:
+                if numero >= len(linhas) - 2:
+                    logger.warning(f"[DIÁRIO] Última linha incompleta em '{self.caminho.name}' — descartada")
+                    break
+                logger.warning(f"[DIÁRIO] Linha {numero + 1} inválida em '{self.caminho.name}' — ignorada")
+                bytes_validos += len(linha) + 1
+                continue
+
+            bytes_validos += len(linha) + 1
+            self._aplicar(registro)
+
+        tamanho = self.caminho.stat().st_size
+        if bytes_validos < tamanho:
+            with open(self.caminho, 'r+b') as arquivo:
+                arquivo.truncate(bytes_validos)
+
+    def _aplicar(self, registro: dict):
+        if 'v' in registro:
+            vaga = Vaga.de_dict(registro['v'])
+            self._vagas[vaga.id] = vaga
+        elif 'c' in registro:
+            self._combinacoes[tuple(registro['c'])] = registro['ids']
+            if registro.get('s') is not None:
+                self._segundos[tuple(registro['c'])] = registro['s']
+        elif 'fim' in registro:
+            self.finalizado = True
+
+    # ------------------------------------------------------------------
+    # Consulta / registro
+    # ------------------------------------------------------------------
+
+    def vagas_da_combinacao(self, palavra: str, modalidade: str) -> list | None:
+        """
+        Vagas de uma combinação já concluída (na ordem original) ou None.
+        Combinações registradas sem vagas também dão None: o protocolo não
+        distingue "nenhuma vaga" de falha, então elas são refeitas no restart
+        (o registro vazio só serve ao histórico de yield).
+        """
+        with self._lock:
+            ids = self._combinacoes.get((palavra, modalidade))
+            if not ids:
+                return None
+            return [self._vagas[id_vaga] for id_vaga in ids if id_vaga in self._vagas]
+
+    def registrar(self, palavra: str, modalidade: str, vagas: list, segundos: float | None = None):
+        """Marca a combinação como concluída (um único write por combinação)."""
+        with self._lock:
+            linhas = []
+            for vaga in vagas:
+                if vaga['id'] not in self._vagas:
+                    self._vagas[vaga['id']] = vaga
+                    linhas.append(_linha_vaga(vaga))
+
+            combinacao = (palavra, modalidade)
+            self._combinacoes[combinacao] = [vaga['id'] for vaga in vagas]
+            if segundos is not None:
+                self._segundos[combinacao] = round(segundos, 1)
+            linhas.append(self._linha_combinacao(combinacao))
+
+            self._anexar(linhas)
+            self._desde_compactacao += 1
+            if self._desde_compactacao >= _COMPACTAR_A_CADA:
+                self._compactar()
+
+    def finalizar(self):
+        """Execução concluída: o próximo run começa um diário novo."""
+        with self._lock:
+            self._compactar()
+            self._anexar([_dumps({'fim': time.time()})])
+            self.finalizado = True
+
+    def _anexar(self, linhas: list):
+        with open(self.caminho, 'a', encoding='utf-8') as arquivo:
+            arquivo.write('\n'.join(linhas) + '\n')
+            arquivo.flush()
+            os.fsync(arquivo.fileno())
+
+    def _compactar(self):
+        """Reescreve o diário só com vagas referenciadas, cada uma uma vez."""
+        referenciadas = {id_vaga for ids in self._combinacoes.values() for id_vaga in ids}
+        linhas = [_linha_vaga(vaga) for id_vaga, vaga in self._vagas.items() if id_vaga in referenciadas]
+        linhas.extend(self._linha_combinacao(combinacao) for combinacao in self._combinacoes)
+
+        temporario = self.caminho.with_suffix('.tmp')
+        with open(temporario, 'w', encoding='utf-8') as arquivo:
+            arquivo.write('\n'.join(linhas) + '\n' if linhas else '')
+            arquivo.flush()
+            os.fsync(arquivo.fileno())
+        os.replace(temporario, self.caminho)
+        self._desde_compactacao = 0
+
+    def _linha_combinacao(self, combinacao: tuple) -> str:
+        registro = {'c': list(combinacao), 'ids': self._combinacoes[combinacao]}
+        if combinacao in self._segundos:
+            registro['s'] = self._segundos[combinacao]
+        return _dumps(registro)
+
+    @property
+    def total_combinacoes(self) -> int:
+        return len(self._combinacoes)
@@ -0,0 +1,129 @@
+# pipeline/modelo_leitura.py
+"""
+Modelo de leitura pré-computado — o que os clientes web/mobile baixam.
+
+Hoje o getVagas (myorbita-web/src/services/api.ts) baixa rotas inteiras
+como /vagas/dev/gupy, achata no browser e useFiltrosVagas filtra tudo no
+cliente: primeira pintura e dados móveis crescem com o total de vagas.
+
+Ao fim de cada rota o runner publica, ao lado da rota bruta, uma árvore
+derivada (prefixo configurável, padrão /leitura):
+
+    /leitura/dev/gupy/meta      {total, gerado_em, rota}
+    /leitura/dev/gupy/facetas   {estado: {SP: {valor, total}}, modalidade, contrato, origem, pcd}
+    /leitura/dev/gupy/shards/<dimensao>/<chave>   {id: vaga resumida}
+
+Vaga resumida = só os campos que o card e os filtros usam (CAMPOS_RESUMO);
+link, country, workplace_type e is_remote ficam na rota bruta
+(/vagas/dev/gupy/<id>) para o detalhe.
+
+Cada shard traz os resumos das suas vagas: abrir um filtro custa um get()
+por shard, não um por vaga. Não há lista separada — toda vaga está em
+exatamente um shard de cada dimensão, então a lista completa é
+shards/estado inteiro (um get()). O preço é um resumo por dimensão: a
+árvore fica em ~1,5× a rota bruta (amostra de 20k vagas), contra ~2×
+com uma lista à parte além dos shards.
+
+Valores ausentes ("", "Não informado", "Brasil" — mesmos sentinelas do
+useFiltrosVagas) vão para o shard CHAVE_AUSENTE. Como o filtro do cliente
+é permissivo, filtrar por SP = shard SP + shard _ausente.
+
+Com um índice de duplicatas (pipeline.duplicatas), vagas que são cópia de
+uma vaga canônica de outra plataforma ficam fora da lista, dos shards e das
+facetas (meta.duplicatas_omitidas), e a canônica ganha `alternativas`
+([{origem, link}]).
+"""
+import re
+import time
+from collections import Counter
+
+# Mesmo conjunto de VALORES_AUSENTES do useFiltrosVagas
+VALORES_AUSENTES = frozenset({"", "Não informado", "Brasil"})
+CHAVE_AUSENTE = '_ausente'
+
+# dimensão do shard → campo da vaga
+DIMENSOES = {
+    'estado': 'state',
+    'modalidade': 'modalidade',
+    'contrato': 'tipo_contrato',
+}
+
+CAMPOS_RESUMO = (
+    'titulo', 'empresa', 'modalidade', 'city', 'state', 'tipo_contrato',
+    'data_publicacao', 'prazo_inscricao', 'origem', 'pcd',
+)
+
+# Caracteres proibidos em chaves do Realtime Database
+_CHAVE_INVALIDA = re.compile(r'[.$#\[\]/\x00-\x1f\x7f]')
+
+
+def chave_faceta(valor) -> str:
+    """Valor do campo → chave de shard válida no Firebase."""
+    if not isinstance(valor, str) or valor.strip() in VALORES_AUSENTES:
+        return CHAVE_AUSENTE
+    return _CHAVE_INVALIDA.sub('_', valor.strip())
+
+
+def resumir(vaga) -> dict:
+    """Vaga → dict só com CAMPOS_RESUMO (None omitido, como o Firebase faria)."""
+    resumo = {}
+    for campo in CAMPOS_RESUMO:
+        valor = vaga.get(campo)
+        if valor is not None:
+            resumo[campo] = valor
+    return resumo
+
+
+def construir_modelo_leitura(vagas: list, rota: str, duplicatas=None) -> dict:
+    """
+    Árvore completa do modelo de leitura de uma rota (uma passada sobre as
+    vagas). `duplicatas`: IndiceDuplicatas já registrado com estas vagas.
+    """
+    total = 0
+    shards = {dimensao: {} for dimensao in DIMENSOES}
+    contagens = {dimensao: Counter() for dimensao in (*DIMENSOES, 'origem')}
+    rotulos = {dimensao: {} for dimensao in contagens}
+    pcd = 0
+    omitidas = 0
+
+    for vaga in vagas:
+        resumo = resumir(vaga)
+        if duplicatas is not None:
+            canonica, alternativas = duplicatas.classificar(vaga)
+            if not canonica:
+                omitidas += 1
+                continue
+            if alternativas:
+                resumo['alternativas'] = alternativas
+        total += 1
+
+        for dimensao, campo in (*DIMENSOES.items(), ('origem', 'origem')):
+            valor = vaga.get(campo)
+            chave = chave_faceta(valor)
+            contagens[dimensao][chave] += 1
+            rotulos[dimensao].setdefault(chave, valor.strip() if chave != CHAVE_AUSENTE else '')
+            if dimensao in shards:
+                shards[dimensao].setdefault(chave, {})[vaga['id']] = resumo
+
+        if vaga.get('pcd') is True:
+            pcd += 1
+
+    facetas = {
+        dimensao: {
+            chave: {'valor': rotulos[dimensao][chave], 'total': total}
+            for chave, total in contagem.most_common()
+        }
+        for dimensao, contagem in contagens.items()
+    }
+    facetas['pcd'] = pcd
+
+    return {
+        'meta': {
+            'total': total,
+            'gerado_em': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            'rota': rota,
+            'duplicatas_omitidas': omitidas,
+        },
+        'facetas': facetas,
+        'shards': shards,
+    }
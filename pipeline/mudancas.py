@@ -0,0 +1,137 @@
+# pipeline/mudancas.py
+"""
+Feed de mudanças por execução — novas, alteradas e removidas.
+
+A rota /vagas/dev/gupy espelha a última execução, então um consumidor só
+descobre o que mudou rebaixando e comparando tudo. Ao fim de cada rota o
+runner calcula o diff contra o que havia antes do run e publica, via sink:
+
+    /mudancas/dev/gupy/hashes               {id: hash16}  ← estado atual da rota
+    /mudancas/dev/gupy/execucoes/<inicio>   {inicio, fim, novas, alteradas, removidas, totais}
+
+- novas:     IDs do run que não estavam no run completo anterior
+- alteradas: IDs que já existiam e cujo hash dos campos mudou
+- removidas: IDs do run completo anterior que não voltaram neste run —
+  exceto os preservados pelo planejador (combinações puladas), que
+  continuam na rota e mantêm o hash anterior no índice
+
+A base é o índice de hashes, que só é gravado ao fim de um run completo.
+A rota lida no início (ids_firebase) não serve: depois de um crash ela já
+tem as vagas que a tentativa interrompida publicou, e essas nunca sairiam
+como novas; se a leitura falha, tudo sairia como novo. ids_firebase só é
+usado quando ainda não existe índice (primeiro run com o feed).
+
+O hash é blake2b (8 bytes) do JSON canônico da vaga (Vaga.para_json, ordem
+fixa de campos). Sem índice anterior, nenhuma vaga conta como alterada —
+só entram no índice de hashes.
+
+Só as últimas `manter` execuções ficam; as mais antigas são removidas com
+update(None). Um cliente sincroniza lendo as execuções com chave maior que
+a última que viu e buscando /vagas/.../<id> das novas e alteradas.
+"""
+import hashlib
+import logging
+import time
+
+from scrapers.vaga import vaga_para_json
+
+logger = logging.getLogger(__name__)
+
+
+def hash_vaga(vaga) -> str:
+    return hashlib.blake2b(vaga_para_json(vaga).encode('utf-8'), digest_size=8).hexdigest()
+
+
+def calcular_mudancas(vagas: list, ids_existentes: set, hashes_anteriores: dict | None,
+                      preservados: set = frozenset()) -> dict:
+    """
+    Diff do run contra o run completo anterior (`hashes_anteriores`; None =
+    sem índice, a base passa a ser `ids_existentes`). `hashes` traz o hash
+    de cada vaga do run e, com o hash anterior, as `preservados` ausentes.
+    """
+    hashes = {vaga['id']: hash_vaga(vaga) for vaga in vagas}
+    anteriores = hashes_anteriores or {}
+    base = ids_existentes if hashes_anteriores is None else anteriores.keys()
+    novas = [id_vaga for id_vaga in hashes if id_vaga not in base]
+    alteradas = [
+        id_vaga for id_vaga, hash_atual in hashes.items()
+        if anteriores.get(id_vaga) not in (None, hash_atual)
+    ]
+    removidas = sorted(set(base) - hashes.keys() - preservados)
+    hashes.update({
+        id_vaga: anteriores[id_vaga] for id_vaga in preservados
+        if id_vaga in anteriores and id_vaga not in hashes
+    })
+    return {'novas': novas, 'alteradas': alteradas, 'removidas': removidas, 'hashes': hashes}
+
+
+class FeedMudancas:
+    """Changelog de uma rota: índice de hashes + últimas N execuções."""
+
+    def __init__(self, sink, rota_feed: str, manter: int = 30):
+        self.sink = sink
+        self.rota_feed = rota_feed.rstrip('/')
+        self.manter = manter
+        self.inicio = time.time()
+        self.hashes_anteriores: dict | None = None  # None = sem índice (ou leitura falhou)
+
+    @property
+    def rota_hashes(self) -> str:
+        return f"{self.rota_feed}/hashes"
+
+    @property
+    def rota_execucoes(self) -> str:
+        return f"{self.rota_feed}/execucoes"
+
+    def carregar(self):
+        """Lê o índice de hashes do run completo anterior (antes do scraping)."""
+        try:
+            self.hashes_anteriores = self.sink.obter(self.rota_hashes)
+        except Exception as e:
+            logger.warning(f"Falha ao carregar hashes de '{self.rota_hashes}': {e} — "
+                           f"base do feed = rota lida no início, alteradas não serão detectadas")
+            self.hashes_anteriores = None
+
+    def calcular(self, vagas: list, ids_existentes: set, preservados: set = frozenset()) -> dict:
+        return calcular_mudancas(vagas, ids_existentes, self.hashes_anteriores, preservados)
+
+    def publicar(self, mudancas: dict):
+        """Grava a execução, atualiza o índice de hashes (delta) e poda execuções antigas."""
+        chave = time.strftime('%Y%m%dT%H%M%SZ', time.gmtime(self.inicio))
+        registro = {
+            'inicio': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(self.inicio)),
+            'fim': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            'novas': mudancas['novas'],
+            'alteradas': mudancas['alteradas'],
+            'removidas': mudancas['removidas'],
+            'totais': {
+                'vagas': len(mudancas['hashes']),
+                'novas': len(mudancas['novas']),
+                'alteradas': len(mudancas['alteradas']),
+                'removidas': len(mudancas['removidas']),
+            },
+        }
+
+        anteriores = self.hashes_anteriores or {}
+        delta_hashes = {
+            id_vaga: hash_atual for id_vaga, hash_atual in mudancas['hashes'].items()
+            if anteriores.get(id_vaga) != hash_atual
+        }
+        delta_hashes.update({
+            id_vaga: None for id_vaga in anteriores.keys() - mudancas['hashes'].keys()
+        })
+
+        self.sink.update(self.rota_execucoes, {chave: registro})
+        if delta_hashes:
+            self.sink.update(self.rota_hashes, delta_hashes)
+        self.hashes_anteriores = dict(mudancas['hashes'])
+
+        antigas = sorted(self.sink.ids(self.rota_execucoes))[:-self.manter] if self.manter > 0 else []
+        if antigas:
+            self.sink.update(self.rota_execucoes, {execucao: None for execucao in antigas})
+
+        logger.info(
+            f"[{self.sink.nome}]: Feed '{self.rota_execucoes}/{chave}' — {len(mudancas['novas'])} novas, "
+            f"{len(mudancas['alteradas'])} alteradas, {len(mudancas['removidas'])} removidas"
+            + (f" ({len(antigas)} execuções antigas podadas)" if antigas else "")
+        )
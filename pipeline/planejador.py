@@ -0,0 +1,268 @@
+# pipeline/planejador.py
+"""
+Planejador de buscas — poda combinações palavra × modalidade de baixo yield.
+
+queries/tecnologia_linkedin.json tem 87 palavras × 3 modalidades, e muitas
+palavras são quase subconjuntos umas das outras ("Advogado" / "Advogado
+Júnior"): filtrar_duplicadas joga fora boa parte do que foi buscado, e no
+LinkedIn cada combinação custa minutos de pausas.
+
+O histórico vem dos diários finalizados da rota (DiarioExecucao.historico):
+para cada execução, os IDs que cada combinação encontrou e quanto tempo
+levou. Com isso:
+
+1. Combinações sem histórico, ou fora das últimas `rodar_a_cada`
+   execuções, entram primeiro e consomem orçamento (exploração — é assim
+   que o yield de uma combinação pulada é reavaliado, ou seja, ela roda
+   com frequência menor em vez de sumir).
+2. As demais entram por guloso de cobertura: a cada passo, a combinação
+   com mais IDs ainda não cobertos por requisição (média por execução),
+   até o orçamento de requisições acabar. Cobertura é submodular, então
+   o guloso preguiçoso (heap) dá o mesmo resultado do guloso ingênuo.
+3. O que sobra é pulado. A ordem final é a do guloso: alto yield primeiro,
+   então um timeout perde as combinações menos valiosas.
+
+Pular uma combinação reduz a descoberta, não apaga vagas: ids_preservados()
+são os IDs que cada combinação pulada achou na execução mais recente em
+que rodou. O runner os tira do passe de remoção da rota, do feed e do
+encerramento no histórico — ficam no ar até a combinação voltar a rodar.
+
+Custo de uma combinação = requisições estimadas pelas vagas encontradas
+(ceil(vagas / vagas_por_requisicao), mínimo 1) e segundos medidos no
+diário. relatorio() compara o plano com rodar tudo: cobertura esperada
+(fração dos IDs únicos das execuções passadas que o plano teria achado)
+contra requisições e tempo economizados.
+
+Uso direto (só relatório, sem scraping):
+    python -m pipeline.planejador --queries queries/tecnologia_linkedin.json \\
+        --rota /vagas/dev/linkedin --orcamento 150
+"""
+import argparse
+import heapq
+import json
+import math
+import statistics
+
+from pipeline.journal import DiarioExecucao
+
+
+class PlanejadorBuscas:
+    """Escolhe e ordena combinações a partir do histórico de execuções."""
+
+    def __init__(self, historico: list[dict], orcamento_requisicoes: int,
+                 vagas_por_requisicao: int, rodar_a_cada: int = 7):
+        self.historico = historico
+        self.orcamento = orcamento_requisicoes
+        self.vagas_por_requisicao = max(1, vagas_por_requisicao)
+        self.rodar_a_cada = rodar_a_cada
+        self._relatorio: dict = {}
+        self._puladas: list[tuple] = []
+
+    # ------------------------------------------------------------------
+    # Estatísticas por combinação
+    # ------------------------------------------------------------------
+
+    def _requisicoes(self, ids: list) -> int:
+        return max(1, math.ceil(len(ids) / self.vagas_por_requisicao))
+
+    def _custos(self, combinacao: tuple) -> tuple[float, float | None]:
+        """(requisições médias, segundos médios ou None) da combinação no histórico."""
+        registros = [execucao[combinacao] for execucao in self.historico if combinacao in execucao]
+        if not registros:
+            return 1.0, None
+        requisicoes = statistics.fmean(self._requisicoes(registro['ids']) for registro in registros)
+        segundos = [registro['s'] for registro in registros if registro.get('s') is not None]
+        return requisicoes, statistics.fmean(segundos) if segundos else None
+
+    def _segundos_por_requisicao(self) -> float | None:
+        pares = [
+            (registro['s'], self._requisicoes(registro['ids']))
+            for execucao in self.historico for registro in execucao.values()
+            if registro.get('s') is not None
+        ]
+        if not pares:
+            return None
+        return sum(segundos for segundos, _ in pares) / sum(requisicoes for _, requisicoes in pares)
+
+    # ------------------------------------------------------------------
+    # Plano
+    # ------------------------------------------------------------------
+
+    def planejar(self, combinacoes: list[tuple]) -> list[tuple]:
+        """Combinações a buscar, na ordem de execução."""
+        # rodar_a_cada <= 0: só combinações nunca vistas são forçadas
+        recentes = self.historico[-self.rodar_a_cada:] if self.rodar_a_cada > 0 else self.historico
+        custos = {combinacao: self._custos(combinacao) for combinacao in combinacoes}
+
+        forcadas = [
+            combinacao for combinacao in combinacoes
+            if not any(combinacao in execucao for execucao in recentes)
+        ]
+        conjunto_forcadas = set(forcadas)
+        candidatas = [combinacao for combinacao in combinacoes if combinacao not in conjunto_forcadas]
+
+        # IDs já cobertos por execução histórica (pelas forçadas e pelas escolhidas)
+        cobertos = [set() for _ in self.historico]
+        for combinacao in forcadas:
+            self._cobrir(combinacao, cobertos)
+
+        gasto = sum(custos[combinacao][0] for combinacao in forcadas)
+        escolhidas = []
+        heap = [(-self._ganho(combinacao, cobertos) / custos[combinacao][0], indice, combinacao)
+                for indice, combinacao in enumerate(candidatas)]
+        heapq.heapify(heap)
+
+        while heap and gasto < self.orcamento:
+            _, indice, combinacao = heapq.heappop(heap)
+            razao = self._ganho(combinacao, cobertos) / custos[combinacao][0]
+            if heap and razao < -heap[0][0]:
+                heapq.heappush(heap, (-razao, indice, combinacao))  # ganho ficou velho: reavalia
+                continue
+            if gasto + custos[combinacao][0] > self.orcamento:
+                continue
+            escolhidas.append(combinacao)
+            gasto += custos[combinacao][0]
+            self._cobrir(combinacao, cobertos)
+
+        plano = forcadas + escolhidas
+        selecionadas = set(plano)
+        self._puladas = [combinacao for combinacao in combinacoes if combinacao not in selecionadas]
+        self._relatorio = self._montar_relatorio(combinacoes, plano, forcadas, custos)
+        return plano
+
+    def _ganho(self, combinacao: tuple, cobertos: list[set]) -> float:
+        """IDs novos médios por execução em que a combinação rodou."""
+        ganhos = [
+            len(set(execucao[combinacao]['ids']) - cobertos[indice])
+            for indice, execucao in enumerate(self.historico) if combinacao in execucao
+        ]
+        return statistics.fmean(ganhos) if ganhos else 0.0
+
+    def _cobrir(self, combinacao: tuple, cobertos: list[set]):
+        for indice, execucao in enumerate(self.historico):
+            if combinacao in execucao:
+                cobertos[indice].update(execucao[combinacao]['ids'])
+
+    # ------------------------------------------------------------------
+    # Relatório
+    # ------------------------------------------------------------------
+
+    def _cobertura(self, combinacoes: list[tuple], plano: list[tuple]) -> float | None:
+        """Fração média dos IDs únicos de cada execução que o plano teria encontrado."""
+        atuais = set(combinacoes)
+        selecionadas = set(plano)
+        fracoes = []
+        for execucao in self.historico:
+            todos = {
+                id_vaga for combinacao, registro in execucao.items()
+                if combinacao in atuais for id_vaga in registro['ids']
+            }
+            if not todos:
+                continue
+            achados = {
+                id_vaga for combinacao, registro in execucao.items()
+                if combinacao in selecionadas for id_vaga in registro['ids']
+            }
+            fracoes.append(len(achados) / len(todos))
+        return statistics.fmean(fracoes) if fracoes else None
+
+    def _montar_relatorio(self, combinacoes: list, plano: list, forcadas: list, custos: dict) -> dict:
+        segundos_por_requisicao = self._segundos_por_requisicao()
+
+        def segundos(lista):
+            total = 0.0
+            for combinacao in lista:
+                requisicoes, medidos = custos[combinacao]
+                estimados = medidos if medidos is not None else (
+                    requisicoes * segundos_por_requisicao if segundos_por_requisicao else 0.0
+                )
+                total += estimados
+            return total
+
+        requisicoes_total = sum(custos[combinacao][0] for combinacao in combinacoes)
+        requisicoes_plano = sum(custos[combinacao][0] for combinacao in plano)
+        cobertura = self._cobertura(combinacoes, plano)
+        return {
+            'execucoes_no_historico': len(self.historico),
+            'orcamento_requisicoes': self.orcamento,
+            'combinacoes': len(combinacoes),
+            'selecionadas': len(plano),
+            'exploracao': len(forcadas),
+            'puladas': [list(combinacao) for combinacao in self._puladas],
+            'requisicoes_estimadas': {'todas': round(requisicoes_total), 'plano': round(requisicoes_plano)},
+            'segundos_estimados': {'todas': round(segundos(combinacoes)), 'plano': round(segundos(plano))},
+            'cobertura_esperada': round(cobertura, 4) if cobertura is not None else None,
+        }
+
+    def relatorio(self) -> dict:
+        return self._relatorio
+
+    def ids_preservados(self) -> set:
+        """IDs das combinações puladas, da execução mais recente em que cada uma rodou."""
+        preservados = set()
+        for combinacao in self._puladas:
+            registro = next(
+                (execucao[combinacao] for execucao in reversed(self.historico) if combinacao in execucao), None
+            )
+            if registro:
+                preservados.update(registro['ids'])
+        return preservados
+
+    def resumo(self) -> str:
+        r = self._relatorio
+        if not r:
+            return "sem plano"
+        cobertura = r['cobertura_esperada']
+        perda = f"{(1 - cobertura) * 100:.1f}%" if cobertura is not None else "?"
+        economia = r['segundos_estimados']['todas'] - r['segundos_estimados']['plano']
+        return (
+            f"{r['selecionadas']}/{r['combinacoes']} combinações ({r['exploracao']} em exploração), "
+            f"~{r['requisicoes_estimadas']['plano']}/{r['requisicoes_estimadas']['todas']} requisições — "
+            f"perda de cobertura esperada {perda}, ~{economia / 60:.0f} min economizados "
+            f"({r['execucoes_no_historico']} execuções no histórico)"
+        )
+
+
+def planejar_parametros(parametros: dict, historico: list[dict], orcamento_requisicoes: int,
+                        vagas_por_requisicao: int, rodar_a_cada: int = 7) -> PlanejadorBuscas:
+    """
+    Aplica o plano em parametros['combinacoes'] e os IDs das puladas em
+    parametros['ids_preservados'] (lidos por executar_buscas e pelo runner).
+    """
+    combinacoes = [
+        (palavra, modalidade)
+        for palavra in parametros['palavras_chave']
+        for modalidade in parametros['modalidades']
+    ]
+    planejador = PlanejadorBuscas(historico, orcamento_requisicoes, vagas_por_requisicao, rodar_a_cada)
+    parametros['combinacoes'] = planejador.planejar(combinacoes)
+    parametros['ids_preservados'] = planejador.ids_preservados()
+    return planejador
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--queries', required=True, help='JSON de queries da categoria')
+    parser.add_argument('--rota', required=True, help='rota Firebase da categoria (ex: /vagas/dev/linkedin)')
+    parser.add_argument('--orcamento', type=int, required=True, help='requisições por execução')
+    parser.add_argument('--journal', default='.journal', help='diretório dos diários (SCRAPER_JOURNAL_DIR)')
+    parser.add_argument('--vagas-por-requisicao', type=int, default=25)
+    parser.add_argument('--rodar-a-cada', type=int, default=7)
+    args = parser.parse_args()
+
+    with open(args.queries, 'r', encoding='utf-8') as arquivo:
+        config = json.load(arquivo)
+    parametros = {
+        'palavras_chave': config['filtros_de_busca']['palavras_chave'],
+        'modalidades': config['filtros_de_busca']['modalidades'],
+    }
+    planejador = planejar_parametros(
+        parametros, DiarioExecucao.historico(args.journal, args.rota),
+        args.orcamento, args.vagas_por_requisicao, args.rodar_a_cada,
+    )
+    print(planejador.resumo())
+    print(json.dumps(planejador.relatorio(), ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,364 @@
+# pipeline/sinks.py
+"""
+Destinos de publicação das vagas (sinks) — Firebase ou substitutos locais.
+
+O runner só precisa de quatro operações sobre uma rota, as mesmas do
+Realtime Database que ele já usava:
+
+    ids(rota)              leitura shallow: só as chaves filhas
+    obter(rota)            leitura completa (None se a rota não existe)
+    set(rota, valor)       substitui a rota inteira (modo 'snapshot')
+    update(rota, payload)  multi-path update; valor None remove a chave
+
+Implementações:
+- SinkFirebase      o Realtime Database real (firebase_admin.db)
+- SinkArquivoJSON   emulador em arquivo: uma árvore JSON com a mesma
+                    semântica de set/update/shallow get (caminho None =
+                    só memória). Reescrita atômica a cada operação — mede
+                    bem o custo de checkpoint em rotas grandes.
+- SinkSQLite        uma linha por filho da rota (rota, chave, JSON)
+
+Escolha por configuração: SCRAPER_SINK = firebase (padrão) |
+json:<arquivo> | sqlite:<arquivo>, ou executar(..., sink=...).
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+import firebase_admin
+from firebase_admin import credentials, db, exceptions
+
+logger = logging.getLogger(__name__)
+
+# Chaves por página no fallback paginado de SinkFirebase.ids. Cada página
+# traz as vagas completas (~1-2 KB cada), então ~500 chaves ≈ 1 MB por resposta.
+_TAMANHO_PAGINA_IDS = 500
+
+
+def _segmentos(caminho: str) -> list[str]:
+    """'/vagas/dev/gupy' → ['vagas', 'dev', 'gupy']."""
+    return [parte for parte in caminho.split('/') if parte]
+
+
+def rota_derivada(rota: str, prefixo: str) -> str:
+    """Nó derivado ao lado da rota bruta: ('/vagas/dev/gupy', '/leitura') → '/leitura/dev/gupy'."""
+    return '/'.join([prefixo.rstrip('/')] + _segmentos(rota)[1:])
+
+
+class Sink(ABC):
+    """Contrato mínimo de um destino com semântica de Realtime Database."""
+
+    nome = 'SINK'
+    # Pode ser aberto por vários processos ao mesmo tempo (um por categoria)?
+    multiprocesso_seguro = False
+
+    @abstractmethod
+    def ids(self, rota: str) -> set:
+        """Chaves filhas da rota (leitura shallow)."""
+
+    @abstractmethod
+    def obter(self, rota: str):
+        """Conteúdo completo da rota (None se não existir)."""
+
+    @abstractmethod
+    def set(self, rota: str, valor: dict):
+        """Substitui todo o conteúdo da rota."""
+
+    @abstractmethod
+    def update(self, rota: str, payload: dict):
+        """Multi-path update relativo à rota. Valor None remove a chave."""
+
+    def fechar(self):
+        """Libera recursos (arquivo, conexão). Chamado ao fim do run."""
+
+
+# ============================================================
+# FIREBASE REALTIME DATABASE
+# ============================================================
+def inicializar_firebase():
+    """Inicializa Firebase uma única vez (idempotente)."""
+    if not firebase_admin._apps:
+        cred = credentials.Certificate(os.getenv("FIREBASE_KEY_PATH"))
+        firebase_admin.initialize_app(cred, {
+            'databaseURL': os.getenv("FIREBASE_DB_URL")
+        })
+        logger.info("Conexão com Firebase inicializada com sucesso!")
+
+
+class SinkFirebase(Sink):
+    """Realtime Database via firebase_admin (credenciais em FIREBASE_KEY_PATH/FIREBASE_DB_URL)."""
+
+    nome = 'FIREBASE'
+    multiprocesso_seguro = True
+
+    def __init__(self):
+        inicializar_firebase()
+
+    def ids(self, rota: str) -> set:
+        """
+        Shallow get (valores viram `true`): o payload não cresce com o número
+        de campos por vaga. Se a rota for grande demais para uma única
+        resposta, cai para páginas de chaves ordenadas (_ids_paginados).
+        """
+        ref = db.reference(rota)
+        try:
+            snapshot = ref.get(shallow=True)
+            return set(snapshot.keys()) if isinstance(snapshot, dict) else set()
+        except exceptions.FirebaseError as e:
+            logger.warning(f"Leitura shallow de '{rota}' falhou ({e}) — carregando IDs paginados")
+            return self._ids_paginados(ref)
+
+    @staticmethod
+    def _ids_paginados(ref) -> set:
+        """
+        Fallback para rotas enormes: percorre as chaves em faixas ordenadas
+        (orderBy=$key + startAt + limitToFirst). O RTDB não aceita shallow
+        junto com consultas, então cada página traz as vagas completas: o
+        tráfego é o da rota inteira, só a memória fica limitada a uma página.
+        Páginas pequenas mantêm esse pico baixo; o total baixado vai para o
+        log. Para não pagar esse custo, SCRAPER_HISTORICO_FONTE_IDS=1 tira os
+        IDs do histórico local.
+        """
+        ids = set()
+        ultima_chave = None
+        paginas = 0
+        bytes_baixados = 0
+
+        while True:
+            consulta = ref.order_by_key().limit_to_first(_TAMANHO_PAGINA_IDS + (1 if ultima_chave else 0))
+            if ultima_chave is not None:
+                consulta = consulta.start_at(ultima_chave)
+
+            pagina = consulta.get() or {}
+            paginas += 1
+            bytes_baixados += len(json.dumps(pagina, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+            chaves = [chave for chave in pagina if chave != ultima_chave]
+            del pagina
+
+            ids.update(chaves)
+            if chaves:
+                ultima_chave = chaves[-1]
+            if len(chaves) < _TAMANHO_PAGINA_IDS:
+                logger.warning(
+                    f"IDs paginados de '{ref.path}': {len(ids)} chaves em {paginas} páginas, "
+                    f"~{bytes_baixados / 1_048_576:.1f} MB baixados (vagas completas, não só chaves)"
+                )
+                return ids
+
+    def obter(self, rota: str):
+        return db.reference(rota).get()
+
+    def set(self, rota: str, valor: dict):
+        db.reference(rota).set(valor)
+
+    def update(self, rota: str, payload: dict):
+        db.reference(rota).update(payload)
+
+
+# ============================================================
+# EMULADOR LOCAL — árvore JSON em arquivo
+# ============================================================
+class SinkArquivoJSON(Sink):
+    """
+    Realtime Database de mentira sobre uma árvore JSON.
+
+    Semântica copiada do Firebase: set/update com None removem o nó, nós
+    que ficam vazios somem (o RTDB não guarda objetos vazios), chaves de
+    update podem ser caminhos ('id/campo') e o shallow get só devolve chaves.
+    """
+
+    nome = 'JSON'
+
+    def __init__(self, caminho: str | None = None):
+        self.caminho = Path(caminho) if caminho else None
+        self._arvore: dict = {}
+        self._lock = threading.Lock()
+        if self.caminho and self.caminho.exists():
+            self._arvore = json.loads(self.caminho.read_text(encoding='utf-8') or '{}') or {}
+
+    # --- Leitura -----------------------------------------------------------
+
+    def obter(self, rota: str, shallow: bool = False):
+        """Valor no caminho (None se ausente). shallow: {chave: True | primitivo}."""
+        with self._lock:
+            no = self._arvore
+            for segmento in _segmentos(rota):
+                if not isinstance(no, dict) or segmento not in no:
+                    return None
+                no = no[segmento]
+            if shallow and isinstance(no, dict):
+                return {chave: True if isinstance(valor, dict) else valor for chave, valor in no.items()}
+            return no
+
+    def ids(self, rota: str) -> set:
+        snapshot = self.obter(rota, shallow=True)
+        return set(snapshot.keys()) if isinstance(snapshot, dict) else set()
+
+    # --- Escrita -----------------------------------------------------------
+
+    def set(self, rota: str, valor: dict):
+        with self._lock:
+            self._gravar_no(_segmentos(rota), valor)
+            self._persistir()
+
+    def update(self, rota: str, payload: dict):
+        base = _segmentos(rota)
+        with self._lock:
+            for chave, valor in payload.items():
+                self._gravar_no(base + _segmentos(chave), valor)
+            self._persistir()
+
+    def _gravar_no(self, segmentos: list[str], valor):
+        if not segmentos:
+            self._arvore = valor if isinstance(valor, dict) and valor else {}
+            return
+
+        # Desce criando os pais; guarda o trajeto para podar pais vazios
+        trajeto = []
+        no = self._arvore
+        for segmento in segmentos[:-1]:
+            filho = no.get(segmento)
+            if not isinstance(filho, dict):
+                if valor is None:
+                    return
+                filho = no[segmento] = {}
+            trajeto.append((no, segmento))
+            no = filho
+
+        if valor is None or valor == {}:
+            no.pop(segmentos[-1], None)
+        else:
+            no[segmentos[-1]] = json.loads(json.dumps(valor))  # cópia desacoplada, como no servidor
+
+        for pai, segmento in reversed(trajeto):
+            if pai[segmento]:
+                break
+            del pai[segmento]
+
+    def _persistir(self):
+        if not self.caminho:
+            return
+        self.caminho.parent.mkdir(parents=True, exist_ok=True)
+        temporario = self.caminho.with_suffix(self.caminho.suffix + '.tmp')
+        temporario.write_text(json.dumps(self._arvore, ensure_ascii=False, separators=(',', ':')), encoding='utf-8')
+        os.replace(temporario, self.caminho)
+
+
+# ============================================================
+# SQLITE — uma linha por filho da rota
+# ============================================================
+class SinkSQLite(Sink):
+    """
+    Cada filho direto de uma rota é uma linha (rota, chave, valor JSON).
+    Chaves de update com subcaminho ('id/campo') alteram o JSON do filho.
+    """
+
+    nome = 'SQLITE'
+    multiprocesso_seguro = True  # WAL + busy timeout: escritores de outros processos esperam a vez
+
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+        self._lock = threading.Lock()
+        self._conexao = sqlite3.connect(caminho, timeout=30, check_same_thread=False)
+        self._conexao.execute('PRAGMA journal_mode=WAL')
+        self._conexao.execute('PRAGMA synchronous=NORMAL')
+        self._conexao.execute(
+            'CREATE TABLE IF NOT EXISTS nos ('
+            ' rota TEXT NOT NULL, chave TEXT NOT NULL, valor TEXT NOT NULL,'
+            ' PRIMARY KEY (rota, chave)) WITHOUT ROWID'
+        )
+        self._conexao.commit()
+
+    @staticmethod
+    def _rota(rota: str) -> str:
+        return '/' + '/'.join(_segmentos(rota))
+
+    def ids(self, rota: str) -> set:
+        with self._lock:
+            linhas = self._conexao.execute('SELECT chave FROM nos WHERE rota = ?', (self._rota(rota),))
+            return {chave for (chave,) in linhas}
+
+    def obter(self, rota: str) -> dict | None:
+        """Filhos diretos da rota (não remonta rotas gravadas em níveis mais fundos)."""
+        with self._lock:
+            linhas = self._conexao.execute('SELECT chave, valor FROM nos WHERE rota = ?', (self._rota(rota),))
+            return {chave: json.loads(valor) for chave, valor in linhas} or None
+
+    def set(self, rota: str, valor: dict):
+        rota = self._rota(rota)
+        with self._lock, self._conexao:
+            self._conexao.execute('DELETE FROM nos WHERE rota = ?', (rota,))
+            self._conexao.executemany(
+                'INSERT INTO nos (rota, chave, valor) VALUES (?, ?, ?)',
+                ((rota, chave, json.dumps(filho, ensure_ascii=False))
+                 for chave, filho in (valor or {}).items() if filho is not None),
+            )
+
+    def update(self, rota: str, payload: dict):
+        rota = self._rota(rota)
+        with self._lock, self._conexao:
+            for caminho, valor in payload.items():
+                chave, *subcaminho = _segmentos(caminho)
+                if subcaminho:
+                    valor = self._mesclar(rota, chave, subcaminho, valor)
+                if valor is None:
+                    self._conexao.execute('DELETE FROM nos WHERE rota = ? AND chave = ?', (rota, chave))
+                else:
+                    self._conexao.execute(
+                        'INSERT INTO nos (rota, chave, valor) VALUES (?, ?, ?) '
+                        'ON CONFLICT (rota, chave) DO UPDATE SET valor = excluded.valor',
+                        (rota, chave, json.dumps(valor, ensure_ascii=False)),
+                    )
+
+    def _mesclar(self, rota: str, chave: str, subcaminho: list[str], valor):
+        """Aplica um update de subcaminho no JSON do filho; None se o filho ficou vazio."""
+        linha = self._conexao.execute(
+            'SELECT valor FROM nos WHERE rota = ? AND chave = ?', (rota, chave)
+        ).fetchone()
+        emulador = SinkArquivoJSON()
+        emulador._arvore = {chave: json.loads(linha[0])} if linha else {}
+        emulador._gravar_no([chave, *subcaminho], valor)
+        return emulador._arvore.get(chave)
+
+    def fechar(self):
+        with self._lock:
+            self._conexao.close()
+
+
+# ============================================================
+# ESCOLHA POR CONFIGURAÇÃO
+# ============================================================
+_TIPOS = {'firebase': SinkFirebase, 'json': SinkArquivoJSON, 'sqlite': SinkSQLite}
+
+
+def sink_multiprocesso_seguro(config: str | None = None) -> bool:
+    """O sink configurado (SCRAPER_SINK) aceita um processo por categoria?"""
+    config = config or os.getenv("SCRAPER_SINK", "firebase")
+    tipo = config.partition(':')[0].strip().lower()
+    return tipo in _TIPOS and _TIPOS[tipo].multiprocesso_seguro
+
+
+def criar_sink(config: str | None = None) -> Sink:
+    """
+    'firebase' | 'json:<arquivo>' | 'sqlite:<arquivo>'.
+    Sem argumento, lê SCRAPER_SINK (padrão: firebase).
+    """
+    config = config or os.getenv("SCRAPER_SINK", "firebase")
+    tipo, _, caminho = config.partition(':')
+    tipo = tipo.strip().lower()
+
+    if tipo == 'firebase':
+        return SinkFirebase()
+    if tipo == 'json':
+        sink = SinkArquivoJSON(caminho or 'firebase_local.json')
+    elif tipo == 'sqlite':
+        sink = SinkSQLite(caminho or 'vagas_local.db')
+    else:
+        raise ValueError(f"SCRAPER_SINK inválido: '{config}' (use firebase, json:<arquivo> ou sqlite:<arquivo>)")
+
+    logger.info(f"Publicação local: {sink.nome} em '{caminho or getattr(sink, 'caminho', '')}'")
+    return sink
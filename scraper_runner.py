@@ -3,10 +3,20 @@ scraper_runner.py — Orquestração compartilhada entre todas as plataformas.
 
 Responsabilidade Única: coordenar o fluxo de execução de um scraper qualquer.
 - Configura logging UTF-8 (Windows + Linux)
-- Inicializa Firebase
+- Inicializa o destino (Firebase ou sink local — pipeline.sinks)
 - Carrega queries da categoria (dev/adv)
 - Executa buscas com deduplicação 3 níveis
-- Checkpoint Firebase a cada 10 keywords + envio final completo
+- Publicação incremental no Firebase (delta por checkpoint + limpeza final)
+- Modelo de leitura derivado (shards, facetas, lista resumida) para os clientes
+- Feed de mudanças por execução (novas, alteradas, removidas)
+- Planejador opcional: poda combinações de baixo yield dentro de um orçamento
+- Diário de execução: retoma combinações concluídas após timeout/crash
+- Categorias em processos separados (opcional), métricas mescladas no pai
+- Streaming: scrapers entregam página a página, dedup e publicação por lote
+- Duplicatas entre plataformas: modelo de leitura com uma entrada canônica
+- Escritor assíncrono: checkpoints enfileirados, lotes por tempo/tamanho com retry
+- Arquivo colunar (Parquet) de cada execução, particionado por data/plataforma/categoria
+- Histórico SQLite (first_seen/last_seen por vaga), opcionalmente fonte dos IDs existentes
 - Imprime métricas
 
 Cada main (main_gupy, main_linkedin) importa daqui e só precisa:
@@ -18,14 +28,34 @@ Toda a plumbing fica aqui, DRY ao máximo.
 """
 import json
 import logging
+import logging.handlers
+import multiprocessing
 import os
+import sqlite3
 import sys
 import time
-from typing import Protocol
+import tracemalloc
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+from typing import Callable, Iterator, Protocol
 
-import firebase_admin
 from dotenv import load_dotenv
-from firebase_admin import credentials, db
+
+from pipeline.arquivo_colunar import gravar_execucao
+from pipeline.duplicatas import IndiceDuplicatas
+from pipeline.escritor import EscritorAssincrono
+from pipeline.historico import HistoricoVagas, agora_iso
+from pipeline.journal import DiarioExecucao
+from pipeline.modelo_leitura import construir_modelo_leitura
+from pipeline.mudancas import FeedMudancas
+from pipeline.planejador import planejar_parametros
+from pipeline.sinks import Sink, criar_sink, rota_derivada, sink_multiprocesso_seguro
+from scrapers.base_scraper import BuscaIncompleta
+from scrapers.indice_dedup import IndiceDedup
+from scrapers.metricas import MetricasExecucao
+from scrapers.replay import instrumentar_do_ambiente
+from scrapers.vaga import vaga_para_dict, vaga_para_json
 
 load_dotenv()
 
@@ -76,55 +106,449 @@ class ScraperProtocol(Protocol):
     def buscar_vagas(self, palavra_chave: str, modalidade: str, limite: int) -> list: ...
 
 
-# ============================================================
-# CONFIGURAÇÃO FIREBASE
-# ============================================================
-FIREBASE_KEY_PATH = os.getenv("FIREBASE_KEY_PATH")
-FIREBASE_DB_URL = os.getenv("FIREBASE_DB_URL")
+class ScraperStreamingProtocol(Protocol):
+    """
+    Variante em streaming: entrega as vagas página a página. O runner
+    deduplica e publica cada página assim que ela chega (ver paginas_de).
+    """
+    def buscar_vagas_paginas(self, palavra_chave: str, modalidade: str, limite: int) -> Iterator[list]: ...
 
 
-def inicializar_firebase():
-    """Inicializa Firebase uma única vez (idempotente)."""
-    if not firebase_admin._apps:
-        cred = credentials.Certificate(FIREBASE_KEY_PATH)
-        firebase_admin.initialize_app(cred, {
-            'databaseURL': FIREBASE_DB_URL
-        })
-        logger.info("Conexão com Firebase inicializada com sucesso!")
+def paginas_de(scraper: ScraperProtocol | ScraperStreamingProtocol, palavra_chave: str,
+               modalidade: str, limite: int) -> Iterator[list]:
+    """Páginas da busca — adaptador para scrapers que só devolvem a lista completa."""
+    buscar_paginas = getattr(scraper, 'buscar_vagas_paginas', None)
+    if buscar_paginas is not None:
+        return buscar_paginas(palavra_chave, modalidade, limite)
+    return iter([scraper.buscar_vagas(palavra_chave, modalidade, limite)])
 
 
-def carregar_ids_firebase(rota: str) -> set:
+# ============================================================
+# CONFIGURAÇÃO FIREBASE
+# ============================================================
+# Credenciais (FIREBASE_KEY_PATH / FIREBASE_DB_URL) e a escolha do destino
+# (SCRAPER_SINK = firebase | json:<arquivo> | sqlite:<arquivo>) ficam em
+# pipeline.sinks.
+
+# 'delta' (padrão) envia só o que mudou por checkpoint; 'snapshot' mantém
+# o ref.set() completo legado.
+MODO_PUBLICACAO = os.getenv("FIREBASE_MODO_PUBLICACAO", "delta")
+
+# Diário de execução (retomada após timeout/crash). Vazio desliga.
+JOURNAL_DIR = os.getenv("SCRAPER_JOURNAL_DIR", ".journal")
+
+# Relatório JSON de desempenho do run (ao lado do scraper.log, vai junto no
+# artifact do GitHub Actions). Vazio desliga.
+RELATORIO_PATH = os.getenv("SCRAPER_RELATORIO", "scraper_relatorio.json")
+
+# Prefixo do modelo de leitura (/vagas/dev/gupy → /leitura/dev/gupy). Vazio desliga.
+MODELO_LEITURA_PREFIXO = os.getenv("SCRAPER_MODELO_LEITURA", "/leitura")
+
+# Feed de mudanças (/vagas/dev/gupy → /mudancas/dev/gupy) e quantas execuções
+# ele guarda. Prefixo vazio desliga.
+MUDANCAS_PREFIXO = os.getenv("SCRAPER_MUDANCAS", "/mudancas")
+MUDANCAS_MANTER = int(os.getenv("SCRAPER_MUDANCAS_MANTER", "30"))
+
+# Índice de duplicatas entre plataformas da mesma categoria
+# (/vagas/dev/gupy → /duplicatas/dev) e a janela de datas em dias. Vazio desliga.
+DUPLICATAS_PREFIXO = os.getenv("SCRAPER_DUPLICATAS", "/duplicatas")
+DUPLICATAS_JANELA_DIAS = int(os.getenv("SCRAPER_DUPLICATAS_JANELA_DIAS", "7"))
+
+# Arquivo colunar das execuções (pipeline.arquivo_colunar): Parquet (ou JSON
+# gzip colunar sem pyarrow) particionado por data/plataforma/categoria. Vazio desliga.
+ARQUIVO_DIR = os.getenv("SCRAPER_ARQUIVO_DIR", ".arquivo")
+
+# Histórico SQLite das vagas (pipeline.historico): first_seen/last_seen por
+# vaga, upsert a cada checkpoint. Vazio desliga. FONTE_IDS=1 lê os IDs
+# existentes daqui (rotas com um run completo registrado) em vez do Firebase.
+HISTORICO_PATH = os.getenv("SCRAPER_HISTORICO", "historico.db")
+HISTORICO_FONTE_IDS = os.getenv("SCRAPER_HISTORICO_FONTE_IDS", "0") == "1"
+
+# Planejador de buscas (pipeline.planejador): orçamento de requisições por
+# categoria, decidido pelo yield dos diários anteriores. 0 desliga (todas as
+# combinações, na ordem do JSON). Requer SCRAPER_JOURNAL_DIR.
+PLANO_ORCAMENTO = int(os.getenv("SCRAPER_PLANO_ORCAMENTO", "0"))
+PLANO_RODAR_A_CADA = int(os.getenv("SCRAPER_PLANO_RODAR_A_CADA", "7"))
+
+# Parada da paginação por yield (scrapers/indice_dedup.py): uma página com
+# fração de vagas novas abaixo do limiar encerra a query. 0 desliga.
+# CONTA_EXISTENTES=1 trata vagas já no Firebase como vistas (mais agressivo).
+PAGINACAO_LIMIAR = float(os.getenv("SCRAPER_PAGINACAO_LIMIAR", "0"))
+PAGINACAO_CONTA_EXISTENTES = os.getenv("SCRAPER_PAGINACAO_CONTA_EXISTENTES", "0") == "1"
+
+# Publicação em streaming (modo delta): um lote com pelo menos esta
+# quantidade de vagas pendentes é enviado no meio da query, sem esperar as
+# páginas seguintes. 0 publica só ao fim de cada combinação.
+PUBLICACAO_LOTE = int(os.getenv("SCRAPER_PUBLICACAO_LOTE", "100"))
+
+# Escritor assíncrono (pipeline.escritor): os checkpoints da rota só
+# enfileiram, e uma thread grava um lote a cada INTERVALO segundos ou ao
+# juntar MAX_KB / MAX_LINHAS. 0 volta ao update inline na thread do scraping.
+ESCRITA_ASSINCRONA = os.getenv("SCRAPER_ESCRITA_ASSINCRONA", "1") == "1"
+ESCRITA_INTERVALO = float(os.getenv("SCRAPER_ESCRITA_INTERVALO", "30"))
+ESCRITA_MAX_KB = int(os.getenv("SCRAPER_ESCRITA_MAX_KB", "512"))
+ESCRITA_MAX_LINHAS = int(os.getenv("SCRAPER_ESCRITA_MAX_LINHAS", "1000"))
+ESCRITA_MAX_PENDENTE_KB = int(os.getenv("SCRAPER_ESCRITA_MAX_PENDENTE_KB", "8192"))
+
+
+def carregar_ids_firebase(rota: str, sink: Sink, historico: HistoricoVagas | None = None) -> set | None:
     """
-    Carrega IDs de vagas já existentes no Firebase antes do scraping.
-    Retorna set para lookup O(1) durante dedup.
+    Carrega IDs de vagas já existentes no destino antes do scraping.
+    Retorna set para lookup O(1) durante dedup, ou None se a leitura falhou
+    — o conteúdo da rota é desconhecido e o passe final do
+    PublicadorFirebase substitui a rota inteira em vez de remover por delta.
+
+    Leitura shallow (só chaves) — no Firebase, com fallback paginado para
+    rotas grandes demais (SinkFirebase.ids). Com `historico` já sincronizado
+    para a rota (pipeline.historico), os IDs ativos vêm do SQLite local e o
+    Firebase não é lido.
     """
+    rastreando = tracemalloc.is_tracing()
+    if not rastreando:
+        tracemalloc.start()
+    inicio = time.perf_counter()
+    fonte = sink.nome
+
     try:
-        ref = db.reference(rota)
-        snapshot = ref.get()
-        if snapshot and isinstance(snapshot, dict):
-            ids = set(snapshot.keys())
-            logger.info(f"Cache Firebase: {len(ids)} vagas já existentes em '{rota}'")
-            return ids
-        return set()
+        if historico and historico.sincronizada(rota):
+            fonte = 'HISTÓRICO'
+            ids = historico.ids_ativos(rota)
+        else:
+            ids = sink.ids(rota)
+
+        _, pico = tracemalloc.get_traced_memory()
+        logger.info(
+            f"Cache {fonte}: {len(ids)} vagas já existentes em '{rota}' "
+            f"({time.perf_counter() - inicio:.2f}s, ~{pico / 1024 / 1024:.1f} MB)"
+        )
+        return ids
     except Exception as e:
-        logger.warning(f"Falha ao carregar cache do Firebase '{rota}': {e}")
-        return set()
+        logger.warning(f"Falha ao carregar cache do {fonte} '{rota}': {e} — a rota será substituída por inteiro no fim")
+        return None
+    finally:
+        if not rastreando:
+            tracemalloc.stop()
 
 
-def enviar_para_firebase(lista_vagas: list, rota: str):
+def enviar_para_firebase(lista_vagas: list, rota: str, sink: Sink):
     """
     Upload da lista de vagas para o Firebase via ref.set().
     ref.set() substitui todos os dados na rota — intencional,
     sempre queremos a versão mais atualizada sem acumular lixo.
     Vagas expiradas somem automaticamente a cada execução completa.
+
+    Usado pelo modo 'snapshot' do PublicadorFirebase.
+    """
+    try:
+        vagas_dict = {vaga['id']: vaga_para_dict(vaga) for vaga in lista_vagas}
+        sink.set(rota, vagas_dict)
+        logger.info(f"[{sink.nome}]: {len(lista_vagas)} vagas enviadas para '{rota}' com sucesso.")
+    except Exception as e:
+        logger.error(f"[{sink.nome} ERRO]: Falha ao enviar dados. Erro: {str(e)}")
+
+
+def criar_indice_duplicatas(rota: str, sink: Sink) -> IndiceDuplicatas | None:
+    """Índice da categoria da rota (/vagas/dev/gupy → /duplicatas/dev, plataforma 'gupy')."""
+    if not DUPLICATAS_PREFIXO:
+        return None
+    rota_categoria, _, plataforma = rota.rstrip('/').rpartition('/')
+    return IndiceDuplicatas(
+        sink, rota_derivada(rota_categoria, DUPLICATAS_PREFIXO), plataforma, DUPLICATAS_JANELA_DIAS
+    )
+
+
+def publicar_duplicatas(indice: IndiceDuplicatas, lista_vagas: list, metricas: MetricasExecucao) -> bool:
+    """Registra as impressões digitais da rota no índice (delta). Falha só é logada."""
+    try:
+        with metricas.etapa('duplicatas'):
+            enviadas = indice.registrar(lista_vagas)
+    except Exception as e:
+        logger.error(f"[{indice.sink.nome} ERRO]: Falha ao atualizar índice de duplicatas '{indice.rota_indice}'. Erro: {str(e)}")
+        return False
+    logger.info(f"[{indice.sink.nome}]: Índice de duplicatas '{indice.rota_indice}' — {enviadas} impressões atualizadas")
+    return True
+
+
+def publicar_modelo_leitura(lista_vagas: list, rota: str, sink: Sink, metricas: MetricasExecucao,
+                            duplicatas: IndiceDuplicatas | None = None):
+    """
+    Publica o modelo de leitura da rota (pipeline.modelo_leitura) com um
+    set() no nó derivado — é recalculado inteiro a cada run, como a rota.
+    Com `duplicatas`, cópias de vagas canônicas de outra plataforma ficam
+    de fora. Falha só é logada: a rota bruta já foi publicada.
+    """
+    rota_leitura = rota_derivada(rota, MODELO_LEITURA_PREFIXO)
+    with metricas.etapa('modelo_leitura'):
+        modelo = construir_modelo_leitura(lista_vagas, rota, duplicatas)
+    tamanho = _tamanho_payload(modelo)
+
+    inicio = time.perf_counter()
+    try:
+        sink.set(rota_leitura, modelo)
+    except Exception as e:
+        logger.error(f"[{sink.nome} ERRO]: Falha ao publicar modelo de leitura '{rota_leitura}'. Erro: {str(e)}")
+        return
+    metricas.registrar_upload(time.perf_counter() - inicio, tamanho)
+
+    shards = sum(len(por_chave) for por_chave in modelo['shards'].values())
+    tamanho_lista = _tamanho_payload(modelo['shards']['estado'])
+    logger.info(
+        f"[{sink.nome}]: Modelo de leitura em '{rota_leitura}' — {shards} shards, "
+        f"lista resumida {tamanho_lista / 1024:.1f} KB, árvore {tamanho / 1024:.1f} KB "
+        f"(rota bruta: {_tamanho_vagas(lista_vagas) / 1024:.1f} KB)"
+        + (f", {modelo['meta']['duplicatas_omitidas']} duplicatas de outras plataformas omitidas"
+           if modelo['meta']['duplicatas_omitidas'] else "")
+    )
+
+
+def abrir_historico(rota: str) -> HistoricoVagas | None:
     """
+    Abre o histórico SQLite (HISTORICO_PATH). Falha só é logada: o run segue
+    sem histórico. Um histórico sem run completo da rota (arquivo novo ou
+    perdido no CI) é avisado alto: o first_seen de todas as vagas recomeça.
+    """
+    try:
+        historico = HistoricoVagas(HISTORICO_PATH)
+        sincronizada = historico.sincronizada(rota)
+    except sqlite3.Error as e:
+        logger.error(f"Falha ao abrir histórico de vagas '{HISTORICO_PATH}': {e}")
+        return None
+    if not sincronizada:
+        logger.warning(
+            f"⚠️ HISTÓRICO VAZIO para '{rota}' em '{HISTORICO_PATH}' — first_seen de todas as vagas "
+            f"começa neste run. Esperado só no primeiro run; depois disso o histórico foi perdido."
+        )
+    return historico
+
+
+def arquivar_execucao(lista_vagas: list, plataforma: str, categoria: str, inicio: float,
+                      metricas: MetricasExecucao):
+    """Grava as vagas do run no arquivo colunar (pipeline.arquivo_colunar). Falha só é logada."""
+    try:
+        with metricas.etapa('arquivo'):
+            caminho = gravar_execucao(lista_vagas, ARQUIVO_DIR, plataforma, categoria, inicio)
+    except Exception as e:
+        logger.error(f"Falha ao gravar arquivo colunar em '{ARQUIVO_DIR}': {e}")
+        return
+    if caminho:
+        logger.info(f"  • Arquivo colunar: {caminho} ({caminho.stat().st_size / 1024:.1f} KB)")
+
+
+def publicar_mudancas(feed: FeedMudancas, mudancas: dict, metricas: MetricasExecucao):
+    """Publica o changelog da rota (pipeline.mudancas). Falha só é logada."""
+    inicio = time.perf_counter()
     try:
-        ref = db.reference(rota)
-        vagas_dict = {vaga['id']: vaga for vaga in lista_vagas}
-        ref.set(vagas_dict)
-        logger.info(f"[FIREBASE]: {len(lista_vagas)} vagas enviadas para '{rota}' com sucesso.")
+        feed.publicar(mudancas)
     except Exception as e:
-        logger.error(f"[FIREBASE ERRO]: Falha ao enviar dados. Erro: {str(e)}")
+        logger.error(f"[{feed.sink.nome} ERRO]: Falha ao publicar feed de mudanças '{feed.rota_feed}'. Erro: {str(e)}")
+        return
+    tamanho = _tamanho_payload({chave: mudancas[chave] for chave in ('novas', 'alteradas', 'removidas')})
+    metricas.registrar_upload(time.perf_counter() - inicio, tamanho)
+
+
+def _tamanho_payload(payload: dict) -> int:
+    """Bytes aproximados do JSON enviado (mesma serialização do SDK)."""
+    return len(json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+
+def _tamanho_vagas(vagas: list) -> int:
+    """Bytes do JSON {id: vaga} serializado direto dos registros, sem montar o dict."""
+    return 2 + sum(
+        len(json.dumps(vaga['id'], ensure_ascii=False).encode('utf-8'))
+        + len(vaga_para_json(vaga).encode('utf-8')) + 2
+        for vaga in vagas
+    ) - (1 if vagas else 0)
+
+
+# ============================================================
+# PUBLICAÇÃO INCREMENTAL — delta por checkpoint
+# ============================================================
+class PublicadorFirebase:
+    """
+    Publica as vagas de uma rota de forma incremental.
+
+    Modo 'delta' (padrão):
+    - Cada checkpoint envia só as vagas adicionadas desde o checkpoint
+      anterior, via multi-path ref.update({id: vaga}).
+    - O passe final remove (update com None) apenas os IDs que existiam
+      na rota e não apareceram nesta execução — menos `ids_preservados`,
+      os das combinações que o planejador pulou (não foram buscadas, então
+      não sumir delas não quer dizer que a vaga fechou).
+    Resultado final idêntico ao ref.set() completo — a rota espelha a
+    última execução —, mas o volume enviado passa de quadrático a linear.
+
+    Modo 'snapshot': comportamento legado, ref.set() da lista inteira
+    a cada checkpoint.
+
+    Como `todas_as_vagas` só cresce (append) durante executar_buscas,
+    o delta é simplesmente o sufixo ainda não enviado da lista.
+
+    O destino é um pipeline.sinks.Sink (Firebase por padrão); os sinks
+    locais repetem a semântica de set/update para medir o custo offline.
+
+    Com `escritor` (pipeline.escritor), set/update só enfileiram; finalizar()
+    espera o envio de tudo antes de retornar.
+
+    Com `historico` (pipeline.historico), cada checkpoint também faz o
+    upsert das vagas ainda não registradas (uma transação), e o passe final
+    desativa as que não foram vistas desde o início do run (exceto as
+    preservadas).
+
+    Os modos que substituem a rota inteira (snapshot, ou IDs existentes
+    desconhecidos) regravam junto `vagas_preservadas` (as preservadas que o
+    diário ainda guarda); preservadas sem cópia no diário saem da rota.
+    """
+
+    def __init__(self, rota: str, ids_existentes: set | None, modo: str | None = None,
+                 metricas: MetricasExecucao | None = None, sink: Sink | None = None,
+                 escritor: EscritorAssincrono | None = None, historico: HistoricoVagas | None = None,
+                 ids_preservados: set | None = None, vagas_preservadas: list | None = None):
+        self.rota = rota
+        self.sink = sink or criar_sink()
+        self.modo = modo or MODO_PUBLICACAO
+        self.metricas = metricas or MetricasExecucao()
+        self.escritor = escritor
+        self.historico = historico
+        # None = leitura da rota falhou: sem base para o delta de remoção
+        self.ids_existentes = set(ids_existentes) if ids_existentes is not None else None
+        self.ids_preservados = set(ids_preservados or ())
+        self.vagas_preservadas = vagas_preservadas or []
+        self._enviadas = 0
+        self._fechado = False
+        self._no_historico = 0
+        self._inicio_historico = agora_iso()
+        self.total_bytes = 0
+        self.total_vagas_enviadas = 0
+
+    def pendentes(self, todas_as_vagas: list) -> int:
+        """Vagas ainda não enviadas (o modo snapshot não publica por lote: sempre 0)."""
+        return 0 if self.modo == 'snapshot' else len(todas_as_vagas) - self._enviadas
+
+    def publicar(self, todas_as_vagas: list):
+        """Checkpoint: envia o que mudou desde o último checkpoint."""
+        self._registrar_historico(todas_as_vagas)
+        if self.modo == 'snapshot':
+            self._substituir_rota(todas_as_vagas)
+            return
+
+        novas = todas_as_vagas[self._enviadas:]
+        if not novas:
+            return
+
+        payload = {vaga['id']: vaga_para_dict(vaga) for vaga in novas}
+        if self._update(payload, f"{len(novas)} vagas"):
+            self._enviadas = len(todas_as_vagas)
+            self.total_vagas_enviadas += len(novas)
+
+    def finalizar(self, todas_as_vagas: list):
+        """Passe final: envia o delta pendente, remove os IDs que sumiram e esvazia o escritor."""
+        self.publicar(todas_as_vagas)
+        self._encerrar_historico(todas_as_vagas)
+        if self.modo == 'snapshot':
+            self.fechar()
+            return
+
+        if self.ids_existentes is None:
+            logger.warning(f"[{self.sink.nome}]: IDs existentes de '{self.rota}' desconhecidos — substituindo a rota inteira")
+            self._substituir_rota(todas_as_vagas)
+            self.fechar()
+            return
+
+        ids_execucao = {vaga['id'] for vaga in todas_as_vagas}
+        removidos = self.ids_existentes - ids_execucao - self.ids_preservados
+        mantidos = len((self.ids_existentes - ids_execucao) & self.ids_preservados)
+        if mantidos:
+            logger.info(f"[{self.sink.nome}]: {mantidos} vagas de combinações puladas pelo planejador mantidas em '{self.rota}'")
+        if removidos:
+            payload = {id_vaga: None for id_vaga in removidos}
+            self._update(payload, f"{len(removidos)} vagas removidas")
+        self.fechar()
+
+        logger.info(
+            f"[{self.sink.nome}]: Publicação delta concluída em '{self.rota}' — "
+            f"{self.total_vagas_enviadas} vagas, {self.total_bytes / 1024:.1f} KB enviados "
+            f"(snapshot completo: {_tamanho_vagas(todas_as_vagas) / 1024:.1f} KB)"
+        )
+
+    def _substituir_rota(self, todas_as_vagas: list):
+        """set() da lista inteira: a rota passa a espelhar o run (+ preservadas)."""
+        todas_as_vagas = com_preservadas(todas_as_vagas, self.vagas_preservadas)
+        tamanho = _tamanho_vagas(todas_as_vagas)
+        self.total_bytes += tamanho
+        self.total_vagas_enviadas += len(todas_as_vagas)
+        if self.escritor:
+            self.escritor.set(self.rota, {vaga['id']: vaga_para_dict(vaga) for vaga in todas_as_vagas}, tamanho)
+            return
+        inicio = time.perf_counter()
+        enviar_para_firebase(todas_as_vagas, self.rota, self.sink)
+        self.metricas.registrar_upload(time.perf_counter() - inicio, tamanho)
+
+    def fechar(self):
+        """
+        Envio síncrono do que o escritor ainda tem na fila. Idempotente:
+        finalizar() já fecha e o runner fecha de novo no finally, mas uma
+        falha do escritor só é logada (e contada) uma vez.
+        """
+        if self._fechado:
+            return
+        self._fechado = True
+        if self.escritor and not self.escritor.fechar():
+            logger.error(
+                f"[{self.sink.nome} ERRO]: Escritor assíncrono encerrou com {self.escritor.chaves_perdidas} "
+                f"chaves não gravadas em '{self.rota}' — o próximo run reenvia a rota"
+            )
+
+    def _registrar_historico(self, todas_as_vagas: list):
+        """Upsert no histórico das vagas ainda não registradas. Falha só é logada (o checkpoint seguinte tenta de novo)."""
+        novas = todas_as_vagas[self._no_historico:]
+        if not self.historico or not novas:
+            return
+        try:
+            with self.metricas.etapa('historico'):
+                self.historico.registrar(self.rota, novas)
+        except sqlite3.Error as e:
+            logger.error(f"Falha ao registrar {len(novas)} vagas no histórico '{self.historico.caminho}': {e}")
+            return
+        self._no_historico = len(todas_as_vagas)
+
+    def _encerrar_historico(self, todas_as_vagas: list):
+        """Desativa no histórico as vagas que sumiram — só se todas as do run foram registradas."""
+        if not self.historico:
+            return
+        if self._no_historico < len(todas_as_vagas):
+            logger.warning(f"Histórico incompleto para '{self.rota}' — vagas removidas não marcadas neste run")
+            return
+        try:
+            with self.metricas.etapa('historico'):
+                encerradas = self.historico.encerrar(self.rota, self._inicio_historico, self.ids_preservados)
+        except sqlite3.Error as e:
+            logger.error(f"Falha ao encerrar run no histórico '{self.historico.caminho}': {e}")
+            return
+        logger.info(f"  • Histórico: {len(todas_as_vagas)} vagas vistas, {encerradas} encerradas em '{self.rota}'")
+
+    def _update(self, payload: dict, descricao: str) -> bool:
+        """Multi-path update na rota. Retorna False se falhar (erro só logado)."""
+        tamanho = _tamanho_payload(payload)
+        if self.escritor:
+            self.escritor.update(self.rota, payload, tamanho)
+            self.total_bytes += tamanho
+            logger.info(f"[{self.sink.nome}]: Delta {descricao} ({tamanho / 1024:.1f} KB) enfileirado para '{self.rota}'")
+            return True
+
+        inicio = time.perf_counter()
+        try:
+            self.sink.update(self.rota, payload)
+        except Exception as e:
+            logger.error(f"[{self.sink.nome} ERRO]: Falha no update delta de '{self.rota}'. Erro: {str(e)}")
+            return False
+
+        self.metricas.registrar_upload(time.perf_counter() - inicio, tamanho)
+        self.total_bytes += tamanho
+        logger.info(
+            f"[{self.sink.nome}]: Delta {descricao} ({tamanho / 1024:.1f} KB) enviado para '{self.rota}' "
+            f"— acumulado {self.total_bytes / 1024:.1f} KB"
+        )
+        return True
 
 
 # ============================================================
@@ -149,6 +573,41 @@ def extrair_parametros(config: dict) -> dict:
     }
 
 
+def com_preservadas(vagas: list, preservadas: list | None) -> list:
+    """Vagas do run + as preservadas pelo planejador que o run não reencontrou."""
+    if not preservadas:
+        return vagas
+    ids_run = {vaga['id'] for vaga in vagas}
+    return vagas + [vaga for vaga in preservadas if vaga['id'] not in ids_run]
+
+
+def aplicar_plano(scraper: ScraperProtocol, parametros: dict, rota: str) -> dict | None:
+    """
+    Reordena/poda as combinações da categoria pelo histórico de yield
+    (pipeline.planejador). Devolve o relatório do plano, ou None se o
+    planejador estiver desligado ou ainda não houver execução finalizada.
+    """
+    if not (PLANO_ORCAMENTO > 0 and JOURNAL_DIR):
+        return None
+
+    historico = DiarioExecucao.historico(JOURNAL_DIR, rota)
+    if not historico:
+        logger.info("Planejador: sem execuções finalizadas no diário — rodando todas as combinações")
+        return None
+
+    vagas_por_requisicao = getattr(scraper, 'vagas_por_requisicao', None) or parametros['limite_busca']
+    planejador = planejar_parametros(
+        parametros, historico, PLANO_ORCAMENTO, vagas_por_requisicao, PLANO_RODAR_A_CADA
+    )
+    logger.info(f"Planejador: {planejador.resumo()}")
+    if parametros['ids_preservados']:
+        parametros['vagas_preservadas'] = DiarioExecucao.vagas_salvas(JOURNAL_DIR, rota, parametros['ids_preservados'])
+        logger.info(f"Planejador: {len(parametros['ids_preservados'])} vagas das combinações puladas "
+                    f"ficam fora do passe de remoção ({len(parametros['vagas_preservadas'])} recuperadas do "
+                    f"diário para o modelo de leitura, duplicatas e arquivo)")
+    return planejador.relatorio()
+
+
 def exibir_info_configuracoes(parametros: dict, plataforma: str):
     """Log das configurações carregadas."""
     total_combinacoes = len(parametros['palavras_chave']) * len(parametros['modalidades'])
@@ -193,61 +652,223 @@ def filtrar_duplicadas(vagas: list, urls_vistas: set, ids_firebase: set) -> tupl
 # ============================================================
 # LOOP PRINCIPAL DE BUSCAS
 # ============================================================
-def executar_buscas(scraper: ScraperProtocol, parametros: dict, ids_firebase: set, rota: str) -> dict:
+def _combinacoes(parametros: dict) -> list[tuple]:
+    """Combinações na ordem do plano (pipeline.planejador) ou palavras × modalidades."""
+    if parametros.get('combinacoes') is not None:
+        return parametros['combinacoes']
+    return [
+        (palavra, modalidade)
+        for palavra in parametros['palavras_chave']
+        for modalidade in parametros['modalidades']
+    ]
+
+
+def _buscas_em_ordem(scraper: ScraperProtocol, parametros: dict, combinacoes: list[tuple],
+                     executor: ThreadPoolExecutor | None, diario: DiarioExecucao | None = None,
+                     concorrencia: int = 1, indice: IndiceDedup | None = None,
+                     urls_vistas: set | None = None) -> Iterator[Iterator[list]]:
+    """
+    Páginas de cada palavra × modalidade, SEMPRE na ordem das combinações —
+    mesmo que, no modo concorrente, uma busca posterior termine antes. Isso
+    mantém a dedup determinística.
+
+    Sem executor: uma busca por vez, em streaming — cada página chega ao
+    runner assim que o scraper a entrega (paginas_de).
+    Com executor: até `concorrencia` combinações em voo, cada uma consumida
+    inteira na thread e entregue como uma lista de páginas. A combinação k
+    só é disparada depois que o runner deduplicou a k - concorrencia, e o
+    `indice` de paginação avalia a busca contra uma cópia de `urls_vistas`
+    tirada nesse momento (IndiceDedup.fixar_visao): a parada por yield não
+    depende de qual thread terminou antes.
+
+    Com diário: combinações já concluídas num run interrompido voltam do
+    disco sem scraping; as novas são registradas (com a duração da busca)
+    assim que terminam. Busca que termina em BuscaIncompleta (falha no meio
+    da paginação) tem as páginas aproveitadas, mas fica fora do diário: é
+    refeita no restart e não entra no yield do planejador. Resultados vazios
+    vão para o diário — são yield zero para o planejador —, mas também são
+    refeitos no restart: scrapers só com buscar_vagas não sinalizam falha.
+    """
+    def buscar(combinacao: tuple) -> Iterator[list]:
+        palavra, modalidade = combinacao
+        if diario:
+            retomadas = diario.vagas_da_combinacao(palavra, modalidade)
+            if retomadas is not None:
+                logger.info(f"Retomando '{palavra}' — '{modalidade}' do diário ({len(retomadas)} vagas)")
+                yield retomadas
+                return
+
+        logger.info(f"Buscando '{palavra}' — '{modalidade}'...")
+        paginas = paginas_de(scraper, palavra, modalidade, parametros['limite_busca'])
+        vagas = []
+        segundos = 0.0  # só o tempo dentro do scraper, sem a dedup/publicação entre páginas
+        while True:
+            inicio = time.perf_counter()
+            try:
+                pagina = next(paginas, None)
+            except BuscaIncompleta as e:
+                logger.warning(f"  ⚠️ '{palavra}' — '{modalidade}' incompleta ({e}): "
+                               f"páginas aproveitadas, combinação fora do diário")
+                return
+            finally:
+                segundos += time.perf_counter() - inicio
+            if pagina is None:
+                break
+            if diario:
+                vagas.extend(pagina)
+            yield pagina
+        if diario:
+            diario.registrar(palavra, modalidade, vagas, segundos)
+
+    def consumir(combinacao: tuple, visao: frozenset | None) -> list[list]:
+        if indice:
+            indice.fixar_visao(visao)
+        try:
+            return list(buscar(combinacao))
+        finally:
+            if indice:
+                indice.fixar_visao(None)
+
+    def em_janela() -> Iterator[list[list]]:
+        restantes = iter(combinacoes)
+        visao = frozenset(urls_vistas) if indice else None
+        pendentes = deque(
+            executor.submit(consumir, combinacao, visao) for combinacao in islice(restantes, concorrencia)
+        )
+        while pendentes:
+            yield pendentes.popleft().result()
+            # Retomado só quando o runner terminou a dedup da combinação entregue
+            proxima = next(restantes, None)
+            if proxima is not None:
+                pendentes.append(executor.submit(consumir, proxima, frozenset(urls_vistas) if indice else None))
+
+    if executor:
+        return em_janela()
+    return map(buscar, combinacoes)
+
+
+def executar_buscas(scraper: ScraperProtocol, parametros: dict, ids_firebase: set,
+                    publicador: PublicadorFirebase, concorrencia: int = 1,
+                    diario: DiarioExecucao | None = None, feed: FeedMudancas | None = None) -> dict:
     """
     Loop de buscas: itera palavras × modalidades, aplica dedup,
     faz checkpoint no Firebase a cada 10 keywords e retorna agregado.
 
-    Checkpoint via ref.set() a cada 10 keywords garante que um timeout
-    no GitHub Actions não perde mais de ~10 keywords de progresso.
-    O ref.set() final em finalizar_scraping entrega o snapshot completo.
+    Checkpoint a cada 10 keywords garante que um timeout no GitHub
+    Actions não perde mais de ~10 keywords de progresso. Cada checkpoint
+    envia só o delta desde o anterior (PublicadorFirebase); o passe final
+    em finalizar_scraping remove da rota as vagas que sumiram. Com o
+    escritor assíncrono (ESCRITA_ASSINCRONA), checkpoints só enfileiram: a
+    gravação sai por tempo/tamanho numa thread própria.
+
+    concorrencia > 1 busca N combinações em paralelo (thread pool). Só faz
+    sentido com scrapers cujo ritmo é controlado por um LimitadorTaxa
+    compartilhado (ex: GupyScraper(requisicoes_por_segundo=...)). Dedup e
+    checkpoints continuam sequenciais, na ordem das combinações.
+
+    diario (pipeline.journal) torna o loop retomável: ver _buscas_em_ordem.
+    Ao completar todas as combinações o diário é finalizado.
+
+    parametros['combinacoes'] (pipeline.planejador), se presente, substitui
+    palavras × modalidades: ordem e combinações puladas vêm do plano.
+
+    feed (pipeline.mudancas): com ele, o resultado traz em 'mudancas' as
+    vagas novas, alteradas (hash dos campos) e removidas frente ao run
+    completo anterior — sem contar como removidas as de
+    parametros['ids_preservados'] (combinações puladas pelo plano).
+
+    Com PAGINACAO_LIMIAR > 0, urls_vistas/ids_firebase ficam visíveis ao
+    scraper (scraper.indice_dedup) durante o loop: páginas quase só com
+    vagas já vistas encerram a paginação da query.
+
+    Streaming (ScraperStreamingProtocol): a dedup roda por página, e um lote
+    de PUBLICACAO_LOTE vagas pendentes é publicado sem esperar o fim da
+    query. A lista da query não é mais montada; `todas_as_vagas` continua
+    existindo porque o passe final, o modelo de leitura e o feed precisam
+    do conjunto do run.
     """
+    metricas = _metricas_de(scraper)
     urls_vistas = set()
     todas_as_vagas = []
     total_combinacoes = 0
     total_duplicadas = 0
     total_ja_no_firebase = 0
     inicio = time.time()
-    keywords_desde_checkpoint = 0
+    combinacoes = _combinacoes(parametros)
+    # Checkpoint a cada 10 keywords = 10 × modalidades combinações
+    combinacoes_por_checkpoint = 10 * max(1, len(parametros['modalidades']))
+    combinacoes_desde_checkpoint = 0
 
-    for palavra in parametros['palavras_chave']:
-        for modalidade in parametros['modalidades']:
-            total_combinacoes += 1
+    indice_anterior = getattr(scraper, 'indice_dedup', None)
+    indice = None
+    if PAGINACAO_LIMIAR > 0:
+        indice = IndiceDedup(urls_vistas, ids_firebase, PAGINACAO_LIMIAR, PAGINACAO_CONTA_EXISTENTES)
+        scraper.indice_dedup = indice
 
-            logger.info(f"Buscando '{palavra}' — '{modalidade}'...")
+    executor = ThreadPoolExecutor(max_workers=concorrencia, thread_name_prefix='busca') if concorrencia > 1 else None
+    buscas = _buscas_em_ordem(scraper, parametros, combinacoes, executor, diario, concorrencia, indice, urls_vistas)
 
-            vagas_encontradas = scraper.buscar_vagas(palavra, modalidade, parametros['limite_busca'])
+    try:
+        for palavra, modalidade in combinacoes:
+            total_combinacoes += 1
 
-            vagas_novas, duplicadas, ja_firebase = filtrar_duplicadas(
-                vagas_encontradas, urls_vistas, ids_firebase
-            )
+            encontradas = novas = duplicadas = ja_firebase = 0
+            for pagina in next(buscas):
+                with metricas.etapa('dedup'):
+                    vagas_novas, duplicadas_pagina, ja_firebase_pagina = filtrar_duplicadas(
+                        pagina, urls_vistas, ids_firebase
+                    )
+                encontradas += len(pagina)
+                novas += len(vagas_novas)
+                duplicadas += duplicadas_pagina
+                ja_firebase += ja_firebase_pagina
+                todas_as_vagas.extend(vagas_novas)
+                if PUBLICACAO_LOTE > 0 and publicador.pendentes(todas_as_vagas) >= PUBLICACAO_LOTE:
+                    logger.info(f"  💾 Lote: {publicador.pendentes(todas_as_vagas)} vagas pendentes publicadas...")
+                    publicador.publicar(todas_as_vagas)
+
+            metricas.registrar_palavra(publicador.rota, palavra, modalidade, encontradas, novas)
             total_duplicadas += duplicadas
             total_ja_no_firebase += ja_firebase
 
-            if vagas_novas:
-                logger.info(f"  ✅ {len(vagas_novas)} vagas únicas adicionadas.")
-                todas_as_vagas.extend(vagas_novas)
+            if novas:
+                logger.info(f"  ✅ '{palavra}' — '{modalidade}': {novas} vagas únicas adicionadas.")
                 logger.info(f"  💾 Snapshot: {len(todas_as_vagas)} vagas salvas no Firebase...")
-                enviar_para_firebase(todas_as_vagas, rota)
+                publicador.publicar(todas_as_vagas)
             elif duplicadas > 0 or ja_firebase > 0:
-                logger.info(f"  ⏭️ {duplicadas} duplicadas, {ja_firebase} já no Firebase.")
+                logger.info(f"  ⏭️ '{palavra}' — '{modalidade}': {duplicadas} duplicadas, {ja_firebase} já no Firebase.")
             else:
-                logger.info(f"  ⚠️ Nenhuma vaga encontrada.")
-
-        # Checkpoint a cada 10 keywords (loop externo — por palavra, não por combinação)
-        keywords_desde_checkpoint += 1
-        if keywords_desde_checkpoint >= 10:
-            logger.info(f"  💾 Checkpoint: {len(todas_as_vagas)} vagas salvas até agora...")
-            enviar_para_firebase(todas_as_vagas, rota)
-            keywords_desde_checkpoint = 0
+                logger.info(f"  ⚠️ '{palavra}' — '{modalidade}': nenhuma vaga encontrada.")
+
+            combinacoes_desde_checkpoint += 1
+            if combinacoes_desde_checkpoint >= combinacoes_por_checkpoint:
+                logger.info(f"  💾 Checkpoint: {len(todas_as_vagas)} vagas salvas até agora...")
+                publicador.publicar(todas_as_vagas)
+                combinacoes_desde_checkpoint = 0
+    finally:
+        if executor:
+            executor.shutdown(cancel_futures=True)
+        if indice:
+            scraper.indice_dedup = indice_anterior
+
+    if diario:
+        diario.finalizar()
+
+    mudancas = None
+    if feed:
+        with metricas.etapa('mudancas'):
+            mudancas = feed.calcular(todas_as_vagas, ids_firebase, parametros.get('ids_preservados', frozenset()))
 
     duracao = time.time() - inicio
 
     return {
         'vagas': todas_as_vagas,
+        'mudancas': mudancas,
+        'paginacoes_interrompidas': indice.paradas if indice else 0,
         'total_combinacoes': total_combinacoes,
         'total_duplicadas': total_duplicadas,
         'total_ja_no_firebase': total_ja_no_firebase,
+        'inicio': inicio,
         'duracao_segundos': duracao,
     }
 
@@ -255,8 +876,8 @@ def executar_buscas(scraper: ScraperProtocol, parametros: dict, ids_firebase: se
 # ============================================================
 # FINALIZAÇÃO — métricas + snapshot final completo
 # ============================================================
-def finalizar_scraping(resultados: dict, rota: str):
-    """Imprime métricas da categoria e envia snapshot final para o Firebase."""
+def finalizar_scraping(resultados: dict, publicador: PublicadorFirebase):
+    """Imprime métricas da categoria e fecha a publicação no Firebase."""
     duracao = resultados['duracao_segundos']
     total_vagas = len(resultados['vagas'])
 
@@ -266,24 +887,290 @@ def finalizar_scraping(resultados: dict, rota: str):
     logger.info(f"  • Vagas únicas coletadas: {total_vagas}")
     logger.info(f"  • Duplicadas ignoradas (intra-scraping): {resultados['total_duplicadas']}")
     logger.info(f"  • Já existentes no Firebase: {resultados['total_ja_no_firebase']}")
+    if resultados.get('paginacoes_interrompidas'):
+        logger.info(f"  • Paginações encerradas por baixo yield: {resultados['paginacoes_interrompidas']}")
     logger.info(f"  • Duração: {duracao / 60:.1f} minutos ({duracao:.0f}s)")
+    segundos_pausa = publicador.metricas.segundos_por_etapa.get('pausa', 0.0)
+    logger.info(f"  • Pausas deliberadas (acumulado do run): {segundos_pausa:.0f}s")
+    segundos_sobrepostos = publicador.metricas.segundos_por_etapa.get('pausa_sobreposta', 0.0)
+    if segundos_sobrepostos:
+        fracao = segundos_sobrepostos / (segundos_sobrepostos + segundos_pausa)
+        logger.info(f"  • Trabalho escondido nas pausas: {segundos_sobrepostos:.0f}s ({fracao:.0%} do tempo de pausa)")
 
     if total_vagas > 0:
         vagas_por_segundo = total_vagas / duracao if duracao > 0 else 0
         taxa_duplicata = resultados['total_duplicadas'] / (total_vagas + resultados['total_duplicadas']) * 100 if (total_vagas + resultados['total_duplicadas']) > 0 else 0
         logger.info(f"  • Performance: {vagas_por_segundo:.1f} vagas/segundo")
         logger.info(f"  • Taxa de duplicatas: {taxa_duplicata:.1f}%")
-        enviar_para_firebase(resultados['vagas'], rota)
+        publicador.finalizar(resultados['vagas'])
     else:
         logger.warning("Nenhuma vaga nova encontrada. Firebase não atualizado.")
 
     logger.info("=" * 60)
 
 
+def _metricas_de(scraper: ScraperProtocol) -> MetricasExecucao:
+    """Métricas do scraper (BaseScraper já cria); scrapers só-Protocol ganham uma instância."""
+    metricas = getattr(scraper, 'metricas', None)
+    if metricas is None:
+        metricas = MetricasExecucao()
+        scraper.metricas = metricas
+    return metricas
+
+
+def _salvar_relatorio(scraper: ScraperProtocol, plataforma: str, inicio: float, categorias: dict):
+    """Grava o relatório JSON de desempenho (etapas, latências, bytes, vagas por palavra)."""
+    if not RELATORIO_PATH:
+        return
+
+    extras = {
+        'plataforma': plataforma,
+        'inicio': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(inicio)),
+        'duracao_segundos': round(time.time() - inicio, 1),
+        'categorias': categorias,
+    }
+    metricas_http = getattr(scraper, 'metricas_http', None)
+    if metricas_http:
+        extras['conexoes'] = metricas_http.como_dict()
+    cache_http = getattr(scraper, 'cache_http', None)
+    if cache_http:
+        extras['cache_http'] = cache_http.estatisticas()
+
+    try:
+        _metricas_de(scraper).salvar(RELATORIO_PATH, extras)
+        logger.info(f"  • Relatório de desempenho: {RELATORIO_PATH}")
+    except OSError as e:
+        logger.error(f"Falha ao gravar relatório de desempenho '{RELATORIO_PATH}': {e}")
+
+
+def _encerrar_scraper(scraper: ScraperProtocol):
+    """Fecha as conexões do scraper (se ele expõe fechar()) e loga o uso do pool e do cache."""
+    metricas_http = getattr(scraper, 'metricas_http', None)
+    if metricas_http and metricas_http.requisicoes:
+        metricas = metricas_http.como_dict()
+        logger.info(
+            f"  • Conexões HTTP: {metricas['requisicoes']} requisições, "
+            f"{metricas['conexoes_novas']} novas, {metricas['conexoes_reutilizadas']} reaproveitadas "
+            f"(handshake total: {metricas['handshake_segundos']:.2f}s)"
+        )
+
+    acervo = getattr(scraper, 'acervo_fixtures', None)
+    if acervo:
+        estatisticas = acervo.estatisticas()
+        logger.info(
+            f"  • Fixtures: {estatisticas['gravadas']} gravadas, {estatisticas['servidas']} servidas, "
+            f"{estatisticas['ausentes']} ausentes ({estatisticas['tamanho_mb']} MB em disco)"
+        )
+
+    cache_http = getattr(scraper, 'cache_http', None)
+    if cache_http:
+        estatisticas = cache_http.estatisticas()
+        logger.info(
+            f"  • Cache HTTP: {estatisticas['hits']} hits, {estatisticas['misses']} misses, "
+            f"{estatisticas['revalidacoes_304']} revalidações 304 ({estatisticas['tamanho_mb']} MB em disco)"
+        )
+
+    fechar = getattr(scraper, 'fechar', None)
+    if callable(fechar):
+        fechar()
+
+
+# ============================================================
+# CATEGORIA — uma rota do início ao fim (mesmo código em 1 ou N processos)
+# ============================================================
+def _processar_categoria(scraper: ScraperProtocol, plataforma: str, nome_categoria: str, categoria: dict,
+                         sink: Sink, concorrencia: int) -> dict | None:
+    """Busca, publica e deriva (modelo de leitura, feed) uma categoria. Devolve o resumo."""
+    metricas = _metricas_de(scraper)
+    logger.info(f"\n{'=' * 60}")
+    logger.info(f"CATEGORIA: {nome_categoria.upper()}")
+    logger.info(f"{'=' * 60}")
+
+    config = carregar_configuracoes(categoria['queries'])
+    if not config:
+        return None
+
+    parametros = extrair_parametros(config)
+    exibir_info_configuracoes(parametros, plataforma)
+    plano = aplicar_plano(scraper, parametros, categoria['rota'])
+
+    feed = (FeedMudancas(sink, rota_derivada(categoria['rota'], MUDANCAS_PREFIXO), MUDANCAS_MANTER)
+            if MUDANCAS_PREFIXO else None)
+    duplicatas = criar_indice_duplicatas(categoria['rota'], sink) if MODELO_LEITURA_PREFIXO else None
+    historico = abrir_historico(categoria['rota']) if HISTORICO_PATH else None
+    with metricas.etapa('leitura_firebase'):
+        ids_firebase = carregar_ids_firebase(categoria['rota'], sink, historico if HISTORICO_FONTE_IDS else None)
+        if feed:
+            feed.carregar()
+        if duplicatas:
+            duplicatas.carregar()
+
+    escritor = EscritorAssincrono(
+        sink, metricas, ESCRITA_INTERVALO, ESCRITA_MAX_KB * 1024, ESCRITA_MAX_LINHAS,
+        max_pendente=ESCRITA_MAX_PENDENTE_KB * 1024,
+    ) if ESCRITA_ASSINCRONA else None
+    publicador = PublicadorFirebase(categoria['rota'], ids_firebase, metricas=metricas, sink=sink,
+                                    escritor=escritor, historico=historico,
+                                    ids_preservados=parametros.get('ids_preservados'),
+                                    vagas_preservadas=parametros.get('vagas_preservadas'))
+    ids_firebase = ids_firebase if ids_firebase is not None else set()
+    diario = DiarioExecucao.abrir(JOURNAL_DIR, categoria['rota']) if JOURNAL_DIR else None
+
+    try:
+        resultados = executar_buscas(scraper, parametros, ids_firebase, publicador, concorrencia, diario, feed)
+        finalizar_scraping(resultados, publicador)
+    finally:
+        publicador.fechar()
+        if historico:
+            historico.fechar()
+    # Derivados espelham a rota: vagas do run + as das combinações puladas pelo plano
+    vagas_rota = com_preservadas(resultados['vagas'], parametros.get('vagas_preservadas'))
+    if duplicatas and vagas_rota and not publicar_duplicatas(duplicatas, vagas_rota, metricas):
+        duplicatas = None
+    if MODELO_LEITURA_PREFIXO and vagas_rota:
+        publicar_modelo_leitura(vagas_rota, categoria['rota'], sink, metricas, duplicatas)
+    if feed and resultados['vagas']:
+        publicar_mudancas(feed, resultados['mudancas'], metricas)
+    if ARQUIVO_DIR:
+        arquivar_execucao(vagas_rota, plataforma, nome_categoria, resultados['inicio'], metricas)
+
+    resumo = {
+        'rota': categoria['rota'],
+        'vagas': len(resultados['vagas']),
+        'combinacoes': resultados['total_combinacoes'],
+        'duplicadas': resultados['total_duplicadas'],
+        'ja_no_firebase': resultados['total_ja_no_firebase'],
+        'duracao_segundos': round(resultados['duracao_segundos'], 1),
+        'paginacoes_interrompidas': resultados['paginacoes_interrompidas'],
+    }
+    if plano:
+        resumo['plano'] = plano
+    if resultados['mudancas']:
+        resumo['mudancas'] = {
+            tipo: len(resultados['mudancas'][tipo]) for tipo in ('novas', 'alteradas', 'removidas')
+        }
+    return resumo
+
+
+# ============================================================
+# MULTIPROCESSO — uma categoria por processo
+# ============================================================
+class _PrefixoCategoria(logging.Filter):
+    """Prefixa as mensagens do worker com a categoria ('[DEV] ...')."""
+
+    def __init__(self):
+        super().__init__()
+        self.categoria = ''
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.categoria:
+            record.msg = f"[{self.categoria}] {record.getMessage()}"
+            record.args = None
+        return True
+
+
+_prefixo_worker = _PrefixoCategoria()
+
+
+def _inicializar_worker(fila_logs):
+    """
+    Logging do processo worker: tudo vai para a fila do processo pai, que
+    escreve no scraper.log/stdout. Cada worker processa uma categoria por
+    vez, em ordem, então as linhas de uma categoria chegam em ordem.
+    """
+    global _logging_configurado
+    raiz = logging.getLogger()
+    raiz.handlers.clear()
+    raiz.setLevel(logging.INFO)
+    handler = logging.handlers.QueueHandler(fila_logs)
+    handler.addFilter(_prefixo_worker)
+    raiz.addHandler(handler)
+    _logging_configurado = True
+
+
+def _executar_categoria_em_worker(fabrica_scraper, fracao_taxa: float, plataforma: str,
+                                  nome_categoria: str, categoria: dict, concorrencia: int) -> dict:
+    """Corpo do worker: scraper e sink próprios; devolve resumo + métricas exportadas."""
+    _prefixo_worker.categoria = nome_categoria.upper()
+    scraper = fabrica_scraper(fracao_taxa)
+    instrumentar_do_ambiente(scraper)
+    sink = criar_sink()
+    try:
+        resumo = _processar_categoria(scraper, plataforma, nome_categoria, categoria, sink, concorrencia)
+    finally:
+        _encerrar_scraper(scraper)
+        sink.fechar()
+
+    extras = {}
+    metricas_http = getattr(scraper, 'metricas_http', None)
+    if metricas_http:
+        extras['conexoes'] = metricas_http.como_dict()
+    cache_http = getattr(scraper, 'cache_http', None)
+    if cache_http:
+        extras['cache_http'] = cache_http.estatisticas()
+    return {'resumo': resumo, 'metricas': _metricas_de(scraper).exportar(), 'extras': extras}
+
+
+def _executar_em_processos(fabrica_scraper, plataforma: str, categorias: dict, concorrencia: int,
+                           processos: int, metricas: MetricasExecucao) -> dict:
+    """
+    Uma categoria por processo (spawn — sem herdar sessões/threads do pai).
+
+    - Cada worker cria seu scraper com fabrica_scraper(fracao_taxa): a taxa
+      global de requisições é dividida igualmente entre os workers ativos.
+    - Cada rota continua publicada por um único PublicadorFirebase, no
+      processo da sua categoria: a semântica de publicação por rota (delta
+      + limpeza final só ao concluir) não muda.
+    - Os logs dos workers chegam pela fila, prefixados com a categoria.
+    - As métricas de cada worker voltam exportadas e são mescladas aqui.
+
+    Uma categoria que falha não interrompe as outras; a primeira exceção é
+    relançada ao final (depois do relatório).
+    """
+    trabalhadores = min(processos, len(categorias))
+    fracao_taxa = 1.0 / trabalhadores
+    contexto = multiprocessing.get_context('spawn')
+    fila_logs = contexto.Queue()
+    raiz = logging.getLogger()
+    ouvinte = logging.handlers.QueueListener(fila_logs, *raiz.handlers, respect_handler_level=True)
+    ouvinte.start()
+    logger.info(f"Modo multiprocesso: {len(categorias)} categorias em {trabalhadores} processos "
+                f"({fracao_taxa:.0%} da taxa cada)")
+
+    resumo_categorias = {}
+    falha = None
+    try:
+        with ProcessPoolExecutor(max_workers=trabalhadores, mp_context=contexto,
+                                 initializer=_inicializar_worker, initargs=(fila_logs,)) as executor:
+            futuros = {
+                nome: executor.submit(_executar_categoria_em_worker, fabrica_scraper, fracao_taxa,
+                                      plataforma, nome, categoria, concorrencia)
+                for nome, categoria in categorias.items()
+            }
+            for nome, futuro in futuros.items():
+                try:
+                    retorno = futuro.result()
+                except Exception as e:
+                    logger.error(f"Categoria '{nome}' falhou no worker: {e}")
+                    falha = falha or e
+                    continue
+                metricas.mesclar(retorno['metricas'])
+                if retorno['resumo']:
+                    resumo_categorias[nome] = {**retorno['resumo'], **retorno['extras']}
+    finally:
+        ouvinte.stop()
+
+    if falha:
+        raise falha
+    return resumo_categorias
+
+
 # ============================================================
 # ENTRY POINT — chamado pelos mains específicos
 # ============================================================
-def executar(scraper: ScraperProtocol, plataforma: str, categorias: dict):
+def executar(scraper: ScraperProtocol, plataforma: str, categorias: dict, concorrencia: int = 1,
+             sink: Sink | None = None, processos: int = 1,
+             fabrica_scraper: Callable[[float], ScraperProtocol] | None = None):
     """
     Executa o ciclo completo de scraping para todas as categorias.
 
@@ -295,6 +1182,14 @@ def executar(scraper: ScraperProtocol, plataforma: str, categorias: dict):
                 "dev": {"queries": "queries/tecnologia_gupy.json", "rota": "/vagas/dev/gupy"},
                 "adv": {"queries": "queries/advogados_gupy.json",  "rota": "/vagas/adv/gupy"},
             }
+        concorrencia: combinações palavra × modalidade buscadas em paralelo
+            (1 = sequencial). Ver executar_buscas.
+        sink: destino da publicação. Padrão: criar_sink(), que lê
+            SCRAPER_SINK (firebase | json:<arquivo> | sqlite:<arquivo>).
+        processos: > 1 roda cada categoria em um processo próprio (ver
+            _executar_em_processos). Exige fabrica_scraper.
+        fabrica_scraper: função de módulo (picklable) que recebe a fração
+            da taxa global e devolve um scraper novo para o worker.
     """
     configurar_logging()
 
@@ -302,28 +1197,38 @@ def executar(scraper: ScraperProtocol, plataforma: str, categorias: dict):
     logger.info(f"INICIANDO MYORBITA SCRAPER — PLATAFORMA: {plataforma.upper()}")
     logger.info("=" * 60)
 
-    inicializar_firebase()
-    inicio_total = time.time()
-
-    for nome_categoria, categoria in categorias.items():
-        logger.info(f"\n{'=' * 60}")
-        logger.info(f"CATEGORIA: {nome_categoria.upper()}")
-        logger.info(f"{'=' * 60}")
-
-        config = carregar_configuracoes(categoria['queries'])
-        if not config:
-            continue
+    multiprocesso = processos > 1 and len(categorias) > 1
+    if multiprocesso and (fabrica_scraper is None or sink is not None or not sink_multiprocesso_seguro()):
+        logger.warning("Modo multiprocesso exige fabrica_scraper e um sink compartilhável "
+                       "(firebase ou sqlite, via SCRAPER_SINK) — rodando as categorias em sequência")
+        multiprocesso = False
 
-        parametros = extrair_parametros(config)
-        exibir_info_configuracoes(parametros, plataforma)
-
-        ids_firebase = carregar_ids_firebase(categoria['rota'])
+    if not multiprocesso:
+        sink = sink or criar_sink()
+    instrumentar_do_ambiente(scraper)
+    metricas = _metricas_de(scraper)
+    inicio_total = time.time()
+    resumo_categorias = {}
 
-        resultados = executar_buscas(scraper, parametros, ids_firebase, categoria['rota'])
-        finalizar_scraping(resultados, categoria['rota'])
+    try:
+        if multiprocesso:
+            resumo_categorias = _executar_em_processos(
+                fabrica_scraper, plataforma, categorias, concorrencia, processos, metricas
+            )
+        else:
+            for nome_categoria, categoria in categorias.items():
+                resumo = _processar_categoria(scraper, plataforma, nome_categoria, categoria, sink, concorrencia)
+                if resumo:
+                    resumo_categorias[nome_categoria] = resumo
+    finally:
+        _encerrar_scraper(scraper)
+        if sink:
+            sink.fechar()
+        _salvar_relatorio(scraper, plataforma, inicio_total, resumo_categorias)
 
     duracao_total = time.time() - inicio_total
     logger.info(f"\n{'=' * 60}")
     logger.info(f"EXECUÇÃO COMPLETA — {plataforma.upper()}")
     logger.info(f"  Duração total: {duracao_total / 60:.1f} minutos ({duracao_total:.0f}s)")
+    logger.info(f"  Etapas: {metricas.resumo_etapas()}")
     logger.info(f"{'=' * 60}")
\ No newline at end of file
@@ -1,11 +1,20 @@
 # scrapers/base_scraper.py
 from abc import ABC, abstractmethod
 from typing import Any
+from urllib.parse import urlsplit
 import requests
+import os
 import random
 import time
 import hashlib
 import logging
+import re
+
+from .cache_http import CacheRespostas
+from .limitador_taxa import LimitadorTaxa
+from .metricas import MetricasExecucao
+from .sessao_http import MetricasConexao, criar_sessao
+from .vaga import Vaga
 
 logger = logging.getLogger(__name__)
 
@@ -47,11 +56,21 @@ _PADROES_MOJIBAKE = (
 )
 
 
+# Todos os padrões numa única alternação compilada: uma varredura da string
+# em vez de uma busca de substring por padrão.
+_RE_MOJIBAKE = re.compile('|'.join(re.escape(padrao) for padrao in _PADROES_MOJIBAKE))
+
+
 def _texto_parece_mojibake(texto: str) -> bool:
-    """Testa se a string contém padrões clássicos de double-encoding."""
-    if not texto or len(texto) < 2:
+    """
+    Testa se a string contém padrões clássicos de double-encoding.
+
+    Fast path: todo padrão tem caractere não-ASCII, então texto ASCII puro
+    (a maioria dos campos: links, datas, siglas) nunca é mojibake.
+    """
+    if not texto or len(texto) < 2 or texto.isascii():
         return False
-    return any(padrao in texto for padrao in _PADROES_MOJIBAKE)
+    return _RE_MOJIBAKE.search(texto) is not None
 
 
 def consertar_mojibake(texto: Any) -> Any:
@@ -85,21 +104,121 @@ def consertar_mojibake(texto: Any) -> Any:
         return texto
 
 
+class BuscaIncompleta(Exception):
+    """
+    Lançada por buscar_vagas_paginas ao fim das páginas já entregues quando
+    a busca parou por falha (HTTP, rede, bloqueio), não por fim dos
+    resultados. O runner aproveita as páginas, mas não registra a
+    combinação como concluída no diário.
+    """
+
+
 class BaseScraper(ABC):
     """
     Classe Abstrata que define o contrato obrigatório para todos os scrapers.
     Padrão de Projeto: Template Method.
     """
 
-    def __init__(self, nome_plataforma: str):
+    # Conexões mantidas por host no pool da sessão HTTP
+    _TAMANHO_POOL = 16
+
+    def __init__(self, nome_plataforma: str, limitador: LimitadorTaxa | None = None,
+                 tamanho_pool: int | None = None, cache: CacheRespostas | None = None):
         self.nome_plataforma = nome_plataforma
 
+        # Cache de respostas opcional (SCRAPER_CACHE_DIR) — ver cache_http.py
+        self.cache_http = cache if cache is not None else CacheRespostas.do_ambiente()
+
+        # Com limitador, o ritmo é ditado pelo token bucket por host (seguro
+        # para várias threads). Sem ele, vale o delay humano aleatório legado.
+        self._limitador = limitador
+
+        # Desligado pelo modo replay (scrapers/replay.py): toda espera
+        # deliberada passa por _pausar e vira no-op.
+        self.pausas_ativas = True
+
+        # Modo sobreposição (SCRAPER_SOBREPOR_PAUSAS=1): pausas viram prazo
+        # contado do fim da última requisição — ver _pausar/_cumprir_pausa.
+        self.sobrepor_pausas = os.getenv("SCRAPER_SOBREPOR_PAUSAS", "0") == "1"
+        self._pausa_pendente = 0.0
+        self._pausa_desde = 0.0
+        self._fim_ultima_requisicao = None
+
+        # Tempo por etapa, latências e bytes do run (relatório JSON do runner)
+        self.metricas = MetricasExecucao()
+
+        # Dedup do runner para parar a paginação por yield (indice_dedup.py).
+        # None = pagina até os limites de cada scraper.
+        self.indice_dedup = None
+
         # Simula navegadores reais para burlar bloqueios primários
         self.headers_padrao = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
             "Accept-Language": "pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7",
         }
 
+        # Sessão com pool de conexões (keep-alive) compartilhada por todas as
+        # chamadas desta instância — inclusive entre threads.
+        self.metricas_http = MetricasConexao()
+        self._sessao_http = criar_sessao(
+            self.headers_padrao, tamanho_pool or self._TAMANHO_POOL, self.metricas_http
+        )
+
+    def fechar(self):
+        """Libera as conexões do pool. Chamado pelo runner ao fim da execução."""
+        self._sessao_http.close()
+
+    def _pausar(self, segundos: float):
+        """
+        Único ponto de espera deliberada (delays anti-ban, backoff, rate limit).
+
+        Com sobrepor_pausas (e sem limitador — uma requisição por vez), a
+        pausa não dorme aqui: soma-se a um prazo contado do fim da última
+        requisição, cumprido por _cumprir_pausa antes do próximo GET. Parse,
+        normalização e o que o runner faz com a página (dedup, checkpoint)
+        correm dentro da pausa; o intervalo entre duas requisições continua
+        >= soma das pausas pedidas entre elas.
+        """
+        if not (self.pausas_ativas and segundos > 0):
+            return
+        if self.sobrepor_pausas and self._limitador is None:
+            if not self._pausa_pendente:
+                self._pausa_desde = self._fim_ultima_requisicao or time.perf_counter()
+            self._pausa_pendente += segundos
+            return
+        with self.metricas.etapa('pausa'):
+            time.sleep(segundos)
+
+    def _cumprir_pausa(self):
+        """Dorme o que falta do prazo pendente; o que já passou foi trabalho escondido na pausa."""
+        if not self._pausa_pendente:
+            return
+        decorrido = time.perf_counter() - self._pausa_desde
+        restante = self._pausa_pendente - decorrido
+        self.metricas.adicionar('pausa_sobreposta', min(decorrido, self._pausa_pendente))
+        self._pausa_pendente = 0.0
+        if restante > 0:
+            with self.metricas.etapa('pausa'):
+                time.sleep(restante)
+
+    def _requisitar(self, sessao, url: str, **kwargs):
+        """GET na sessão (requests ou curl_cffi) registrando latência, status e bytes."""
+        self._cumprir_pausa()
+        inicio = time.perf_counter()
+        try:
+            response = sessao.get(url, **kwargs)
+        except Exception:
+            self._fim_ultima_requisicao = time.perf_counter()
+            self.metricas.registrar_requisicao(self._fim_ultima_requisicao - inicio, 'erro', 0)
+            raise
+        self._fim_ultima_requisicao = time.perf_counter()
+        self.metricas.registrar_requisicao(self._fim_ultima_requisicao - inicio, response.status_code, len(response.content))
+        return response
+
+    def _paginacao_esgotada(self, vagas_pagina: list, anteriores: list = ()) -> bool:
+        """True se o índice de dedup do runner diz que a página quase não trouxe vagas novas."""
+        return self.indice_dedup is not None and self.indice_dedup.pagina_esgotada(vagas_pagina, anteriores)
+
     def gerar_id_deterministico(self, link: str) -> str:
         """Gera um ID único e determinístico a partir de uma URL."""
         return hashlib.md5(link.encode('utf-8')).hexdigest()[:16]
@@ -161,29 +280,30 @@ class BaseScraper(ABC):
         tipo_contrato: str | None = None,
         prazo_inscricao: str | None = None,
         pcd: bool | None = None,
-    ) -> dict:
+    ) -> Vaga:
         """
-        Monta o dicionário padronizado da vaga.
+        Monta o registro padronizado da vaga (Vaga, com __slots__ — continua
+        acessível como vaga['id'] / vaga['link']).
         Todos os campos textuais passam por _normalizar_campo (que aplica
         conserto de mojibake automaticamente).
         """
-        return {
-            "id": id_vaga,
-            "titulo": consertar_mojibake(titulo),
-            "empresa": consertar_mojibake(empresa),
-            "modalidade": consertar_mojibake(modalidade),
-            "link": link,  # URL não tem mojibake (já é ASCII após URL-encoding)
-            "data_publicacao": data_pub,
-            "origem": self.nome_plataforma,
-            "city": self._normalizar_campo(city),
-            "state": self._normalizar_estado(state),
-            "country": self._normalizar_campo(country, default='Brasil'),
-            "workplace_type": self._normalizar_campo(workplace_type),
-            "is_remote": self._normalizar_campo(is_remote, default=False),
-            "tipo_contrato": self._normalizar_campo(tipo_contrato),
-            "prazo_inscricao": self._normalizar_campo(prazo_inscricao),
-            "pcd": self._normalizar_campo(pcd, default=False),
-        }
+        return Vaga(
+            id=id_vaga,
+            titulo=consertar_mojibake(titulo),
+            empresa=consertar_mojibake(empresa),
+            modalidade=consertar_mojibake(modalidade),
+            link=link,  # URL não tem mojibake (já é ASCII após URL-encoding)
+            data_publicacao=data_pub,
+            origem=self.nome_plataforma,
+            city=self._normalizar_campo(city),
+            state=self._normalizar_estado(state),
+            country=self._normalizar_campo(country, default='Brasil'),
+            workplace_type=self._normalizar_campo(workplace_type),
+            is_remote=self._normalizar_campo(is_remote, default=False),
+            tipo_contrato=self._normalizar_campo(tipo_contrato),
+            prazo_inscricao=self._normalizar_campo(prazo_inscricao),
+            pcd=self._normalizar_campo(pcd, default=False),
+        )
 
     def fazer_requisicao_segura(self, url: str, params: dict | None = None) -> requests.Response:
         """
@@ -192,22 +312,50 @@ class BaseScraper(ABC):
         Diferencial UTF-8: força encoding UTF-8 no response antes de retornar,
         impedindo que .json() ou .text decodifiquem como Latin-1 (default do
         requests quando o servidor não envia charset explícito).
+
+        Thread-safe: com limitador configurado, pode ser chamado por vários
+        workers ao mesmo tempo — a taxa por host é global.
+
+        Com cache_http ligado: entrada fresca volta na hora (sem delay);
+        entrada expirada é revalidada com If-None-Match/If-Modified-Since.
         """
+        entrada_cache = None
+        headers_condicionais = None
+        if self.cache_http:
+            entrada_cache, fresca = self.cache_http.obter_fresca(url, params)
+            if fresca:
+                self.metricas.registrar_cache(len(entrada_cache.corpo))
+                return entrada_cache.como_response()
+            if entrada_cache:
+                headers_condicionais = entrada_cache.headers_condicionais()
+
         tentativas_maximas = 4
 
         for tentativa in range(tentativas_maximas):
             try:
-                delay_humano = random.uniform(1.5, 3.5)
-                time.sleep(delay_humano)
+                if self._limitador:
+                    self._limitador.adquirir(urlsplit(url).netloc, dormir=self._pausar)
+                else:
+                    delay_humano = random.uniform(1.5, 3.5)
+                    self._pausar(delay_humano)
 
-                response = requests.get(url, headers=self.headers_padrao, params=params, timeout=15)
+                response = self._requisitar(
+                    self._sessao_http, url, params=params, headers=headers_condicionais, timeout=15
+                )
 
                 # ⚠️ FIX UTF-8: força encoding antes de qualquer decodificação.
                 # Servidores que mandam JSON sem charset no Content-Type fazem
                 # `requests` assumir Latin-1 (RFC 7159 antigo) — origem do mojibake.
                 response.encoding = 'utf-8'
 
+                if response.status_code == 304 and entrada_cache:
+                    self.cache_http.renovar(entrada_cache)
+                    self.metricas.registrar_cache(len(entrada_cache.corpo))
+                    return entrada_cache.como_response()
+
                 if response.status_code == 200:
+                    if self.cache_http:
+                        self.cache_http.salvar(url, params, response.status_code, response.headers, response.content)
                     return response
 
                 if response.status_code in STATUS_SEM_RETRY:
@@ -227,6 +375,6 @@ class BaseScraper(ABC):
 
                 tempo_espera = (2 ** tentativa) + random.uniform(1, 2)
                 logger.warning(f"[ANTI-BAN]: Aguardando {tempo_espera:.2f}s — Tentativa {tentativa + 1}/{tentativas_maximas}")
-                time.sleep(tempo_espera)
+                self._pausar(tempo_espera)
 
         raise RuntimeError(f"fazer_requisicao_segura: todas as tentativas falharam para {url}")
\ No newline at end of file
@@ -0,0 +1,223 @@
+# scrapers/cache_http.py
+"""
+Cache de respostas HTTP em disco — opcional, para re-execuções e debug local.
+
+Um workflow que cai no meio e é reiniciado minutos depois baixaria de novo
+todas as páginas da Gupy e do LinkedIn. Com o cache ligado
+(SCRAPER_CACHE_DIR), fazer_requisicao_segura e LinkedinScraper._fazer_request
+consultam o disco antes da rede:
+
+- Chave: URL normalizada (esquema/host minúsculos, query + params ordenados)
+  → sha256. `?b=2&a=1` e `?a=1&b=2` caem na mesma entrada.
+- Corpo comprimido (gzip) junto dos metadados (status, headers, timestamp).
+- TTL: dentro do prazo a entrada é servida direto, SEM delay anti-ban
+  (não há request nenhum para disfarçar).
+- Expirada + servidor mandou ETag/Last-Modified: o request sai com
+  If-None-Match/If-Modified-Since; um 304 renova a entrada sem rebaixar o corpo.
+- LRU: cada hit atualiza o mtime do arquivo; passando do limite de tamanho,
+  os arquivos com mtime mais antigo são removidos primeiro.
+
+Só respostas 200 (e que passaram pela detecção de bloqueio, no LinkedIn)
+entram no cache.
+"""
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+
+def normalizar_url(url: str, params: dict | None = None) -> str:
+    """URL canônica: esquema/host minúsculos, sem fragmento, query ordenada."""
+    partes = urlsplit(url)
+    query = parse_qsl(partes.query, keep_blank_values=True)
+    if params:
+        query.extend((str(k), str(v)) for k, v in params.items() if v is not None)
+    return urlunsplit((
+        partes.scheme.lower(),
+        partes.netloc.lower(),
+        partes.path or '/',
+        urlencode(sorted(query)),
+        '',
+    ))
+
+
+def chave_requisicao(url: str, params: dict | None = None) -> str:
+    """Chave estável de uma requisição GET (usada também pelo replay)."""
+    return hashlib.sha256(normalizar_url(url, params).encode('utf-8')).hexdigest()
+
+
+@dataclass
+class EntradaCache:
+    """Resposta armazenada. `salva_em` é o epoch do download/revalidação."""
+    chave: str
+    url: str
+    status: int
+    headers: dict
+    corpo: bytes
+    salva_em: float
+    caminho: Path = field(repr=False, default=None)
+
+    def fresca(self, ttl_segundos: float) -> bool:
+        return (time.time() - self.salva_em) < ttl_segundos
+
+    def headers_condicionais(self) -> dict:
+        """If-None-Match / If-Modified-Since para revalidar a entrada."""
+        headers = CaseInsensitiveDict(self.headers)
+        condicionais = {}
+        if headers.get('ETag'):
+            condicionais['If-None-Match'] = headers['ETag']
+        if headers.get('Last-Modified'):
+            condicionais['If-Modified-Since'] = headers['Last-Modified']
+        return condicionais
+
+    def como_response(self) -> requests.Response:
+        """Reconstrói um requests.Response equivalente ao original."""
+        response = requests.Response()
+        response.status_code = self.status
+        response._content = self.corpo
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.url = self.url
+        response.encoding = 'utf-8'
+        return response
+
+
+class CacheRespostas:
+    """Cache em disco com TTL, revalidação condicional e limite LRU."""
+
+    def __init__(self, diretorio: str, ttl_segundos: float = 6 * 3600,
+                 tamanho_maximo_bytes: int = 512 * 1024 * 1024):
+        self.diretorio = Path(diretorio)
+        self.diretorio.mkdir(parents=True, exist_ok=True)
+        self.ttl_segundos = ttl_segundos
+        self.tamanho_maximo_bytes = tamanho_maximo_bytes
+
+        self._lock = threading.Lock()
+        self._tamanho_atual = sum(p.stat().st_size for p in self.diretorio.glob('*.gz'))
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidacoes = 0
+
+    @classmethod
+    def do_ambiente(cls) -> 'CacheRespostas | None':
+        """Instancia a partir de SCRAPER_CACHE_DIR (+ TTL/limite opcionais). None se desligado."""
+        diretorio = os.getenv('SCRAPER_CACHE_DIR')
+        if not diretorio:
+            return None
+        return cls(
+            diretorio,
+            ttl_segundos=float(os.getenv('SCRAPER_CACHE_TTL_SEGUNDOS', 6 * 3600)),
+            tamanho_maximo_bytes=int(float(os.getenv('SCRAPER_CACHE_MAX_MB', 512)) * 1024 * 1024),
+        )
+
+    # ------------------------------------------------------------------
+    # Leitura
+    # ------------------------------------------------------------------
+
+    def obter(self, url: str, params: dict | None = None) -> EntradaCache | None:
+        """Entrada armazenada (fresca ou não) ou None. Atualiza a recência LRU."""
+        chave = chave_requisicao(url, params)
+        return self._ler(self.diretorio / f"{chave}.gz")
+
+    def _ler(self, caminho: Path) -> EntradaCache | None:
+        try:
+            bruto = gzip.decompress(caminho.read_bytes())
+            cabecalho, corpo = bruto.split(b'\n', 1)
+            meta = json.loads(cabecalho)
+            os.utime(caminho)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, EOFError) as e:
+            logger.warning(f"[CACHE] Entrada corrompida {caminho.name}: {e} — descartando")
+            self._remover(caminho)
+            return None
+
+        return EntradaCache(
+            chave=caminho.stem, url=meta['url'], status=meta['status'], headers=meta['headers'],
+            corpo=corpo, salva_em=meta['salva_em'], caminho=caminho,
+        )
+
+    def obter_fresca(self, url: str, params: dict | None = None) -> tuple[EntradaCache | None, bool]:
+        """(entrada, fresca). Contabiliza hit/miss."""
+        entrada = self.obter(url, params)
+        fresca = entrada is not None and entrada.fresca(self.ttl_segundos)
+        with self._lock:
+            if fresca:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return entrada, fresca
+
+    # ------------------------------------------------------------------
+    # Escrita
+    # ------------------------------------------------------------------
+
+    def salvar(self, url: str, params: dict | None, status: int, headers, corpo: bytes):
+        """Grava (atomicamente) a resposta e aplica o limite de tamanho."""
+        chave = chave_requisicao(url, params)
+        meta = {
+            'url': normalizar_url(url, params),
+            'status': status,
+            'headers': {str(k): str(v) for k, v in dict(headers).items()},
+            'salva_em': time.time(),
+        }
+        dados = gzip.compress(json.dumps(meta).encode('utf-8') + b'\n' + corpo, compresslevel=6)
+
+        caminho = self.diretorio / f"{chave}.gz"
+        temporario = caminho.with_suffix(f'.{threading.get_ident()}.tmp')
+        temporario.write_bytes(dados)
+        tamanho_anterior = caminho.stat().st_size if caminho.exists() else 0
+        os.replace(temporario, caminho)
+
+        with self._lock:
+            self._tamanho_atual += len(dados) - tamanho_anterior
+            excedeu = self._tamanho_atual > self.tamanho_maximo_bytes
+        if excedeu:
+            self._aplicar_limite()
+
+    def renovar(self, entrada: EntradaCache):
+        """Após um 304: a entrada volta a ser fresca sem rebaixar o corpo."""
+        with self._lock:
+            self.revalidacoes += 1
+        self.salvar(entrada.url, None, entrada.status, entrada.headers, entrada.corpo)
+
+    def _aplicar_limite(self):
+        """Remove as entradas menos recentemente usadas até caber no limite."""
+        with self._lock:
+            arquivos = sorted(self.diretorio.glob('*.gz'), key=lambda p: p.stat().st_mtime)
+            for caminho in arquivos:
+                if self._tamanho_atual <= self.tamanho_maximo_bytes * 0.9:
+                    break
+                try:
+                    self._tamanho_atual -= caminho.stat().st_size
+                    caminho.unlink()
+                except FileNotFoundError:
+                    continue
+
+    def _remover(self, caminho: Path):
+        try:
+            tamanho = caminho.stat().st_size
+            caminho.unlink()
+        except FileNotFoundError:
+            return
+        with self._lock:
+            self._tamanho_atual -= tamanho
+
+    def estatisticas(self) -> dict:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'revalidacoes_304': self.revalidacoes,
+            'tamanho_mb': round(self._tamanho_atual / 1024 / 1024, 2),
+        }
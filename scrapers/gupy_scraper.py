@@ -1,5 +1,10 @@
 import logging
-from .base_scraper import BaseScraper
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
+
+from .base_scraper import BaseScraper, BuscaIncompleta
+from .limitador_taxa import LimitadorTaxa
 
 logger = logging.getLogger(__name__)
 
@@ -7,8 +12,18 @@ logger = logging.getLogger(__name__)
 class GupyScraper(BaseScraper):
     """Implementação do scraper específico para a API da Gupy."""
 
-    def __init__(self):
-        super().__init__(nome_plataforma="Gupy")
+    # Páginas extras buscadas simultaneamente (com LimitadorTaxa configurado)
+    _PAGINAS_EM_PARALELO = 4
+
+    def __init__(self, requisicoes_por_segundo: float | None = None):
+        """
+        Args:
+            requisicoes_por_segundo: se informado, troca o delay aleatório por
+                um token bucket com essa taxa — necessário para rodar várias
+                combinações em paralelo (scraper_runner.executar(concorrencia=N)).
+        """
+        limitador = LimitadorTaxa(requisicoes_por_segundo) if requisicoes_por_segundo else None
+        super().__init__(nome_plataforma="Gupy", limitador=limitador)
 
     def _mapear_modalidade(self, modalidade: str) -> str:
         """
@@ -67,52 +82,137 @@ class GupyScraper(BaseScraper):
         import json
         try:
             # Decodifica bytes crus como UTF-8 (garantido)
-            texto = response.content.decode('utf-8')
-            return json.loads(texto)
+            with self.metricas.etapa('decode'):
+                texto = response.content.decode('utf-8')
+            with self.metricas.etapa('parse'):
+                return json.loads(texto)
         except (UnicodeDecodeError, json.JSONDecodeError) as e:
             logger.warning(f"[GUPY] Falha decodificando UTF-8: {e}. Tentando response.json() como fallback.")
             return response.json()
 
     def _extrair_vagas_da_pagina(self, lista_resultados: list) -> list:
         """Processa uma página de resultados da API e retorna vagas padronizadas."""
-        vagas = []
+        with self.metricas.etapa('normalizacao'):
+            vagas = []
 
-        for item in lista_resultados:
-            link = item.get('jobUrl', '')
-            if not link:
-                continue
-
-            # padronizar_vaga (do BaseScraper) já aplica consertar_mojibake
-            # automaticamente em titulo/empresa/modalidade — protege mesmo que
-            # algum byte UTF-8 tenha vazado mal-decodificado.
-            vaga = self.padronizar_vaga(
-                id_vaga=self.gerar_id_deterministico(link),
-                titulo=item.get('name', 'Título não informado'),
-                empresa=item.get('careerPageName', 'Confidencial'),
-                modalidade=self._mapear_workplace_legivel(item.get('workplaceType')),
-                link=link,
-                data_pub=item.get('publishedDate'),
-                city=item.get('city'),
-                state=item.get('state'),
-                country=item.get('country'),
-                workplace_type=item.get('workplaceType'),
-                is_remote=item.get('isRemoteWork', False),
-                tipo_contrato=self._mapear_tipo_contrato(item.get('type')),
-                prazo_inscricao=item.get('applicationDeadline'),
-                pcd=item.get('disabilities', False),
-            )
-            vagas.append(vaga)
+            for item in lista_resultados:
+                link = item.get('jobUrl', '')
+                if not link:
+                    continue
+
+                # padronizar_vaga (do BaseScraper) já aplica consertar_mojibake
+                # automaticamente em titulo/empresa/modalidade — protege mesmo que
+                # algum byte UTF-8 tenha vazado mal-decodificado.
+                vaga = self.padronizar_vaga(
+                    id_vaga=self.gerar_id_deterministico(link),
+                    titulo=item.get('name', 'Título não informado'),
+                    empresa=item.get('careerPageName', 'Confidencial'),
+                    modalidade=self._mapear_workplace_legivel(item.get('workplaceType')),
+                    link=link,
+                    data_pub=item.get('publishedDate'),
+                    city=item.get('city'),
+                    state=item.get('state'),
+                    country=item.get('country'),
+                    workplace_type=item.get('workplaceType'),
+                    is_remote=item.get('isRemoteWork', False),
+                    tipo_contrato=self._mapear_tipo_contrato(item.get('type')),
+                    prazo_inscricao=item.get('applicationDeadline'),
+                    pcd=item.get('disabilities', False),
+                )
+                vagas.append(vaga)
 
         return vagas
 
+    def _buscar_pagina(self, url: str, parametros: dict, offset: int, cancelado: threading.Event) -> list | None:
+        """
+        Baixa uma página extra e devolve os resultados crus da API.
+        None = falha HTTP ou paginação cancelada (página vazia antes dela).
+        """
+        if cancelado.is_set():
+            return None
+
+        response = self.fazer_requisicao_segura(url, params={**parametros, 'offset': offset})
+        if response.status_code != 200:
+            logger.warning(f"Paginação interrompida no offset {offset} — HTTP {response.status_code}")
+            return None
+
+        dados_pagina = self._decodificar_json_utf8(response)
+        return dados_pagina.get('data', []) if isinstance(dados_pagina, dict) else dados_pagina
+
+    def _buscar_paginas_extras(self, url: str, parametros: dict, limite: int, paginas_restantes: int,
+                               primeira_pagina: list = ()) -> Iterator[list]:
+        """
+        Busca as páginas 2..N em lote paralelo limitado e entrega uma a uma.
+
+        O total já é conhecido após a primeira página, então todos os offsets
+        são disparados de uma vez (até _PAGINAS_EM_PARALELO simultâneos). O
+        ritmo continua ditado pelo LimitadorTaxa — sem limitador, a busca é
+        sequencial como antes, para não multiplicar a taxa do delay aleatório.
+
+        Merge na ordem dos offsets: a primeira página vazia (ou com erro)
+        encerra a paginação e cancela as que ainda não começaram — mesmo
+        resultado do loop sequencial, independente da ordem de chegada.
+        Uma página abaixo do limiar do indice_dedup encerra do mesmo jeito
+        (páginas já em voo são descartadas). Uma página com erro HTTP vira
+        BuscaIncompleta; se uma página falha de vez, a exceção sobe — as
+        duas só depois de cancelar as pendentes.
+        """
+        paralelas = self._PAGINAS_EM_PARALELO if self._limitador else 1
+        cancelado = threading.Event()
+        vagas = []
+
+        with ThreadPoolExecutor(max_workers=paralelas, thread_name_prefix='gupy-pagina') as executor:
+            futuros = [
+                executor.submit(self._buscar_pagina, url, parametros, pagina * limite, cancelado)
+                for pagina in range(1, paginas_restantes + 1)
+            ]
+
+            try:
+                for indice, futuro in enumerate(futuros):
+                    resultados_pagina = futuro.result()
+                    if resultados_pagina is None:
+                        raise BuscaIncompleta(f"página {indice + 2} falhou")
+                    if not resultados_pagina:
+                        break
+
+                    vagas_pagina = self._extrair_vagas_da_pagina(resultados_pagina)
+                    esgotada = (indice < len(futuros) - 1
+                                and self._paginacao_esgotada(vagas_pagina, [*primeira_pagina, *vagas]))
+                    vagas.extend(vagas_pagina)
+                    yield vagas_pagina
+
+                    if esgotada:
+                        logger.info(f"Página {indice + 2} quase só com vagas já vistas — paginação encerrada")
+                        break
+            finally:
+                # Fim, parada, erro de uma página ou consumidor que largou o
+                # gerador: nada mais sai para a rede antes do executor fechar.
+                cancelado.set()
+                for pendente in futuros:
+                    pendente.cancel()
+
     def buscar_vagas(self, palavra_chave: str, modalidade: str, limite: int = 50) -> list:
+        """Implementação obrigatória do método de busca (todas as páginas em uma lista; parcial se falhar)."""
+        vagas = []
+        try:
+            for pagina in self.buscar_vagas_paginas(palavra_chave, modalidade, limite):
+                vagas.extend(pagina)
+        except BuscaIncompleta:
+            pass  # já logado pelo pager
+        return vagas
+
+    def buscar_vagas_paginas(self, palavra_chave: str, modalidade: str, limite: int = 50) -> Iterator[list]:
         """
-        Implementação obrigatória do método de busca.
+        Variante em streaming: entrega cada página assim que é decodificada.
 
         Paginação inteligente: se a API reporta mais vagas do que o limite
-        por página, faz requests adicionais incrementando o offset.
+        por página, busca as páginas restantes em lote paralelo
+        (_buscar_paginas_extras).
         Decodificação JSON forçada como UTF-8 para evitar mojibake em
         títulos/empresas com acentos.
+
+        Falha em qualquer página (HTTP ≠ 200, exceção) termina com
+        BuscaIncompleta depois das páginas já entregues.
         """
         url = "https://employability-portal.gupy.io/api/v1/jobs"
         tipo_trabalho = self._mapear_modalidade(modalidade)
@@ -130,7 +230,7 @@ class GupyScraper(BaseScraper):
 
             if response.status_code != 200:
                 logger.warning(f"HTTP {response.status_code} para '{palavra_chave}' + '{modalidade}'")
-                return []
+                raise BuscaIncompleta(f"HTTP {response.status_code} na primeira página")
 
             # ⚠️ FIX UTF-8: decodifica via bytes em vez de response.json()
             dados = self._decodificar_json_utf8(response)
@@ -138,33 +238,23 @@ class GupyScraper(BaseScraper):
             todas_vagas = self._extrair_vagas_da_pagina(lista_resultados)
 
             # --- Paginação ---
+            # (avaliada antes do yield: depois dele o runner já deduplicou a página)
             total_disponivel = dados.get('pagination', {}).get('total', 0) if isinstance(dados, dict) else 0
+            esgotada = total_disponivel > limite and self._paginacao_esgotada(todas_vagas)
+            yield todas_vagas
 
-            if total_disponivel > limite:
+            if esgotada:
+                logger.info(f"'{palavra_chave}' ({modalidade}): 1ª página quase só com vagas já vistas — sem páginas extras")
+            elif total_disponivel > limite:
                 paginas_restantes = (total_disponivel - limite + limite - 1) // limite
                 paginas_restantes = min(paginas_restantes, 10)  # teto de segurança
 
                 logger.info(f"Paginando '{palavra_chave}' ({modalidade}): {total_disponivel} vagas, {paginas_restantes} páginas extras")
 
-                for pagina in range(1, paginas_restantes + 1):
-                    parametros['offset'] = pagina * limite
-
-                    response = self.fazer_requisicao_segura(url, params=parametros)
-                    if response.status_code != 200:
-                        logger.warning(f"Paginação interrompida na página {pagina + 1} — HTTP {response.status_code}")
-                        break
-
-                    dados_pagina = self._decodificar_json_utf8(response)
-                    resultados_pagina = dados_pagina.get('data', []) if isinstance(dados_pagina, dict) else dados_pagina
-
-                    if not resultados_pagina:
-                        break
-
-                    vagas_pagina = self._extrair_vagas_da_pagina(resultados_pagina)
-                    todas_vagas.extend(vagas_pagina)
-
-            return todas_vagas
+                yield from self._buscar_paginas_extras(url, parametros, limite, paginas_restantes, todas_vagas)
 
+        except BuscaIncompleta:
+            raise
         except Exception as e:
             logger.error(f"Falha ao buscar vagas na Gupy — {str(e)}")
-            return []
\ No newline at end of file
+            raise BuscaIncompleta(str(e)) from e
\ No newline at end of file
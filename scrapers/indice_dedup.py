@@ -0,0 +1,73 @@
+# scrapers/indice_dedup.py
+"""
+Índice de dedup compartilhado — critério de parada da paginação por yield.
+
+LinkedinScraper.buscar_vagas pagina até _MAX_PAGINAS e a Gupy até 10
+páginas extras, mesmo quando a página que acabou de chegar é quase toda de
+vagas que o runner já viu neste run. O runner publica aqui uma visão
+só-leitura da sua dedup (urls_vistas e, opcionalmente, ids_firebase) em
+scraper.indice_dedup; os scrapers consultam pagina_esgotada() a cada
+página (junto com as páginas anteriores da mesma query, que o runner
+ainda não viu) e param de paginar quando a fração de vagas novas fica
+abaixo do limiar.
+
+Por padrão só conta como "vista" a duplicata intra-run — essas vagas já
+estão no resultado, então parar não perde nada do que foi visto. Com
+contar_existentes=True, vagas já armazenadas também contam; é mais
+agressivo, mas as vagas armazenadas das páginas não visitadas não são
+re-encontradas e saem da rota no passe final do modo delta.
+
+Com buscas concorrentes, a thread principal do runner continua mudando
+urls_vistas enquanto as threads de busca consultam. Para que a parada não
+dependa do timing, cada thread de busca avalia contra uma cópia imutável
+fixada pelo runner ao disparar a combinação (fixar_visao, por thread); sem
+visão fixada (modo sequencial) a consulta usa o set vivo, que só a própria
+thread principal muda.
+"""
+import threading
+
+
+class IndiceDedup:
+    """Visão da dedup do runner para os scrapers decidirem quando parar de paginar."""
+
+    def __init__(self, urls_vistas: set, ids_existentes: set, limiar: float,
+                 contar_existentes: bool = False):
+        self.urls_vistas = urls_vistas
+        self.ids_existentes = ids_existentes
+        self.limiar = limiar
+        self.contar_existentes = contar_existentes
+        self.paginas_avaliadas = 0
+        self.paradas = 0
+        self._lock = threading.Lock()
+        self._visao = threading.local()
+
+    def fixar_visao(self, urls_vistas: frozenset | None):
+        """Na thread atual, avalia contra esta cópia de urls_vistas (None = volta ao set vivo)."""
+        self._visao.urls_vistas = urls_vistas
+
+    def fracao_novas(self, vagas: list, anteriores: list = ()) -> float:
+        """
+        Fração das vagas da página ainda não vistas — nem pelo runner nem
+        nas páginas `anteriores` da mesma query. 1.0 para página vazia.
+        """
+        if not vagas:
+            return 1.0
+        links_query = {vaga['link'] for vaga in anteriores}
+        urls_vistas = getattr(self._visao, 'urls_vistas', None)
+        if urls_vistas is None:
+            urls_vistas = self.urls_vistas
+        novas = sum(
+            1 for vaga in vagas
+            if vaga['link'] not in urls_vistas
+            and vaga['link'] not in links_query
+            and not (self.contar_existentes and vaga['id'] in self.ids_existentes)
+        )
+        return novas / len(vagas)
+
+    def pagina_esgotada(self, vagas: list, anteriores: list = ()) -> bool:
+        """True se a página ficou abaixo do limiar — a query deve parar de paginar."""
+        esgotada = self.fracao_novas(vagas, anteriores) < self.limiar
+        with self._lock:
+            self.paginas_avaliadas += 1
+            self.paradas += esgotada
+        return esgotada
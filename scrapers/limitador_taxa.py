@@ -0,0 +1,48 @@
+# scrapers/limitador_taxa.py
+"""
+Token bucket por host, compartilhado entre threads.
+
+Substitui o sleep fixo de fazer_requisicao_segura quando o scraper roda em
+modo concorrente: em vez de cada chamada dormir 1.5–3.5s por conta própria
+(o que não limita nada quando há N workers), todas as requisições para o
+mesmo host disputam o mesmo balde de fichas. A taxa global fica garantida
+independente de quantas combinações estão em voo.
+
+Algoritmo: cada host tem `fichas` (até `rajada`) repostas continuamente a
+`requisicoes_por_segundo`. Quem chega sem ficha reserva a próxima (o saldo
+fica negativo) e dorme só o tempo até ela existir — fora do lock, para não
+serializar as outras threads.
+"""
+import threading
+import time
+
+
+class LimitadorTaxa:
+    """Token bucket thread-safe, um balde por host."""
+
+    def __init__(self, requisicoes_por_segundo: float, rajada: int = 1):
+        if requisicoes_por_segundo <= 0:
+            raise ValueError("requisicoes_por_segundo deve ser positivo")
+        self.requisicoes_por_segundo = requisicoes_por_segundo
+        self.rajada = max(1, rajada)
+        self._baldes: dict[str, list[float]] = {}  # host → [fichas, ultima_reposicao]
+        self._lock = threading.Lock()
+
+    def adquirir(self, host: str, dormir=time.sleep) -> float:
+        """
+        Bloqueia até haver ficha para o host. Retorna o tempo esperado (s).
+        `dormir` permite ao scraper trocar a espera (no-op no modo replay).
+        """
+        with self._lock:
+            agora = time.monotonic()
+            balde = self._baldes.setdefault(host, [float(self.rajada), agora])
+
+            fichas = min(self.rajada, balde[0] + (agora - balde[1]) * self.requisicoes_por_segundo)
+            fichas -= 1
+            balde[0], balde[1] = fichas, agora
+
+            espera = -fichas / self.requisicoes_por_segundo if fichas < 0 else 0.0
+
+        if espera > 0:
+            dormir(espera)
+        return espera
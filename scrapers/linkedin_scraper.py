@@ -46,13 +46,16 @@ Seletores CSS confirmados (Abril/2026):
 """
 import logging
 import random
-import time
+import re
+from typing import Iterator
 from urllib.parse import quote_plus
 
 from curl_cffi import requests as cffi_requests
+from lxml import etree
 from lxml import html as lxml_html
 
-from .base_scraper import BaseScraper
+from .base_scraper import BaseScraper, BuscaIncompleta
+from .vaga import Vaga
 
 logger = logging.getLogger(__name__)
 
@@ -100,6 +103,29 @@ _BLOQUEIO_SIGNALS = [
 
 _TAMANHO_MINIMO_RESPONSE = 20_000
 
+# Detecção de bloqueio direto nos bytes (case-insensitive, sem decode/lower)
+_RE_BLOQUEIO = re.compile(
+    b'|'.join(re.escape(sinal.encode()) for sinal in _BLOQUEIO_SIGNALS), re.IGNORECASE
+)
+_RE_CARD = re.compile(rb'job-search-card', re.IGNORECASE)
+_RE_PAGINA_BUSCA = re.compile(rb'no-results|jobs-search', re.IGNORECASE)
+
+# Parsing: XPath dos cards compilado uma vez; tags lidas na travessia do card
+_XPATH_CARDS = etree.XPath(
+    '//div[contains(@class, "base-card") and contains(@class, "job-search-card")]'
+)
+_TAGS_CARD = ('a', 'h3', 'h4', 'span', 'time')
+
+
+def _primeiro_texto(elemento) -> str | None:
+    """Equivalente a elemento.xpath('text()')[0]: primeiro nó de texto direto."""
+    if elemento.text is not None:
+        return elemento.text
+    for filho in elemento:
+        if filho.tail is not None:
+            return filho.tail
+    return None
+
 
 class LinkedinScraper(BaseScraper):
     """
@@ -114,6 +140,9 @@ class LinkedinScraper(BaseScraper):
     _VAGAS_POR_PAGINA = 60
     _MAX_PAGINAS = 4
 
+    # Cards por request (o offset anda de 25 em 25) — custo usado pelo planejador
+    vagas_por_requisicao = 25
+
     # --- Limites globais de segurança ---
     _MAX_REQUESTS_POR_EXECUCAO = 2000
     _MAX_ERROS_CONSECUTIVOS = 5
@@ -138,6 +167,8 @@ class LinkedinScraper(BaseScraper):
         super().__init__(nome_plataforma="LinkedIn")
 
         self._session_aquecida: bool = False
+        # A última página veio da rede (False = cache fresco): só então pausar
+        self._ultima_da_rede: bool = False
         self._iniciar_session()
 
         self._requests_realizados: int = 0
@@ -155,6 +186,11 @@ class LinkedinScraper(BaseScraper):
         self._session.headers.update(self._gerar_headers_base())
         logger.info("[LINKEDIN] Session curl_cffi criada com impersonate='chrome'")
 
+    def fechar(self):
+        """Fecha a session curl_cffi além do pool HTTP do BaseScraper."""
+        super().fechar()
+        self._session.close()
+
     def _gerar_headers_base(self) -> dict:
         """Headers de navegador moderno + Sec-Fetch-*."""
         return {
@@ -193,13 +229,13 @@ class LinkedinScraper(BaseScraper):
         try:
             self._session.headers['Referer'] = 'https://www.google.com/'
             self._session.headers['Sec-Fetch-Site'] = 'cross-site'
-            self._session.get('https://www.linkedin.com/', timeout=20)
+            self._requisitar(self._session, 'https://www.linkedin.com/', timeout=20)
             self._requests_realizados += 1
             self._delay_gaussiano(3.0, 1.0)
 
             self._session.headers['Referer'] = 'https://www.linkedin.com/'
             self._session.headers['Sec-Fetch-Site'] = 'same-origin'
-            self._session.get('https://www.linkedin.com/jobs/', timeout=20)
+            self._requisitar(self._session, 'https://www.linkedin.com/jobs/', timeout=20)
             self._requests_realizados += 1
             self._delay_gaussiano(3.0, 1.0)
 
@@ -219,13 +255,13 @@ class LinkedinScraper(BaseScraper):
         """Delay com distribuição gaussiana + clamp natural [1.5s, media*3]."""
         delay = random.gauss(media, desvio)
         delay = max(1.5, min(delay, media * 3))
-        time.sleep(delay)
+        self._pausar(delay)
 
     def _delay_gaussiano_clampado(self, media: float, desvio: float, minimo: float, maximo: float) -> float:
         """Variante com clamp customizado [min, max]. Retorna delay aplicado."""
         delay = random.gauss(media, desvio)
         delay = max(minimo, min(delay, maximo))
-        time.sleep(delay)
+        self._pausar(delay)
         return delay
 
     # ==================================================================
@@ -233,25 +269,28 @@ class LinkedinScraper(BaseScraper):
     # ==================================================================
 
     def _detectar_bloqueio(self, response) -> str | None:
-        """3 sinais: authwall/captcha, response pequeno, ausência de cards."""
+        """
+        3 sinais: authwall/captcha, response pequeno, ausência de cards.
+
+        Tudo direto nos bytes crus com regex pré-compiladas e case-insensitive:
+        nenhuma decodificação nem cópia lowercased da página (o parsing
+        decodifica uma única vez depois, em _extrair_vagas_brutas).
+        """
         content = response.content
-        # Decodifica como UTF-8 para análise — encoding errado aqui não importa
-        # porque só procuramos substrings ASCII (authwall, captcha, etc).
-        content_text = content.decode('utf-8', errors='ignore').lower()
         content_size = len(content)
+        tem_cards = _RE_CARD.search(content) is not None
 
-        for sinal in _BLOQUEIO_SIGNALS:
-            if sinal in content_text:
-                if 'job-search-card' in content_text:
-                    continue
-                return f"authwall/captcha detectado (sinal: '{sinal}')"
+        if not tem_cards:
+            sinal = _RE_BLOQUEIO.search(content)
+            if sinal:
+                return f"authwall/captcha detectado (sinal: '{sinal.group().decode().lower()}')"
 
         if content_size < _TAMANHO_MINIMO_RESPONSE:
-            if 'no-results' in content_text or 'jobs-search' in content_text:
+            if _RE_PAGINA_BUSCA.search(content):
                 return None
             return f"response muito pequeno ({content_size} bytes, mínimo: {_TAMANHO_MINIMO_RESPONSE})"
 
-        if content_size > 50_000 and 'job-search-card' not in content_text:
+        if content_size > 50_000 and not tem_cards:
             return "response grande mas sem cards de vaga (possível redirect para login)"
 
         return None
@@ -288,7 +327,7 @@ class LinkedinScraper(BaseScraper):
                 f"[LINKEDIN] Taxa de erro {taxa:.1%} acima do limiar ({self._TAXA_ERRO_CRITICA:.0%}). "
                 f"Pausa de recuperação de {self._PAUSA_RECUPERACAO / 60:.0f} minutos..."
             )
-            time.sleep(self._PAUSA_RECUPERACAO)
+            self._pausar(self._PAUSA_RECUPERACAO)
             self._erros_consecutivos = 0
 
     def _registrar_sucesso(self):
@@ -324,45 +363,86 @@ class LinkedinScraper(BaseScraper):
             logger.warning("[LINKEDIN] Bytes inválidos no response — usando errors='replace'")
             return content_bytes.decode('utf-8', errors='replace')
 
-    def _extrair_cards(self, html_content: bytes) -> list:
-        """Extrai cards de vaga do HTML (bytes → UTF-8 string → lxml)."""
+    def _extrair_vagas_brutas(self, html_content: bytes) -> list:
+        """
+        Extrai os dados brutos de todos os cards da página (bytes → dicts).
+
+        Decodifica uma única vez (UTF-8 explícito), localiza os cards com
+        XPath pré-compilado e lê os campos de cada card numa só travessia
+        (_parse_card). A árvore é descartada antes de retornar — só ficam
+        as strings extraídas.
+        """
         # ⚠️ FIX UTF-8: decodificamos explicitamente como UTF-8 antes de passar
         # pra lxml, garantindo que acentos sejam interpretados corretamente.
-        html_string = self._decodificar_html_utf8(html_content)
-        tree = lxml_html.fromstring(html_string)
-        return tree.xpath(
-            '//div[contains(@class, "base-card") and contains(@class, "job-search-card")]'
-        )
+        with self.metricas.etapa('decode'):
+            texto = self._decodificar_html_utf8(html_content)
+
+        with self.metricas.etapa('parse'):
+            tree = lxml_html.fromstring(texto)
+            vagas_raw = []
+            for card in _XPATH_CARDS(tree):
+                vaga_raw = self._parse_card(card)
+                if vaga_raw:
+                    vagas_raw.append(vaga_raw)
+            del tree
+        return vagas_raw
 
     def _parse_card(self, card) -> dict | None:
-        """Extrai dados brutos de um único card. Retorna None se inválido."""
-        links = card.xpath('.//a[contains(@class, "base-card__full-link")]/@href')
-        if not links:
+        """
+        Extrai dados brutos de um único card. Retorna None se inválido.
+
+        Uma travessia (card.iter) em ordem de documento substitui as seis
+        consultas XPath `contains(@class, ...)` por campo. Mesma semântica:
+        para cada campo vale o PRIMEIRO elemento cuja classe contém o marcador
+        (e que tenha o atributo, no caso de href/datetime); textos são o
+        primeiro nó de texto, com strip.
+        """
+        link = titulo = empresa = localizacao = data_pub = None
+        pendentes = 5
+
+        for elemento in card.iter(_TAGS_CARD):
+            classe = elemento.get('class') or ''
+            tag = elemento.tag
+
+            if tag == 'a':
+                if link is None and 'base-card__full-link' in classe and elemento.get('href') is not None:
+                    link = elemento.get('href')
+                    pendentes -= 1
+            elif tag == 'h3':
+                if titulo is None and 'base-search-card__title' in classe:
+                    titulo = _primeiro_texto(elemento)
+                    pendentes -= titulo is not None
+            elif tag == 'h4':
+                if empresa is None and 'base-search-card__subtitle' in classe:
+                    for ancora in elemento.iter('a'):
+                        empresa = _primeiro_texto(ancora)
+                        if empresa is not None:
+                            pendentes -= 1
+                            break
+            elif tag == 'span':
+                if localizacao is None and 'job-search-card__location' in classe:
+                    localizacao = _primeiro_texto(elemento)
+                    pendentes -= localizacao is not None
+            elif tag == 'time':
+                if data_pub is None and 'job-search-card__listdate' in classe and elemento.get('datetime') is not None:
+                    data_pub = elemento.get('datetime')
+                    pendentes -= 1
+
+            if not pendentes:
+                break
+
+        if link is None:
             return None
-        link = links[0].split('?')[0].strip()
+        link = link.split('?')[0].strip()
         if not link:
             return None
 
-        titulos = card.xpath('.//h3[contains(@class, "base-search-card__title")]/text()')
-        titulo = titulos[0].strip() if titulos else None
-
-        empresas = card.xpath('.//h4[contains(@class, "base-search-card__subtitle")]//a/text()')
-        empresa = empresas[0].strip() if empresas else None
-
-        locais = card.xpath('.//span[contains(@class, "job-search-card__location")]/text()')
-        localizacao = locais[0].strip() if locais else None
-
-        datas = card.xpath('.//time[contains(@class, "job-search-card__listdate")]/@datetime')
-        if not datas:
-            datas = card.xpath('.//time[contains(@class, "job-search-card__listdate--new")]/@datetime')
-        data_pub = datas[0].strip() if datas else None
-
         return {
             'link': link,
-            'titulo': titulo,
-            'empresa': empresa,
-            'localizacao': localizacao,
-            'data_publicacao': data_pub,
+            'titulo': titulo.strip() if titulo is not None else None,
+            'empresa': empresa.strip() if empresa is not None else None,
+            'localizacao': localizacao.strip() if localizacao is not None else None,
+            'data_publicacao': data_pub.strip() if data_pub is not None else None,
         }
 
     # ==================================================================
@@ -429,7 +509,7 @@ class LinkedinScraper(BaseScraper):
 
         return 'Não informado'
 
-    def _normalizar_vaga(self, vaga_raw: dict, modalidade_explicita: str | None = None) -> dict:
+    def _normalizar_vaga(self, vaga_raw: dict, modalidade_explicita: str | None = None) -> Vaga:
         """Conversão dict bruto → formato padronizado MyOrbita."""
         link = vaga_raw['link']
         city_raw, state_raw, country_raw = self._parse_localizacao(vaga_raw.get('localizacao'))
@@ -456,13 +536,9 @@ class LinkedinScraper(BaseScraper):
 
     def _extrair_vagas_da_pagina(self, html_content: bytes, modalidade_explicita: str | None = None) -> list:
         """Processa HTML de uma página e retorna vagas normalizadas."""
-        cards = self._extrair_cards(html_content)
-        vagas = []
-        for card in cards:
-            vaga_raw = self._parse_card(card)
-            if vaga_raw:
-                vagas.append(self._normalizar_vaga(vaga_raw, modalidade_explicita))
-        return vagas
+        vagas_raw = self._extrair_vagas_brutas(html_content)
+        with self.metricas.etapa('normalizacao'):
+            return [self._normalizar_vaga(vaga_raw, modalidade_explicita) for vaga_raw in vagas_raw]
 
     # ==================================================================
     # CAMADA 8 — Request com Todas as Proteções
@@ -488,12 +564,33 @@ class LinkedinScraper(BaseScraper):
         return url
 
     def _fazer_request(self, url: str):
-        """Request com todas as proteções ativas."""
+        """
+        Request com todas as proteções ativas.
+
+        Cache opcional (cache_http): página fresca volta sem delay nem request;
+        página expirada é revalidada com headers condicionais (304 → cache).
+        O warm-up só acontece antes do primeiro request que vai de fato à
+        rede: um replay todo em cache não aquece a session.
+        """
+        self._ultima_da_rede = False
+        entrada_cache = None
+        headers_condicionais = None
+        if self.cache_http:
+            entrada_cache, fresca = self.cache_http.obter_fresca(url)
+            if fresca:
+                self._ultimo_referer = url
+                self.metricas.registrar_cache(len(entrada_cache.corpo))
+                return entrada_cache.como_response()
+            if entrada_cache:
+                headers_condicionais = entrada_cache.headers_condicionais()
+
         if self._limite_global_atingido():
             return None
         if self._circuit_breaker_aberto():
             return None
 
+        self._aquecer_session()
+        self._ultima_da_rede = True
         self._rotacionar_user_agent()
         self._session.headers['Referer'] = self._ultimo_referer
         self._session.headers['Sec-Fetch-Site'] = 'same-origin'
@@ -501,15 +598,25 @@ class LinkedinScraper(BaseScraper):
         self._delay_gaussiano(self._DELAY_ENTRE_REQUESTS_MEDIA, self._DELAY_ENTRE_REQUESTS_DESVIO)
 
         try:
-            response = self._session.get(url, timeout=20)
+            response = self._requisitar(self._session, url, headers=headers_condicionais, timeout=20)
             self._requests_realizados += 1
 
+            if response.status_code == 304 and entrada_cache:
+                self.cache_http.renovar(entrada_cache)
+                self.metricas.registrar_cache(len(entrada_cache.corpo))
+                self._registrar_sucesso()
+                self._ultimo_referer = url
+                return entrada_cache.como_response()
+
             if response.status_code == 200:
                 motivo_bloqueio = self._detectar_bloqueio(response)
                 if motivo_bloqueio:
                     self._registrar_erro(motivo_bloqueio)
                     return None
 
+                if self.cache_http:
+                    self.cache_http.salvar(url, None, response.status_code, response.headers, response.content)
+
                 self._registrar_sucesso()
                 self._ultimo_referer = url
                 return response
@@ -517,7 +624,7 @@ class LinkedinScraper(BaseScraper):
             if response.status_code == 429:
                 retry_after = int(response.headers.get('Retry-After', 60))
                 self._registrar_erro(f"Rate limit (429) — aguardando {retry_after}s")
-                time.sleep(retry_after)
+                self._pausar(retry_after)
                 return None
 
             if response.status_code == 403:
@@ -538,27 +645,48 @@ class LinkedinScraper(BaseScraper):
     # ==================================================================
 
     def buscar_vagas(self, palavra_chave: str, modalidade: str, limite: int = 50) -> list:
+        """Implementação obrigatória do método de busca (todas as páginas em uma lista; parcial se falhar)."""
+        vagas = []
+        try:
+            for pagina in self.buscar_vagas_paginas(palavra_chave, modalidade, limite):
+                vagas.extend(pagina)
+        except BuscaIncompleta:
+            pass  # já logado pelo pager
+        return vagas
+
+    def buscar_vagas_paginas(self, palavra_chave: str, modalidade: str, limite: int = 50) -> Iterator[list]:
         """
-        Implementação obrigatória do método de busca.
+        Variante em streaming: entrega cada página assim que é parseada, e o
+        runner deduplica/publica antes da pausa intermediária seguinte.
 
         Fluxo de pausas:
         - Entre requests da mesma keyword: delay curto (~6s gaussiano)
         - Entre páginas da mesma keyword: pausa intermediária [20-30s]
           (só se houver próxima página — nunca após a última)
         - Entre keywords diferentes: cooldown (~8s)
+        Pausas só depois de páginas que foram à rede: páginas frescas do
+        cache_http não esperam, e uma keyword toda em cache não tem cooldown.
+
+        Com self.indice_dedup (runner), uma página abaixo do limiar de vagas
+        novas encerra a paginação — economiza a pausa intermediária e as
+        páginas seguintes.
+
+        Página sem resposta (limite global, circuit breaker, bloqueio, erro
+        HTTP) termina com BuscaIncompleta depois das páginas já entregues.
         """
         if self._limite_global_atingido():
-            return []
+            raise BuscaIncompleta("limite global de requests atingido")
         if self._circuit_breaker_aberto():
-            return []
+            raise BuscaIncompleta("circuit breaker aberto")
 
-        self._aquecer_session()
         self._verificar_taxa_erro()
 
         modalidade_normalizada = modalidade.lower().strip() if modalidade else ''
         f_wt_code, modalidade_rotulo = F_WT_MAP.get(modalidade_normalizada, (None, None))
 
         todas_vagas = []
+        pagina_falhou = None
+        foi_a_rede = False
 
         max_paginas = min(
             (limite + self._VAGAS_POR_PAGINA - 1) // self._VAGAS_POR_PAGINA,
@@ -570,9 +698,11 @@ class LinkedinScraper(BaseScraper):
             url = self._montar_url(palavra_chave, offset, f_wt=f_wt_code)
 
             response = self._fazer_request(url)
+            foi_a_rede = foi_a_rede or self._ultima_da_rede
 
             if not response:
                 logger.warning(f"[LINKEDIN] Paginação interrompida na página {pagina + 1}")
+                pagina_falhou = pagina + 1
                 break
 
             vagas_pagina = self._extrair_vagas_da_pagina(response.content, modalidade_rotulo)
@@ -581,15 +711,23 @@ class LinkedinScraper(BaseScraper):
                 logger.info(f"[LINKEDIN] Página {pagina + 1} vazia — fim dos resultados")
                 break
 
+            eh_ultima_pagina = (pagina == max_paginas - 1)
+            esgotada = not eh_ultima_pagina and self._paginacao_esgotada(vagas_pagina, todas_vagas)
             todas_vagas.extend(vagas_pagina)
 
             logger.info(
                 f"[LINKEDIN] Página {pagina + 1}: {len(vagas_pagina)} vagas "
                 f"(acumulado: {len(todas_vagas)})"
             )
+            yield vagas_pagina
 
-            eh_ultima_pagina = (pagina == max_paginas - 1)
-            if not eh_ultima_pagina:
+            if esgotada:
+                logger.info(
+                    f"[LINKEDIN] Página {pagina + 1} quase só com vagas já vistas "
+                    f"(< {self.indice_dedup.limiar:.0%} novas) — paginação encerrada"
+                )
+                break
+            if not eh_ultima_pagina and self._ultima_da_rede:
                 delay_real = self._delay_gaussiano_clampado(
                     self._PAUSA_INTERMEDIARIA_MEDIA,
                     self._PAUSA_INTERMEDIARIA_DESVIO,
@@ -604,6 +742,7 @@ class LinkedinScraper(BaseScraper):
         rotulo_log = modalidade_rotulo or 'todas'
         logger.info(f"[LINKEDIN] '{palavra_chave}' ({rotulo_log}): {len(todas_vagas)} vagas coletadas")
 
-        self._delay_gaussiano(self._DELAY_ENTRE_KEYWORDS_MEDIA, self._DELAY_ENTRE_KEYWORDS_DESVIO)
-
-        return todas_vagas
\ No newline at end of file
+        if foi_a_rede:
+            self._delay_gaussiano(self._DELAY_ENTRE_KEYWORDS_MEDIA, self._DELAY_ENTRE_KEYWORDS_DESVIO)
+        if pagina_falhou is not None:
+            raise BuscaIncompleta(f"página {pagina_falhou} sem resposta")
\ No newline at end of file
@@ -0,0 +1,190 @@
+# scrapers/metricas.py
+"""
+Métricas por etapa de uma execução — viram o relatório JSON do run.
+
+O "vagas/segundo" do finalizar_scraping mistura pausa deliberada (delays
+anti-ban, token bucket) com trabalho real, então um run lento não diz se
+o culpado foi a rede, o parsing, a dedup ou o Firebase. Aqui cada etapa
+acumula seu tempo de parede:
+
+    pausa         BaseScraper._pausar (delays, backoff, limitador)
+    pausa_sobreposta  parte das pausas coberta por trabalho (SCRAPER_SOBREPOR_PAUSAS)
+    rede          GET real (sessão requests ou curl_cffi)
+    decode        bytes → str
+    parse         JSON / HTML → dados brutos
+    normalizacao  dados brutos → Vaga
+    dedup         filtrar_duplicadas
+    upload        update / set no sink (Firebase ou local)
+    leitura_firebase  carregar_ids_firebase
+    modelo_leitura    montagem de shards/facetas (publicar_modelo_leitura)
+    mudancas          hash + diff do feed de mudanças
+    duplicatas        impressões digitais + delta do índice entre plataformas
+    arquivo           gravação do arquivo colunar da execução
+    historico         upserts por checkpoint no histórico SQLite
+
+Com buscas concorrentes o tempo é somado entre as threads (pode passar da
+duração do run). Junto vão: histograma de latência das requisições,
+status HTTP, bytes baixados (rede e cache) e enviados, e vagas
+encontradas/novas por palavra-chave × modalidade.
+
+Leve de propósito: um perf_counter por etapa e um lock curto por registro.
+"""
+import json
+import statistics
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+# Limites superiores (ms) dos baldes do histograma de latência
+LIMITES_LATENCIA_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class MetricasExecucao:
+    """Tempos por etapa e contadores de um run, thread-safe."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.segundos_por_etapa: dict[str, float] = defaultdict(float)
+        self.chamadas_por_etapa: dict[str, int] = defaultdict(int)
+        self._latencias: list[float] = []
+        self.status_http: Counter = Counter()
+        self.bytes_baixados = 0
+        self.bytes_cache = 0
+        self.bytes_enviados = 0
+        self.vagas_por_palavra: dict[str, dict] = {}
+
+    # ------------------------------------------------------------------
+    # Registro
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def etapa(self, nome: str):
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.adicionar(nome, time.perf_counter() - inicio)
+
+    def adicionar(self, nome: str, segundos: float):
+        with self._lock:
+            self.segundos_por_etapa[nome] += segundos
+            self.chamadas_por_etapa[nome] += 1
+
+    def registrar_requisicao(self, segundos: float, status, tamanho: int):
+        """Um GET que foi à rede. `status` = código HTTP ou 'erro'."""
+        with self._lock:
+            self.segundos_por_etapa['rede'] += segundos
+            self.chamadas_por_etapa['rede'] += 1
+            self._latencias.append(segundos)
+            self.status_http[str(status)] += 1
+            self.bytes_baixados += tamanho
+
+    def registrar_cache(self, tamanho: int):
+        with self._lock:
+            self.bytes_cache += tamanho
+
+    def registrar_upload(self, segundos: float, tamanho: int):
+        with self._lock:
+            self.segundos_por_etapa['upload'] += segundos
+            self.chamadas_por_etapa['upload'] += 1
+            self.bytes_enviados += tamanho
+
+    def registrar_palavra(self, rota: str, palavra: str, modalidade: str, encontradas: int, novas: int):
+        with self._lock:
+            self.vagas_por_palavra.setdefault(rota, {}).setdefault(palavra, {})[modalidade] = {
+                'encontradas': encontradas, 'novas': novas,
+            }
+
+    def exportar(self) -> dict:
+        """Estado bruto (picklable) para mesclar() em outro processo."""
+        with self._lock:
+            return {
+                'segundos_por_etapa': dict(self.segundos_por_etapa),
+                'chamadas_por_etapa': dict(self.chamadas_por_etapa),
+                'latencias': list(self._latencias),
+                'status_http': dict(self.status_http),
+                'bytes_baixados': self.bytes_baixados,
+                'bytes_cache': self.bytes_cache,
+                'bytes_enviados': self.bytes_enviados,
+                'vagas_por_palavra': self.vagas_por_palavra,
+            }
+
+    def mesclar(self, estado: dict):
+        """Soma o estado exportado por um worker (uma categoria por processo)."""
+        with self._lock:
+            for nome, segundos in estado['segundos_por_etapa'].items():
+                self.segundos_por_etapa[nome] += segundos
+            for nome, chamadas in estado['chamadas_por_etapa'].items():
+                self.chamadas_por_etapa[nome] += chamadas
+            self._latencias.extend(estado['latencias'])
+            self.status_http.update(estado['status_http'])
+            self.bytes_baixados += estado['bytes_baixados']
+            self.bytes_cache += estado['bytes_cache']
+            self.bytes_enviados += estado['bytes_enviados']
+            for rota, palavras in estado['vagas_por_palavra'].items():
+                self.vagas_por_palavra.setdefault(rota, {}).update(palavras)
+
+    # ------------------------------------------------------------------
+    # Leitura
+    # ------------------------------------------------------------------
+
+    def histograma_latencia(self) -> dict:
+        baldes = {f"<={limite}ms": 0 for limite in LIMITES_LATENCIA_MS}
+        baldes[f">{LIMITES_LATENCIA_MS[-1]}ms"] = 0
+        for segundos in self._latencias:
+            ms = segundos * 1000
+            for limite in LIMITES_LATENCIA_MS:
+                if ms <= limite:
+                    baldes[f"<={limite}ms"] += 1
+                    break
+            else:
+                baldes[f">{LIMITES_LATENCIA_MS[-1]}ms"] += 1
+        return baldes
+
+    def percentis_latencia(self) -> dict:
+        if len(self._latencias) < 2:
+            return {'p50_ms': None, 'p90_ms': None, 'p99_ms': None, 'max_ms': None}
+        cortes = statistics.quantiles(self._latencias, n=100, method='inclusive')
+        return {
+            'p50_ms': round(cortes[49] * 1000, 1),
+            'p90_ms': round(cortes[89] * 1000, 1),
+            'p99_ms': round(cortes[98] * 1000, 1),
+            'max_ms': round(max(self._latencias) * 1000, 1),
+        }
+
+    def como_dict(self) -> dict:
+        with self._lock:
+            etapas = {
+                nome: {'segundos': round(segundos, 3), 'chamadas': self.chamadas_por_etapa[nome]}
+                for nome, segundos in sorted(self.segundos_por_etapa.items())
+            }
+            trabalho = sum(s for nome, s in self.segundos_por_etapa.items() if nome != 'pausa')
+            return {
+                'etapas': etapas,
+                'segundos_trabalho': round(trabalho, 3),
+                'segundos_pausa': round(self.segundos_por_etapa.get('pausa', 0.0), 3),
+                'requisicoes': {
+                    'total': len(self._latencias),
+                    'status': dict(self.status_http),
+                    'latencia': self.percentis_latencia(),
+                    'histograma': self.histograma_latencia(),
+                },
+                'bytes': {
+                    'baixados': self.bytes_baixados,
+                    'cache': self.bytes_cache,
+                    'enviados': self.bytes_enviados,
+                },
+                'vagas_por_palavra': self.vagas_por_palavra,
+            }
+
+    def resumo_etapas(self) -> str:
+        """'rede 812.3s · parse 14.2s · ...' ordenado do maior para o menor."""
+        with self._lock:
+            itens = sorted(self.segundos_por_etapa.items(), key=lambda item: -item[1])
+        return ' · '.join(f"{nome} {segundos:.1f}s" for nome, segundos in itens)
+
+    def salvar(self, caminho: str, extras: dict | None = None):
+        relatorio = {**(extras or {}), **self.como_dict()}
+        with open(caminho, 'w', encoding='utf-8') as arquivo:
+            json.dump(relatorio, arquivo, ensure_ascii=False, indent=2)
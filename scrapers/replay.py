@@ -0,0 +1,209 @@
+# scrapers/replay.py
+"""
+Gravação e reprodução de respostas HTTP — benchmarks offline e determinísticos.
+
+Nada no GupyScraper ou no LinkedinScraper pode ser medido sem bater nos
+sites reais e esperar os delays anti-ban (~2h40 no LinkedIn DEV). Este
+módulo separa as duas coisas:
+
+- Gravação (SCRAPER_GRAVAR_DIR): durante um run real, toda resposta
+  (status, headers, corpo — inclusive 403/429/authwall) que passa pela
+  sessão requests do BaseScraper ou pela session curl_cffi do LinkedIn é
+  salva no diretório de fixtures.
+- Replay (SCRAPER_REPLAY_DIR): as duas sessões passam a ser servidas pelas
+  fixtures, sem rede, e toda espera deliberada (_pausar, token bucket)
+  vira no-op. Request sem fixture recebe 404 (logado).
+
+As fixtures usam o mesmo formato e a mesma chave (chave_requisicao sobre a
+URL final, já com a query) do cache HTTP — um diretório gravado pode ser
+inspecionado com CacheRespostas.obter. Nos dois modos o cache HTTP é
+desligado: na gravação, um hit do cache deixaria a fixture incompleta; no
+replay, a fixture é a única fonte.
+
+benchmarks/replay_offline.py roda executar_buscas + publicação sobre um
+diretório gravado e cronometra cada etapa.
+"""
+import logging
+import os
+import sys
+import threading
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from .cache_http import CacheRespostas
+
+logger = logging.getLogger(__name__)
+
+
+class AcervoFixtures(CacheRespostas):
+    """Diretório de fixtures: cache sem TTL nem limite de tamanho."""
+
+    def __init__(self, diretorio: str):
+        super().__init__(diretorio, ttl_segundos=float('inf'), tamanho_maximo_bytes=sys.maxsize)
+        self.gravadas = 0
+        self.servidas = 0
+        self.ausentes = 0
+        self._lock_contagem = threading.Lock()
+
+    def gravar(self, url: str, status: int, headers, corpo: bytes):
+        self.salvar(url, None, status, headers, corpo)
+        with self._lock_contagem:
+            self.gravadas += 1
+
+    def resposta(self, url: str) -> requests.Response:
+        """Resposta gravada para a URL ou 404 sintético se não houver fixture."""
+        entrada = self.obter(url)
+        with self._lock_contagem:
+            if entrada is None:
+                self.ausentes += 1
+            else:
+                self.servidas += 1
+
+        if entrada is None:
+            logger.warning(f"[REPLAY] Sem fixture para {url} — respondendo 404")
+            response = requests.Response()
+            response.status_code = 404
+            response.reason = 'Sem fixture'
+            response._content = b''
+            response.headers = CaseInsensitiveDict()
+            response.url = url
+            return response
+        return entrada.como_response()
+
+    def entradas(self):
+        """Todas as fixtures gravadas, em ordem de chave (uso dos benchmarks)."""
+        for caminho in sorted(self.diretorio.glob('*.gz')):
+            entrada = self._ler(caminho)
+            if entrada is not None:
+                yield entrada
+
+    def estatisticas(self) -> dict:
+        return {
+            'gravadas': self.gravadas,
+            'servidas': self.servidas,
+            'ausentes': self.ausentes,
+            'tamanho_mb': round(self._tamanho_atual / 1024 / 1024, 2),
+        }
+
+
+# ---------------------------------------------------------------------------
+# Sessão requests (BaseScraper._sessao_http)
+# ---------------------------------------------------------------------------
+
+class _AdaptadorGravacao(BaseAdapter):
+    """Delegação para o adaptador real + cópia de cada resposta no acervo."""
+
+    def __init__(self, adaptador: BaseAdapter, acervo: AcervoFixtures):
+        super().__init__()
+        self._adaptador = adaptador
+        self._acervo = acervo
+
+    def send(self, request, **kwargs):
+        response = self._adaptador.send(request, **kwargs)
+        self._acervo.gravar(request.url, response.status_code, response.headers, response.content)
+        return response
+
+    def close(self):
+        self._adaptador.close()
+
+
+class _AdaptadorReplay(BaseAdapter):
+    """Transporte sem rede: responde com as fixtures do acervo."""
+
+    def __init__(self, acervo: AcervoFixtures):
+        super().__init__()
+        self._acervo = acervo
+
+    def send(self, request, **kwargs):
+        response = self._acervo.resposta(request.url)
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self):
+        pass
+
+
+def _montar(sessao: requests.Session, criar_adaptador):
+    for prefixo in ('https://', 'http://'):
+        sessao.mount(prefixo, criar_adaptador(sessao.get_adapter(prefixo)))
+
+
+# ---------------------------------------------------------------------------
+# Session curl_cffi (LinkedinScraper._session)
+# ---------------------------------------------------------------------------
+
+class _SessaoGravacao:
+    """Proxy da session curl_cffi que copia cada resposta de get() no acervo."""
+
+    def __init__(self, sessao, acervo: AcervoFixtures):
+        self._sessao = sessao
+        self._acervo = acervo
+
+    def get(self, url, **kwargs):
+        response = self._sessao.get(url, **kwargs)
+        self._acervo.gravar(url, response.status_code, response.headers, response.content)
+        return response
+
+    def __getattr__(self, nome):
+        return getattr(self._sessao, nome)
+
+
+class _SessaoReplay:
+    """Substituta da session curl_cffi: headers mutáveis + get() servido pelo acervo."""
+
+    def __init__(self, acervo: AcervoFixtures, headers=None):
+        self._acervo = acervo
+        self.headers = CaseInsensitiveDict(headers or {})
+
+    def get(self, url, **kwargs):
+        return self._acervo.resposta(url)
+
+    def close(self):
+        pass
+
+
+# ---------------------------------------------------------------------------
+# Instrumentação
+# ---------------------------------------------------------------------------
+
+def gravar(scraper, diretorio: str) -> AcervoFixtures:
+    """Liga a gravação das respostas do scraper em `diretorio`."""
+    acervo = AcervoFixtures(diretorio)
+    scraper.cache_http = None
+    _montar(scraper._sessao_http, lambda adaptador: _AdaptadorGravacao(adaptador, acervo))
+    if hasattr(scraper, '_session'):
+        scraper._session = _SessaoGravacao(scraper._session, acervo)
+    scraper.acervo_fixtures = acervo
+    logger.info(f"[REPLAY] Gravando respostas em '{diretorio}'")
+    return acervo
+
+
+def reproduzir(scraper, diretorio: str) -> AcervoFixtures:
+    """Troca as sessões do scraper pelas fixtures de `diretorio` e desliga as pausas."""
+    acervo = AcervoFixtures(diretorio)
+    scraper.cache_http = None
+    scraper.pausas_ativas = False
+    _montar(scraper._sessao_http, lambda _adaptador: _AdaptadorReplay(acervo))
+    if hasattr(scraper, '_session'):
+        headers = dict(scraper._session.headers)
+        scraper._session.close()
+        scraper._session = _SessaoReplay(acervo, headers)
+    scraper.acervo_fixtures = acervo
+    logger.info(f"[REPLAY] Reproduzindo respostas de '{diretorio}' (sem rede, sem pausas)")
+    return acervo
+
+
+def instrumentar_do_ambiente(scraper) -> AcervoFixtures | None:
+    """Aplica SCRAPER_REPLAY_DIR ou SCRAPER_GRAVAR_DIR (nessa precedência), se definidos."""
+    if not hasattr(scraper, '_sessao_http'):
+        return None
+    diretorio_replay = os.getenv('SCRAPER_REPLAY_DIR')
+    if diretorio_replay:
+        return reproduzir(scraper, diretorio_replay)
+    diretorio_gravacao = os.getenv('SCRAPER_GRAVAR_DIR')
+    if diretorio_gravacao:
+        return gravar(scraper, diretorio_gravacao)
+    return None
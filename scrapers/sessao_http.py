@@ -0,0 +1,112 @@
+# scrapers/sessao_http.py
+"""
+Sessão HTTP com pool de conexões para os scrapers baseados em `requests`.
+
+Antes, fazer_requisicao_segura chamava `requests.get` do módulo — cada
+página da Gupy abria uma conexão TCP + handshake TLS novos. Uma
+`requests.Session` mantém as conexões vivas (keep-alive) e as reaproveita
+entre chamadas, inclusive entre threads do modo concorrente.
+
+Compressão: o Accept-Encoding vem de urllib3.make_headers, que só anuncia
+`br` quando o pacote `brotli` está instalado — a descompressão é sempre
+transparente (response.content já chega decodificado).
+
+Métricas: o adapter troca as classes de pool/conexão do urllib3 por
+subclasses que contam conexões novas e cronometram o connect() (TCP + TLS).
+Requisições − conexões novas = conexões reaproveitadas.
+"""
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util import make_headers
+
+
+class MetricasConexao:
+    """Contadores thread-safe de uso do pool de conexões."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requisicoes = 0
+        self.conexoes_novas = 0
+        self.handshake_segundos = 0.0
+
+    def registrar_requisicao(self):
+        with self._lock:
+            self.requisicoes += 1
+
+    def registrar_conexao(self, duracao: float):
+        with self._lock:
+            self.conexoes_novas += 1
+            self.handshake_segundos += duracao
+
+    @property
+    def conexoes_reutilizadas(self) -> int:
+        return max(0, self.requisicoes - self.conexoes_novas)
+
+    def como_dict(self) -> dict:
+        return {
+            'requisicoes': self.requisicoes,
+            'conexoes_novas': self.conexoes_novas,
+            'conexoes_reutilizadas': self.conexoes_reutilizadas,
+            'handshake_segundos': round(self.handshake_segundos, 3),
+        }
+
+
+def _classes_pool_medidas(metricas: MetricasConexao) -> dict:
+    """Classes de pool do urllib3 cujas conexões reportam o tempo de connect()."""
+
+    class _ConexaoHTTP(HTTPConnection):
+        def connect(self):
+            inicio = time.perf_counter()
+            super().connect()
+            metricas.registrar_conexao(time.perf_counter() - inicio)
+
+    class _ConexaoHTTPS(HTTPSConnection):
+        def connect(self):
+            inicio = time.perf_counter()
+            super().connect()
+            metricas.registrar_conexao(time.perf_counter() - inicio)
+
+    class _PoolHTTP(HTTPConnectionPool):
+        ConnectionCls = _ConexaoHTTP
+
+    class _PoolHTTPS(HTTPSConnectionPool):
+        ConnectionCls = _ConexaoHTTPS
+
+    return {'http': _PoolHTTP, 'https': _PoolHTTPS}
+
+
+class _AdaptadorMedido(HTTPAdapter):
+    """HTTPAdapter que alimenta MetricasConexao."""
+
+    def __init__(self, metricas: MetricasConexao, **kwargs):
+        self._metricas = metricas
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = _classes_pool_medidas(self._metricas)
+
+    def send(self, request, *args, **kwargs):
+        self._metricas.registrar_requisicao()
+        return super().send(request, *args, **kwargs)
+
+
+def criar_sessao(headers: dict, tamanho_pool: int, metricas: MetricasConexao) -> requests.Session:
+    """
+    Session com keep-alive, pool de `tamanho_pool` conexões por host e
+    gzip/deflate/brotli transparentes.
+    """
+    sessao = requests.Session()
+    adaptador = _AdaptadorMedido(metricas, pool_connections=tamanho_pool, pool_maxsize=tamanho_pool)
+    sessao.mount('https://', adaptador)
+    sessao.mount('http://', adaptador)
+
+    sessao.headers.update(headers)
+    sessao.headers['Accept-Encoding'] = make_headers(accept_encoding=True)['accept-encoding']
+    sessao.headers['Connection'] = 'keep-alive'
+    return sessao
@@ -0,0 +1,147 @@
+# scrapers/vaga.py
+"""
+Registro compacto de vaga — substitui o dict de 15 chaves de padronizar_vaga.
+
+Por que não dict?
+- Um dict por vaga carrega tabela hash + 15 ponteiros de chave; com
+  __slots__ os 15 campos viram posições fixas no objeto (~3x menos memória
+  por vaga em runs com dezenas de milhares de vagas em todas_as_vagas).
+- Campos de baixa cardinalidade (UF, modalidade, tipo de contrato, origem...)
+  são internados com sys.intern: milhares de vagas "SP"/"Remoto"/"CLT"
+  apontam para a mesma string.
+
+Compatibilidade: vaga['link'], vaga['id'], vaga.get('state') e dict(vaga)
+continuam funcionando (__getitem__/get/keys), então o runner e qualquer
+código que trate vagas como mapeamento não precisa mudar.
+
+Serialização: para_json() escreve direto o objeto JSON no formato
+Firebase/IVaga, sem montar um dict intermediário; para_dict() existe para
+APIs que exigem dict (ex: ref.update do SDK Firebase).
+
+Custo assumido: o SDK Firebase só aceita dict, então o payload {id: vaga}
+de um checkpoint monta um dict por vaga (~1,6 µs) que antes já existia —
+sozinho, o payload sai a ~0,8x do caminho com dicts (bench_vaga). Cada
+vaga é convertida uma única vez por run no modo delta (só o sufixo novo
+vai em cada checkpoint), e guardar o dict junto anularia a economia de
+memória. O checkpoint completo não regride: o escritor assíncrono
+reaproveita o tamanho medido pelo publicador em vez de serializar o lote
+de novo.
+"""
+import json
+import sys
+from json.encoder import encode_basestring
+from operator import attrgetter
+
+CAMPOS_VAGA = (
+    'id', 'titulo', 'empresa', 'modalidade', 'link', 'data_publicacao', 'origem',
+    'city', 'state', 'country', 'workplace_type', 'is_remote', 'tipo_contrato',
+    'prazo_inscricao', 'pcd',
+)
+_CAMPOS_SET = frozenset(CAMPOS_VAGA)
+_VALORES = attrgetter(*CAMPOS_VAGA)
+
+# Chave JSON já codificada de cada campo: '"titulo":'
+_CHAVES_JSON = tuple(encode_basestring(campo) + ':' for campo in CAMPOS_VAGA)
+
+
+def _internar(valor):
+    return sys.intern(valor) if type(valor) is str else valor
+
+
+def _valor_json(valor) -> str:
+    if type(valor) is str:
+        return encode_basestring(valor)
+    if valor is True:
+        return 'true'
+    if valor is False:
+        return 'false'
+    if valor is None:
+        return 'null'
+    return json.dumps(valor, ensure_ascii=False)
+
+
+class Vaga:
+    """Vaga padronizada (contrato IVaga do frontend) com __slots__."""
+
+    __slots__ = CAMPOS_VAGA
+
+    def __init__(self, id, titulo, empresa, modalidade, link, data_publicacao, origem,
+                 city, state, country, workplace_type, is_remote, tipo_contrato,
+                 prazo_inscricao, pcd):
+        self.id = id
+        self.titulo = titulo
+        self.empresa = empresa
+        self.modalidade = _internar(modalidade)
+        self.link = link
+        self.data_publicacao = data_publicacao
+        self.origem = _internar(origem)
+        self.city = _internar(city)
+        self.state = _internar(state)
+        self.country = _internar(country)
+        self.workplace_type = _internar(workplace_type)
+        self.is_remote = is_remote
+        self.tipo_contrato = _internar(tipo_contrato)
+        self.prazo_inscricao = prazo_inscricao
+        self.pcd = pcd
+
+    @classmethod
+    def de_dict(cls, dados: dict) -> 'Vaga':
+        """Reconstrói a partir do formato JSON/Firebase (campos ausentes → None)."""
+        return cls(*(dados.get(campo) for campo in CAMPOS_VAGA))
+
+    # --- Compatibilidade com o antigo dict ---------------------------------
+
+    def __getitem__(self, campo: str):
+        if campo not in _CAMPOS_SET:
+            raise KeyError(campo)
+        return getattr(self, campo)
+
+    def get(self, campo: str, default=None):
+        return getattr(self, campo) if campo in _CAMPOS_SET else default
+
+    def keys(self):
+        return CAMPOS_VAGA
+
+    def __iter__(self):
+        return iter(CAMPOS_VAGA)
+
+    def __len__(self):
+        return len(CAMPOS_VAGA)
+
+    def __contains__(self, campo) -> bool:
+        return campo in _CAMPOS_SET
+
+    def __eq__(self, outra) -> bool:
+        if isinstance(outra, Vaga):
+            return _VALORES(self) == _VALORES(outra)
+        if isinstance(outra, dict):
+            return self.para_dict() == outra
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"Vaga(id={self.id!r}, titulo={self.titulo!r}, origem={self.origem!r})"
+
+    # --- Serialização ------------------------------------------------------
+
+    def para_dict(self) -> dict:
+        return dict(zip(CAMPOS_VAGA, _VALORES(self)))
+
+    def para_json(self) -> str:
+        """JSON compacto (separadores sem espaço, UTF-8 sem escapes)."""
+        return '{' + ','.join(
+            chave + _valor_json(valor) for chave, valor in zip(_CHAVES_JSON, _VALORES(self))
+        ) + '}'
+
+
+def vaga_para_dict(vaga) -> dict:
+    """Vaga ou dict legado → dict no formato Firebase."""
+    return vaga.para_dict() if isinstance(vaga, Vaga) else vaga
+
+
+def vaga_para_json(vaga) -> str:
+    """Vaga ou dict legado → JSON compacto."""
+    if isinstance(vaga, Vaga):
+        return vaga.para_json()
+    return json.dumps(vaga, ensure_ascii=False, separators=(',', ':'))
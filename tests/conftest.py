@@ -0,0 +1,31 @@
+# tests/conftest.py
+"""Fixtures compartilhadas entre os testes do backend."""
+import pytest
+
+from scrapers.vaga import Vaga
+
+
+@pytest.fixture
+def nova_vaga():
+    """Fábrica de Vaga: só o id é obrigatório, o resto tem valores plausíveis."""
+    def criar(id_vaga: str, **campos) -> Vaga:
+        dados = {
+            'id': id_vaga,
+            'titulo': f'Desenvolvedor {id_vaga}',
+            'empresa': 'Órbita Ltda',
+            'modalidade': 'Remoto',
+            'link': f'https://exemplo.gupy.io/jobs/{id_vaga}',
+            'data_publicacao': '2026-10-01',
+            'origem': 'gupy',
+            'city': 'São Paulo',
+            'state': 'SP',
+            'country': 'Brasil',
+            'workplace_type': 'remote',
+            'is_remote': True,
+            'tipo_contrato': 'CLT',
+            'prazo_inscricao': None,
+            'pcd': False,
+        }
+        dados.update(campos)
+        return Vaga.de_dict(dados)
+    return criar
@@ -0,0 +1,89 @@
+# tests/unit/test_journal.py
+"""
+DiarioExecucao: um run interrompido retoma as combinações já concluídas,
+uma última linha cortada pelo crash é descartada e um diário finalizado
+não é retomado (só entra no histórico de yield).
+"""
+import time
+
+from pipeline import journal
+from pipeline.journal import DiarioExecucao
+
+ROTA = '/vagas/dev/gupy'
+
+
+def _abrir_depois(monkeypatch, diretorio, segundos: float) -> DiarioExecucao:
+    """abrir() com o relógio adiantado: o nome do diário novo tem resolução de segundos."""
+    agora = time.time() + segundos
+    monkeypatch.setattr(journal.time, 'time', lambda: agora)
+    return DiarioExecucao.abrir(str(diretorio), ROTA)
+
+
+def test_retoma_combinacoes_concluidas(tmp_path, nova_vaga):
+    diario = DiarioExecucao.abrir(str(tmp_path), ROTA)
+    react = [nova_vaga('a1'), nova_vaga('b2')]
+    diario.registrar('React', 'remoto', react, segundos=12.34)
+    diario.registrar('Python', 'remoto', [nova_vaga('b2'), nova_vaga('c3')])
+
+    retomado = DiarioExecucao.abrir(str(tmp_path), ROTA)
+    assert retomado.caminho == diario.caminho
+    assert retomado.total_combinacoes == 2
+    assert retomado.vagas_da_combinacao('React', 'remoto') == react
+    assert [vaga.id for vaga in retomado.vagas_da_combinacao('Python', 'remoto')] == ['b2', 'c3']
+    assert retomado.vagas_da_combinacao('Java', 'remoto') is None
+
+
+def test_vaga_compartilhada_gravada_uma_vez(tmp_path, nova_vaga):
+    diario = DiarioExecucao.abrir(str(tmp_path), ROTA)
+    diario.registrar('React', 'remoto', [nova_vaga('a1')])
+    diario.registrar('Node', 'remoto', [nova_vaga('a1')])
+    linhas_vaga = [linha for linha in diario.caminho.read_text(encoding='utf-8').splitlines() if linha.startswith('{"v":')]
+    assert len(linhas_vaga) == 1
+
+
+def test_combinacao_sem_vagas_e_refeita(tmp_path):
+    diario = DiarioExecucao.abrir(str(tmp_path), ROTA)
+    diario.registrar('Cobol', 'remoto', [])
+    assert DiarioExecucao.abrir(str(tmp_path), ROTA).vagas_da_combinacao('Cobol', 'remoto') is None
+
+
+def test_ultima_linha_parcial_descartada(tmp_path, nova_vaga):
+    diario = DiarioExecucao.abrir(str(tmp_path), ROTA)
+    diario.registrar('React', 'remoto', [nova_vaga('a1')])
+    tamanho_valido = diario.caminho.stat().st_size
+    with open(diario.caminho, 'a', encoding='utf-8') as arquivo:
+        arquivo.write('{"v":{"id":"b2","titulo":"Desenvol')
+
+    retomado = DiarioExecucao.abrir(str(tmp_path), ROTA)
+    assert retomado.total_combinacoes == 1
+    assert retomado.caminho.stat().st_size == tamanho_valido
+
+    retomado.registrar('Python', 'remoto', [nova_vaga('b2')])
+    assert DiarioExecucao.abrir(str(tmp_path), ROTA).total_combinacoes == 2
+
+
+def test_diario_finalizado_nao_e_retomado(tmp_path, monkeypatch, nova_vaga):
+    diario = DiarioExecucao.abrir(str(tmp_path), ROTA)
+    diario.registrar('React', 'remoto', [nova_vaga('a1')], segundos=3)
+    diario.finalizar()
+
+    novo = _abrir_depois(monkeypatch, tmp_path, 5)
+    assert novo.caminho != diario.caminho
+    assert novo.total_combinacoes == 0
+    assert DiarioExecucao.historico(str(tmp_path), ROTA) == [
+        {('React', 'remoto'): {'ids': ['a1'], 's': 3}},
+    ]
+
+
+def test_vagas_salvas_pega_a_versao_mais_recente(tmp_path, monkeypatch, nova_vaga):
+    antigo = DiarioExecucao.abrir(str(tmp_path), ROTA)
+    antigo.registrar('React', 'remoto', [nova_vaga('a1', titulo='Antiga'), nova_vaga('b2')])
+    antigo.finalizar()
+
+    recente = _abrir_depois(monkeypatch, tmp_path, 5)
+    recente.registrar('React', 'remoto', [nova_vaga('a1', titulo='Nova')])
+    recente.finalizar()
+
+    salvas = {vaga.id: vaga for vaga in DiarioExecucao.vagas_salvas(str(tmp_path), ROTA, {'a1', 'b2', 'z9'})}
+    assert set(salvas) == {'a1', 'b2'}
+    assert salvas['a1'].titulo == 'Nova'
@@ -0,0 +1,60 @@
+# tests/unit/test_mojibake.py
+"""
+consertar_mojibake (alternação compilada + fast path ASCII) deve produzir
+EXATAMENTE a mesma saída que a implementação anterior, de 19 buscas de
+substring (benchmarks.bench_mojibake.consertar_mojibake_anterior).
+"""
+import random
+
+import pytest
+
+from benchmarks.amostras import corromper, gerar_registros_brutos
+from benchmarks.bench_mojibake import consertar_mojibake_anterior
+from scrapers.base_scraper import _PADROES_MOJIBAKE, consertar_mojibake
+
+# Alfabeto enviesado para os caracteres que formam os padrões, com NUL e
+# caractere fora do latin-1 para exercitar as bordas do encode/decode
+_ALFABETO = list('abcdeçãéíóú ASCII-09') + list('Ã¡©­³º ª´¢§£µ‰“‚â€"™œ') + ['Ã', 'â€', '\x00', '🧡']
+
+
+def _texto_aleatorio(rng: random.Random) -> str:
+    texto = ''.join(rng.choice(_ALFABETO) for _ in range(rng.randint(0, 12)))
+    return corromper(texto) if rng.random() < 0.3 else texto
+
+
+@pytest.mark.parametrize('texto, esperado', [
+    ('EstÃ¡gio', 'Estágio'),
+    ('Jurídico', 'Jurídico'),
+    ('Desenvolvedor Java', 'Desenvolvedor Java'),
+    ('AnÃ¡lise\x00Ã©', 'Análise\x00é'),
+    ('a\x00AnÃ¡lise', 'a\x00Análise'),
+    ('SÃ£o Paulo 🧡', 'SÃ£o Paulo 🧡'),  # fora do latin-1: mantém
+    ('', ''),
+])
+def test_casos_conhecidos(texto, esperado):
+    assert consertar_mojibake(texto) == esperado
+
+
+@pytest.mark.parametrize('valor', [None, True, False, 42, 3.5])
+def test_nao_string_passa_direto(valor):
+    assert consertar_mojibake(valor) is valor
+
+
+@pytest.mark.parametrize('padrao', _PADROES_MOJIBAKE)
+def test_cada_padrao_igual_a_anterior(padrao):
+    for texto in (padrao, f"x{padrao}y", f"{padrao} {padrao}", corromper(f"ação {padrao}")):
+        assert consertar_mojibake(texto) == consertar_mojibake_anterior(texto)
+
+
+@pytest.mark.parametrize('semente', range(8))
+def test_strings_aleatorias_iguais_a_anterior(semente):
+    rng = random.Random(semente)
+    for _ in range(5_000):
+        texto = _texto_aleatorio(rng)
+        assert consertar_mojibake(texto) == consertar_mojibake_anterior(texto), repr(texto)
+
+
+def test_corpus_dos_dumps_igual_a_anterior():
+    for registro in gerar_registros_brutos(2_000):
+        for valor in registro.values():
+            assert consertar_mojibake(valor) == consertar_mojibake_anterior(valor), repr(valor)
@@ -0,0 +1,49 @@
+# tests/unit/test_mudancas.py
+"""calcular_mudancas: classificação de novas, alteradas e removidas contra o run completo anterior."""
+from pipeline.mudancas import calcular_mudancas, hash_vaga
+
+
+def _hashes(*vagas) -> dict:
+    return {vaga.id: hash_vaga(vaga) for vaga in vagas}
+
+
+def test_novas_alteradas_e_removidas(nova_vaga):
+    anteriores = _hashes(nova_vaga('a1'), nova_vaga('b2'), nova_vaga('c3'))
+    vagas = [nova_vaga('a1'), nova_vaga('b2', titulo='Desenvolvedora Sênior'), nova_vaga('d4')]
+
+    mudancas = calcular_mudancas(vagas, set(), anteriores)
+
+    assert mudancas['novas'] == ['d4']
+    assert mudancas['alteradas'] == ['b2']
+    assert mudancas['removidas'] == ['c3']
+    assert mudancas['hashes'] == _hashes(*vagas)
+
+
+def test_hash_ignora_o_tipo_do_registro(nova_vaga):
+    vaga = nova_vaga('a1')
+    assert hash_vaga(vaga) == hash_vaga(vaga.para_dict())
+    assert hash_vaga(vaga) != hash_vaga(nova_vaga('a1', pcd=True))
+
+
+def test_preservadas_nao_saem_e_mantem_o_hash(nova_vaga):
+    anteriores = _hashes(nova_vaga('a1'), nova_vaga('b2'), nova_vaga('c3'))
+
+    mudancas = calcular_mudancas([nova_vaga('a1')], set(), anteriores, preservados={'b2', 'x0'})
+
+    assert mudancas['removidas'] == ['c3']
+    assert mudancas['hashes'] == {'a1': anteriores['a1'], 'b2': anteriores['b2']}
+
+
+def test_sem_indice_a_base_e_a_rota(nova_vaga):
+    mudancas = calcular_mudancas([nova_vaga('a1'), nova_vaga('b2')], {'a1', 'z9'}, None)
+
+    assert mudancas['novas'] == ['b2']
+    assert mudancas['alteradas'] == []
+    assert mudancas['removidas'] == ['z9']
+
+
+def test_indice_vazio_tudo_novo(nova_vaga):
+    mudancas = calcular_mudancas([nova_vaga('a1')], {'a1'}, {})
+
+    assert mudancas['novas'] == ['a1']
+    assert mudancas['removidas'] == []
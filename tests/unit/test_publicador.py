@@ -0,0 +1,89 @@
+# tests/unit/test_publicador.py
+"""
+PublicadorFirebase no modo delta, sobre o emulador em memória: checkpoints
+enviam só o sufixo novo e o passe final remove os IDs que sumiram, menos
+os preservados pelo planejador.
+"""
+import logging
+
+from pipeline.escritor import EscritorAssincrono
+from pipeline.sinks import SinkArquivoJSON
+from scraper_runner import PublicadorFirebase
+
+ROTA = '/vagas/dev/gupy'
+
+
+def _sink_com(nova_vaga, *ids) -> SinkArquivoJSON:
+    sink = SinkArquivoJSON()
+    sink.set(ROTA, {id_vaga: nova_vaga(id_vaga).para_dict() for id_vaga in ids})
+    return sink
+
+
+def test_checkpoints_enviam_so_o_sufixo(nova_vaga):
+    sink = SinkArquivoJSON()
+    publicador = PublicadorFirebase(ROTA, set(), modo='delta', sink=sink)
+    vagas = [nova_vaga('a1'), nova_vaga('b2')]
+    publicador.publicar(vagas)
+    vagas.append(nova_vaga('c3'))
+    publicador.publicar(vagas)
+    publicador.publicar(vagas)
+
+    assert publicador.total_vagas_enviadas == 3
+    assert publicador.pendentes(vagas) == 0
+    assert sink.ids(ROTA) == {'a1', 'b2', 'c3'}
+
+
+def test_passe_final_remove_os_que_sumiram(nova_vaga):
+    sink = _sink_com(nova_vaga, 'a1', 'b2', 'c3')
+    publicador = PublicadorFirebase(ROTA, sink.ids(ROTA), modo='delta', sink=sink)
+    publicador.finalizar([nova_vaga('a1'), nova_vaga('d4')])
+
+    assert sink.ids(ROTA) == {'a1', 'd4'}
+
+
+def test_passe_final_mantem_os_preservados(nova_vaga):
+    sink = _sink_com(nova_vaga, 'a1', 'b2', 'c3')
+    publicador = PublicadorFirebase(ROTA, sink.ids(ROTA), modo='delta', sink=sink, ids_preservados={'c3', 'x0'})
+    publicador.finalizar([nova_vaga('a1')])
+
+    assert sink.ids(ROTA) == {'a1', 'c3'}
+    assert sink.obter(ROTA)['c3'] == nova_vaga('c3').para_dict()
+
+
+def test_ids_desconhecidos_substituem_a_rota_com_as_preservadas(nova_vaga):
+    sink = _sink_com(nova_vaga, 'a1', 'b2', 'c3')
+    publicador = PublicadorFirebase(
+        ROTA, None, modo='delta', sink=sink,
+        ids_preservados={'b2', 'c3'}, vagas_preservadas=[nova_vaga('b2')],
+    )
+    publicador.finalizar([nova_vaga('a1')])
+
+    # c3 não tem cópia no diário: sem base para o delta, sai junto com a rota
+    assert sink.ids(ROTA) == {'a1', 'b2'}
+
+
+def test_modo_snapshot_espelha_o_run(nova_vaga):
+    sink = _sink_com(nova_vaga, 'a1', 'b2')
+    publicador = PublicadorFirebase(ROTA, sink.ids(ROTA), modo='snapshot', sink=sink)
+    publicador.finalizar([nova_vaga('b2'), nova_vaga('c3')])
+
+    assert sink.ids(ROTA) == {'b2', 'c3'}
+
+
+class _SinkForaDoAr(SinkArquivoJSON):
+    def update(self, rota, payload):
+        raise ConnectionError('sem rede')
+
+
+def test_falha_do_escritor_logada_uma_vez(nova_vaga, caplog):
+    sink = _SinkForaDoAr()
+    escritor = EscritorAssincrono(sink, tentativas=1, backoff_inicial=0)
+    publicador = PublicadorFirebase(ROTA, set(), modo='delta', sink=sink, escritor=escritor)
+
+    with caplog.at_level(logging.ERROR):
+        publicador.finalizar([nova_vaga('a1')])
+        publicador.fechar()  # o finally do runner fecha de novo
+
+    assert escritor.chaves_perdidas == 1
+    assert sum('chaves não gravadas' in registro.getMessage() and ROTA in registro.getMessage()
+               for registro in caplog.records) == 1
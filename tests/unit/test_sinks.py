@@ -0,0 +1,83 @@
+# tests/unit/test_sinks.py
+"""
+SinkArquivoJSON e SinkSQLite: o que é gravado volta igual depois de
+reabrir o arquivo, com a semântica de set/update do Realtime Database.
+"""
+import pytest
+
+from pipeline.sinks import SinkArquivoJSON, SinkSQLite
+
+ROTA = '/vagas/dev/gupy'
+
+
+@pytest.fixture(params=['json', 'sqlite'])
+def abrir_sink(request, tmp_path):
+    """Abre (ou reabre) um sink do tipo parametrizado sobre o mesmo arquivo."""
+    abertos = []
+
+    def abrir():
+        if request.param == 'json':
+            sink = SinkArquivoJSON(str(tmp_path / 'firebase_local.json'))
+        else:
+            sink = SinkSQLite(str(tmp_path / 'vagas_local.db'))
+        abertos.append(sink)
+        return sink
+
+    yield abrir
+    for sink in abertos:
+        sink.fechar()
+
+
+def test_set_sobrevive_a_reabertura(abrir_sink, nova_vaga):
+    vagas = {id_vaga: nova_vaga(id_vaga).para_dict() for id_vaga in ('a1', 'b2', 'c3')}
+    sink = abrir_sink()
+    sink.set(ROTA, vagas)
+    sink.fechar()
+
+    reaberto = abrir_sink()
+    assert reaberto.obter(ROTA) == vagas
+    assert reaberto.ids(ROTA) == {'a1', 'b2', 'c3'}
+
+
+def test_set_substitui_a_rota_inteira(abrir_sink, nova_vaga):
+    sink = abrir_sink()
+    sink.set(ROTA, {'a1': nova_vaga('a1').para_dict()})
+    sink.set(ROTA, {'b2': nova_vaga('b2').para_dict()})
+    assert sink.ids(ROTA) == {'b2'}
+
+
+def test_update_insere_altera_e_remove(abrir_sink, nova_vaga):
+    sink = abrir_sink()
+    sink.set(ROTA, {id_vaga: nova_vaga(id_vaga).para_dict() for id_vaga in ('a1', 'b2')})
+    alterada = nova_vaga('b2', titulo='Desenvolvedora Sênior').para_dict()
+    sink.update(ROTA, {'a1': None, 'b2': alterada, 'c3': nova_vaga('c3').para_dict()})
+    sink.fechar()
+
+    reaberto = abrir_sink()
+    assert reaberto.ids(ROTA) == {'b2', 'c3'}
+    assert reaberto.obter(ROTA)['b2'] == alterada
+
+
+def test_update_por_subcaminho(abrir_sink, nova_vaga):
+    sink = abrir_sink()
+    sink.set(ROTA, {'a1': nova_vaga('a1').para_dict()})
+    sink.update(ROTA, {'a1/titulo': 'Analista', 'a1/prazo_inscricao': None})
+
+    vaga = sink.obter(ROTA)['a1']
+    assert vaga['titulo'] == 'Analista'
+    assert 'prazo_inscricao' not in vaga
+    assert vaga['empresa'] == 'Órbita Ltda'
+
+
+def test_rota_inexistente(abrir_sink):
+    sink = abrir_sink()
+    assert sink.obter(ROTA) is None
+    assert sink.ids(ROTA) == set()
+
+
+def test_remover_tudo_esvazia_a_rota(abrir_sink, nova_vaga):
+    sink = abrir_sink()
+    sink.set(ROTA, {'a1': nova_vaga('a1').para_dict()})
+    sink.update(ROTA, {'a1': None})
+    assert sink.obter(ROTA) is None
+    assert sink.ids(ROTA) == set()